@@ -9,8 +9,56 @@ __date__ = "17/06/2023"
 SCREEN_COLOUR = (18, 20, 28)
 WHITE_TOKEN_COLOUR = (96, 179, 89)
 BLACK_TOKEN_COLOUR = (100, 144, 197)
-FPS = 60
+FPS = 60  # most frames drawn a second, 0 for no limit
+UPDATE_RATE = 60  # game updates a second, however many frames are drawn
+MAX_UPDATES_PER_FRAME = (
+    10  # most updates caught up on after a slow frame, time past that is skipped
+)
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
 
 BOARD_TOKEN_RADIUS = 20
+ASSET_CACHE_SIZE = 64  # most images and fonts kept loaded by the asset cache
+IDLE_RENDERING = True  # wait for events instead of drawing every frame while nothing on the screen changes by itself
+IDLE_TIMEOUT = (
+    1000  # milliseconds to wait for an event while idle before drawing a frame anyway
+)
+DIRTY_RECT_UPDATES = True  # copy only the changed areas of the screen to the window, False to flip the whole screen every frame
+
+# CONSTANTS for the rules of the game
+PIECES_PER_PLAYER = 9
+FLYING_PIECE_COUNT = 3  # players with this many pieces or fewer on the board can fly
+LOSING_PIECE_COUNT = 2  # players with this many pieces or fewer on the board lose
+
+# CONSTANTS for the computer player
+AI_TIME_BUDGET = 1.0  # seconds the computer may think per move
+AI_TRANSPOSITION_TABLE_MB = 16  # memory cap of the computer's transposition table
+TABLEBASE_DIRECTORY = "./assets/tablebase"  # endgame tablebase shard files
+TABLEBASE_MAX_PIECES = (
+    7  # most pieces on the board, both players together, the generator solves
+)
+OPENING_BOOK_PATH = "./assets/opening_book.bin"  # placement phase opening book file
+OPENING_BOOK_MAX_PLIES = 8  # plies from the start of the game the book builder searches
+OPENING_BOOK_FULL_WIDTH_PLIES = (
+    2  # plies from the start of the game the book builder follows every move for
+)
+AI_STRATEGY = (
+    "alpha_beta"  # search the computer plays with, "alpha_beta" or "monte_carlo"
+)
+AI_MONTE_CARLO_MAX_NODES = 200_000  # memory cap of the Monte Carlo search tree in nodes
+AI_WORKER_COUNT = 1  # processes the computer searches with, more than 1 shares the root moves between them
+
+# CONSTANTS for headless self-play
+SELF_PLAY_TIME_BUDGET = 0.1  # seconds the search strategies may think per move
+SELF_PLAY_MAX_PLIES = 400  # plies a game may last before it counts as a draw
+
+# CONSTANTS for benchmarks
+BENCHMARK_ROUNDS = 5  # rounds each benchmark is timed for
+BENCHMARK_ROUND_TIME = 0.1  # seconds a round of a benchmark takes at least
+BENCHMARK_REGRESSION_THRESHOLD = (
+    0.2  # fraction slower than the baseline that counts as a regression
+)
+BENCHMARK_SEARCH_DEPTH = (
+    5  # plies the computer searches in benchmarks so the work is fixed
+)
+BENCHMARK_SEED = 0  # seed of the random games the benchmark positions come from
@@ -4,6 +4,7 @@ from action_handlers.action_handler import ActionHandler
 from actions.move_type import MoveType
 from players.computer import Computer
 from board_model.position import Position
+from engine.bitboard import iter_indexes
 
 __author__ = "Snekith, Patrick and Ashwin"
 __date__ = "17/06/2023"
@@ -21,7 +22,7 @@ class FlyActionHandler(ActionHandler):
             self._action_controller._game_manager.get_current_player().create_move_action(
                 self._action_controller._current_selected_position, destination
             )
-            self._action_controller._game_manager.toggle_move()
+            self._action_controller._game_manager.update_current_player()
             return True
 
         elif (
@@ -42,10 +43,16 @@ class FlyActionHandler(ActionHandler):
         """
         if self._action_controller._current_selected_position is None:
             return []
-        return [
-            position.get_index()
-            for position in self._action_controller._game_manager._board.get_empty_positions()
-        ]
+        game_state = (
+            self._action_controller.get_game_manager().get_board().get_game_state()
+        )
+        return list(
+            iter_indexes(
+                game_state.get_destination_mask(
+                    self._action_controller._current_selected_position.get_index()
+                )
+            )
+        )
 
     def get_move_type(self) -> Literal[MoveType.FLY]:
         """
@@ -64,4 +71,4 @@ class FlyActionHandler(ActionHandler):
             computer (Computer): Computer's turn
         """
         computer.create_fly_action()
-        self._action_controller._game_manager.toggle_move()
+        self._action_controller._game_manager.update_current_player()
@@ -3,6 +3,7 @@ from typing import List, Literal
 from action_handlers.action_handler import ActionHandler
 from actions.move_type import MoveType
 from board_model.position import Position
+from engine.bitboard import iter_indexes
 from players.computer import Computer
 
 __author__ = "Snekith, Patrick and Ashwin"
@@ -21,7 +22,7 @@ class MoveActionHandler(ActionHandler):
             self._action_controller._game_manager.get_current_player().create_move_action(
                 self._action_controller._current_selected_position, destination
             )
-            self._action_controller._game_manager.toggle_move()
+            self._action_controller._game_manager.update_current_player()
             return True
 
         elif (
@@ -43,21 +44,16 @@ class MoveActionHandler(ActionHandler):
         if self._action_controller._current_selected_position is None:
             return []
 
-        available_moves: List[int] = []
-        adjacent_pieces: List[
-            int
-        ] = (
-            self._action_controller._current_selected_position.get_adjacent_piece_indexes()
+        game_state = (
+            self._action_controller.get_game_manager().get_board().get_game_state()
         )
-        for position_index in adjacent_pieces:
-            position: Position = (
-                self._action_controller._game_manager._board.get_position_by_index(
-                    position_index
+        return list(
+            iter_indexes(
+                game_state.get_destination_mask(
+                    self._action_controller._current_selected_position.get_index()
                 )
             )
-            if not position.is_occupied():
-                available_moves.append(position_index)
-        return available_moves
+        )
 
     def get_move_type(self) -> Literal[MoveType.MOVE]:
         """
@@ -76,4 +72,4 @@ class MoveActionHandler(ActionHandler):
             computer (Computer): Computer's turn
         """
         computer.create_move_action()
-        self._action_controller._game_manager.toggle_move()
+        self._action_controller._game_manager.update_current_player()
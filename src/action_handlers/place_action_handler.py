@@ -3,6 +3,7 @@ from typing import List, Literal
 from action_handlers.action_handler import ActionHandler
 from actions.move_type import MoveType
 from board_model.position import Position
+from engine.bitboard import iter_indexes
 from players.computer import Computer
 
 __author__ = "Snekith, Patrick and Ashwin"
@@ -24,7 +25,7 @@ class PlaceActionHandler(ActionHandler):
             self._action_controller._game_manager.get_current_player().create_place_action(
                 destination
             )
-            self._action_controller._game_manager.toggle_move()
+            self._action_controller._game_manager.update_current_player()
             return True
         return False
 
@@ -35,12 +36,10 @@ class PlaceActionHandler(ActionHandler):
         Returns:
             List[int]: List of available moves
         """
-        available_moves: List[int] = []
-        for (
-            position
-        ) in self._action_controller._game_manager._board.get_empty_positions():
-            available_moves.append(position.get_index())
-        return available_moves
+        game_state = (
+            self._action_controller.get_game_manager().get_board().get_game_state()
+        )
+        return list(iter_indexes(game_state.get_placeable_mask()))
 
     def get_move_type(self) -> Literal[MoveType.PLACE]:
         """
@@ -59,4 +58,4 @@ class PlaceActionHandler(ActionHandler):
             computer (Computer): Computer's turn
         """
         computer.create_place_action()
-        self._action_controller._game_manager.toggle_move()
+        self._action_controller._game_manager.update_current_player()
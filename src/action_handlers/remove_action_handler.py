@@ -3,6 +3,7 @@ from typing import List, Literal
 from action_handlers.action_handler import ActionHandler
 from actions.move_type import MoveType
 from board_model.position import Position
+from engine.bitboard import iter_indexes
 from players.computer import Computer
 
 __author__ = "Snekith, Patrick and Ashwin"
@@ -24,7 +25,7 @@ class RemoveActionHandler(ActionHandler):
             self._action_controller._game_manager.get_current_player().create_remove_action(
                 position
             )
-            self._action_controller._game_manager.toggle_move()
+            self._action_controller._game_manager.update_current_player()
             return True
         return False
 
@@ -36,37 +37,11 @@ class RemoveActionHandler(ActionHandler):
             List[int]: List of available moves
         """
 
-        available_moves: List[int] = []
-        mills = (
-            self._action_controller.get_game_manager()
-            .get_board()
-            .get_mill_manager()
-            .get_mills()
+        # pieces in mills can only be removed if there are no other pieces to remove
+        game_state = (
+            self._action_controller.get_game_manager().get_board().get_game_state()
         )
-        flattened_mills = [mill_index for mill in mills for mill_index in mill]
-        for (
-            position
-        ) in self._action_controller.get_game_manager()._board.get_occupied_positions():
-            if not self._action_controller._game_manager.is_current_players_piece(
-                position
-            ):
-                if position.get_index() not in flattened_mills:
-                    available_moves.append(position.get_index())
-
-        if (
-            len(available_moves) != 0
-        ):  # if there are no available moves then you can take from a mill
-            return available_moves
-        else:
-            return [
-                position.get_index()
-                for position in self._action_controller.get_game_manager()
-                .get_board()
-                .get_occupied_positions()
-                if not self._action_controller.get_game_manager().is_current_players_piece(
-                    position
-                )
-            ]
+        return list(iter_indexes(game_state.get_removable_mask()))
 
     def get_move_type(self) -> Literal[MoveType.REMOVE]:
         """
@@ -85,4 +60,4 @@ class RemoveActionHandler(ActionHandler):
             computer (Computer): Computer's turn
         """
         computer.create_remove_action()
-        self._action_controller._game_manager.toggle_move()
+        self._action_controller._game_manager.update_current_player()
@@ -90,17 +90,19 @@ class ActionController:
         Updating the move type
         """
         self._current_selected_position = None
-
-        if (
-            # checks if the player's pieces are less than 3, if so, give them the ability to fly
-            self._game_manager.get_current_player().get_pieces_on_board() <= 3
-            and self._game_manager.get_board().is_pieces_placed()
-        ):
+        move_type: MoveType = (
+            self._game_manager.get_board().get_game_state().get_move_type()
+        )
+
+        if move_type == MoveType.REMOVE:
+            # the player formed a mill, so they have to remove a piece before the turn passes
+            self.initiate_remove()
+        elif move_type == MoveType.FLY:
+            # the player has 3 or fewer pieces left on the board, so they can fly
             self._current_action_handler = FlyActionHandler(self)
-            # if the player has more than 3 pieces on the board, they can do a normal move
-        elif self._game_manager.get_board().is_pieces_placed():
+        elif move_type == MoveType.MOVE:
+            # the player has placed all their pieces and has more than 3 on the board
             self._current_action_handler = MoveActionHandler(self)
-
         else:
             # if the player has not placed all their pieces, they can only place
             self._current_action_handler = PlaceActionHandler(self)
@@ -129,7 +131,6 @@ class ActionController:
         """
         Initiating a remove action
         """
-        self._game_manager.toggle_move()
         self._current_action_handler = RemoveActionHandler(self)
 
     def reset(self) -> None:
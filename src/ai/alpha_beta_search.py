@@ -0,0 +1,449 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, List, Tuple
+
+import CONSTANTS
+from ai.evaluation import WIN_SCORE, Evaluator
+from ai.opening_book import BookEntry, OpeningBook
+from ai.strategy import Strategy
+from ai.tablebase import Outcome, Tablebase, TablebaseResult
+from ai.transposition_table import Bound, TableEntry, TranspositionTable
+from engine.move_generator import generate_moves
+
+if TYPE_CHECKING:
+    from engine.game_state import GameState
+    from engine.move import Move
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+# Deepest search allowed, also the number of plies a win score can be shortened by
+MAX_PLY = 64
+
+# Number of nodes searched between checks of the deadline
+NODES_PER_TIME_CHECK = 1024
+
+
+def score_to_table(score: int, ply: int) -> int:
+    """
+    Converts a score to be stored in a table. Win scores count plies from the root, stored ones count from the position
+
+    Args:
+        score (int): Score from the search
+        ply (int): Distance of the position from the root
+
+    Returns:
+        int: Score to store
+    """
+    if score >= WIN_SCORE - MAX_PLY:
+        return score + ply
+    if score <= -WIN_SCORE + MAX_PLY:
+        return score - ply
+    return score
+
+
+def score_from_table(score: int, ply: int) -> int:
+    """
+    Converts a score read from a table back to count plies from the root
+
+    Args:
+        score (int): Stored score
+        ply (int): Distance of the position from the root
+
+    Returns:
+        int: Score for the search
+    """
+    if score >= WIN_SCORE - MAX_PLY:
+        return score - ply
+    if score <= -WIN_SCORE + MAX_PLY:
+        return score + ply
+    return score
+
+
+def score_tablebase_result(result: TablebaseResult, ply: int) -> int:
+    """
+    Converts a tablebase result to a search score, won positions closer to the end score higher
+
+    Args:
+        result (TablebaseResult): Result for the side to move
+        ply (int): Distance of the position from the root
+
+    Returns:
+        int: Score for the search
+    """
+    if result.outcome == Outcome.DRAW:
+        return 0
+    return result.outcome * (WIN_SCORE - ply - result.distance)
+
+
+class SearchTimeout(Exception):
+    """
+    Raised inside the search when the time budget runs out
+    """
+
+
+class AlphaBetaSearch(Strategy):
+    def __init__(
+        self,
+        time_budget: float = CONSTANTS.AI_TIME_BUDGET,
+        max_depth: int = MAX_PLY,
+        transposition_table: TranspositionTable | None = None,
+        tablebase: Tablebase | None = None,
+        opening_book: OpeningBook | None = None,
+    ) -> None:
+        """
+        Initialises negamax alpha-beta search with iterative deepening. A mill and the removal that follows are searched as one move
+
+        Args:
+            time_budget (float, optional): Seconds allowed per move. Defaults to CONSTANTS.AI_TIME_BUDGET.
+            max_depth (int, optional): Deepest iteration to search. Defaults to MAX_PLY.
+            transposition_table (TranspositionTable | None, optional): Table to remember searched positions in, kept between moves. Defaults to None for no table.
+            tablebase (Tablebase | None, optional): Endgame tablebase giving exact results once every piece is placed. Defaults to None for no tablebase.
+            opening_book (OpeningBook | None, optional): Opening book played instead of searching in the placement phase. Defaults to None for no book.
+        """
+        self._time_budget: float = time_budget
+        self._max_depth: int = min(max_depth, MAX_PLY)
+        self._transposition_table: TranspositionTable | None = transposition_table
+        self._tablebase: Tablebase | None = tablebase
+        self._opening_book: OpeningBook | None = opening_book
+        self._evaluator: Evaluator = Evaluator()
+        self._deadline: float = 0
+        self._node_count: int = 0
+        self._completed_depth: int = 0
+        self._best_score: int = 0
+        self._iterations: List[Tuple[Move, int]] = []
+        self._is_timed_out: bool = False
+        self._is_stopped: bool = False
+
+    def choose_move(self, game_state: GameState) -> Move:
+        """
+        Chooses the best move of the deepest completed iteration
+
+        Args:
+            game_state (GameState): Game state to choose a move in
+
+        Returns:
+            Move: Best move found
+        """
+        return self.search(game_state)[0]
+
+    def search(
+        self,
+        game_state: GameState,
+        root_moves: List[Move] | None = None,
+        deadline: float | None = None,
+    ) -> Tuple[Move, int]:
+        """
+        Searches deeper and deeper until the time budget runs out or a forced result is found
+
+        Args:
+            game_state (GameState): Game state to search, it is left unchanged
+            root_moves (List[Move] | None, optional): Moves to search at the root, such as a share of the moves given to one of several workers. Defaults to None for every legal move.
+            deadline (float | None, optional): time.monotonic() to stop searching at, which every process on the machine shares. Defaults to None for the time budget from now.
+
+        Raises:
+            Exception: No available moves
+
+        Returns:
+            Tuple[Move, int]: Best move and its score from the point of view of the side to move
+        """
+        self._deadline = (
+            time.monotonic() + self._time_budget if deadline is None else deadline
+        )
+        self._node_count = 0
+        self._completed_depth = 0
+        self._iterations = []
+        self._is_timed_out = False
+        # search a copy, a timeout leaves moves made on it
+        game_state = game_state.copy()
+        self._evaluator.reset(game_state)
+
+        moves: List[Move] = self._order_moves(
+            generate_moves(game_state) if root_moves is None else list(root_moves)
+        )
+        if not moves:
+            raise Exception("No available moves. Game should already be over")
+
+        best_move: Move = moves[0]
+        self._best_score = 0
+        if len(moves) == 1 and root_moves is None:
+            return best_move, self._best_score
+
+        if self._opening_book is not None and root_moves is None:
+            book_entry: BookEntry | None = self._opening_book.get_best_entry(
+                game_state, moves
+            )
+            if book_entry is not None:
+                self._best_score = book_entry.score
+                self._iterations.append((book_entry.move, self._best_score))
+                return book_entry.move, self._best_score
+
+        if self._tablebase is not None and root_moves is None:
+            tablebase_move = self._tablebase.get_best_move(game_state)
+            if tablebase_move is not None:
+                best_move, result = tablebase_move
+                self._best_score = score_tablebase_result(result, 0)
+                self._iterations.append((best_move, self._best_score))
+                return best_move, self._best_score
+
+        for depth in range(1, self._max_depth + 1):
+            if self._is_stopped:
+                self._is_timed_out = True
+                break
+            try:
+                best_move, self._best_score = self._search_root(
+                    game_state, moves, depth
+                )
+            except SearchTimeout:
+                self._is_timed_out = True
+                break
+
+            self._completed_depth = depth
+            self._iterations.append((best_move, self._best_score))
+            # search the best move first in the next iteration
+            moves.remove(best_move)
+            moves.insert(0, best_move)
+
+            if abs(self._best_score) >= WIN_SCORE - MAX_PLY:
+                break
+
+        return best_move, self._best_score
+
+    def get_node_count(self) -> int:
+        """
+        Gets the number of nodes searched by the last search
+
+        Returns:
+            int: Number of nodes
+        """
+        return self._node_count
+
+    def get_completed_depth(self) -> int:
+        """
+        Gets the depth of the last completed iteration of the last search
+
+        Returns:
+            int: Depth in plies
+        """
+        return self._completed_depth
+
+    def get_iterations(self) -> List[Tuple[Move, int]]:
+        """
+        Gets the best move and score of each completed iteration of the last search
+
+        Returns:
+            List[Tuple[Move, int]]: Best move and score, indexed by depth - 1
+        """
+        return self._iterations
+
+    def is_timed_out(self) -> bool:
+        """
+        Checks if the last search was stopped by the time budget rather than finishing
+
+        Returns:
+            bool: True if the time budget ran out
+        """
+        return self._is_timed_out
+
+    def set_time_budget(self, time_budget: float) -> None:
+        """
+        Sets the time allowed per move
+
+        Args:
+            time_budget (float): Seconds allowed per move
+        """
+        self._time_budget = time_budget
+
+    def set_is_stopped(self, is_stopped: bool) -> None:
+        """
+        Stops searches running on another thread, which return the best move of the deepest completed iteration as if the time budget ran out, until set back to False
+
+        Args:
+            is_stopped (bool): True to stop searching
+        """
+        self._is_stopped = is_stopped
+
+    def get_tablebase(self) -> Tablebase | None:
+        """
+        Gets the endgame tablebase
+
+        Returns:
+            Tablebase | None: Tablebase, None if the search has none
+        """
+        return self._tablebase
+
+    def get_opening_book(self) -> OpeningBook | None:
+        """
+        Gets the opening book
+
+        Returns:
+            OpeningBook | None: Opening book, None if there is no book
+        """
+        return self._opening_book
+
+    def get_transposition_table(self) -> TranspositionTable | None:
+        """
+        Gets the transposition table
+
+        Returns:
+            TranspositionTable | None: Transposition table, None if the search has none
+        """
+        return self._transposition_table
+
+    def _search_root(
+        self, game_state: GameState, moves: List[Move], depth: int
+    ) -> Tuple[Move, int]:
+        """
+        Searches every root move to a fixed depth
+
+        Args:
+            game_state (GameState): Game state to search
+            moves (List[Move]): Root moves, best first
+            depth (int): Depth to search to
+
+        Returns:
+            Tuple[Move, int]: Best move and its score
+        """
+        alpha: int = -WIN_SCORE - 1
+        best_move: Move = moves[0]
+
+        for move in moves:
+            self._make_move(game_state, move)
+            score: int = -self._negamax(
+                game_state, depth - 1, -WIN_SCORE - 1, -alpha, 1
+            )
+            self._unmake_move(game_state)
+
+            if score > alpha:
+                alpha = score
+                best_move = move
+
+        return best_move, alpha
+
+    def _negamax(
+        self, game_state: GameState, depth: int, alpha: int, beta: int, ply: int
+    ) -> int:
+        """
+        Negamax alpha-beta search
+
+        Args:
+            game_state (GameState): Game state to search
+            depth (int): Remaining depth
+            alpha (int): Lower bound of the score
+            beta (int): Upper bound of the score
+            ply (int): Distance from the root
+
+        Raises:
+            SearchTimeout: The time budget ran out
+
+        Returns:
+            int: Score from the point of view of the side to move
+        """
+        self._node_count += 1
+        if self._node_count % NODES_PER_TIME_CHECK == 0 and (
+            self._is_stopped or time.monotonic() >= self._deadline
+        ):
+            raise SearchTimeout
+
+        winner: bool | None = game_state.get_winner()
+        if winner is not None:
+            score: int = WIN_SCORE - ply
+            return score if winner == game_state.get_is_green_to_move() else -score
+
+        if self._tablebase is not None:
+            result: TablebaseResult | None = self._tablebase.probe(game_state)
+            if result is not None:
+                return score_tablebase_result(result, ply)
+
+        if depth <= 0:
+            return self._evaluator.evaluate(game_state)
+
+        original_alpha: int = alpha
+        table_move: Move | None = None
+        if self._transposition_table is not None:
+            entry: TableEntry | None = self._transposition_table.probe(
+                game_state.get_hash()
+            )
+            if entry is not None:
+                table_move = entry.best_move
+                if entry.depth >= depth:
+                    score = score_from_table(entry.score, ply)
+                    if (
+                        entry.bound == Bound.EXACT
+                        or (entry.bound == Bound.LOWER and score >= beta)
+                        or (entry.bound == Bound.UPPER and score <= alpha)
+                    ):
+                        return score
+
+        best_score: int = -WIN_SCORE - 1
+        best_move: Move | None = None
+        for move in self._order_moves(generate_moves(game_state), table_move):
+            self._make_move(game_state, move)
+            score = -self._negamax(game_state, depth - 1, -beta, -alpha, ply + 1)
+            self._unmake_move(game_state)
+
+            if score > best_score:
+                best_score = score
+                best_move = move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if self._transposition_table is not None:
+            if best_score <= original_alpha:
+                bound = Bound.UPPER
+            elif best_score >= beta:
+                bound = Bound.LOWER
+            else:
+                bound = Bound.EXACT
+            self._transposition_table.store(
+                game_state.get_hash(),
+                depth,
+                score_to_table(best_score, ply),
+                bound,
+                best_move,
+            )
+
+        return best_score
+
+    def _make_move(self, game_state: GameState, move: Move) -> None:
+        """
+        Makes a move on the game state and the evaluator
+
+        Args:
+            game_state (GameState): Game state to make the move on
+            move (Move): Move to make
+        """
+        self._evaluator.make_move(game_state, move)
+        game_state.make_move(move)
+
+    def _unmake_move(self, game_state: GameState) -> None:
+        """
+        Unmakes the last move on the game state and the evaluator
+
+        Args:
+            game_state (GameState): Game state to unmake the move on
+        """
+        game_state.unmake_move()
+        self._evaluator.unmake_move()
+
+    def _order_moves(
+        self, moves: List[Move], first_move: Move | None = None
+    ) -> List[Move]:
+        """
+        Orders moves so that a known best move is searched first, then moves forming a mill
+
+        Args:
+            moves (List[Move]): Moves to order
+            first_move (Move | None, optional): Move to search first. Defaults to None.
+
+        Returns:
+            List[Move]: Ordered moves
+        """
+        moves.sort(key=lambda move: move.remove is None)
+        if first_move is not None and first_move in moves:
+            moves.remove(first_move)
+            moves.insert(0, first_move)
+        return moves
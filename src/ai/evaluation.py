@@ -0,0 +1,374 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+import CONSTANTS
+from actions.move_type import MoveType
+from engine.bitboard import iter_indexes
+from engine.board_layout import ADJACENT_INDEXES, BOARD_SIZE, MILL_LINES
+
+if TYPE_CHECKING:
+    from engine.game_state import GameState
+    from engine.move import Move
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+# Score of a won position, wins found sooner score higher
+WIN_SCORE = 1_000_000
+
+# Features counted for each player, a count is stored at feature * 2 + is_green
+PIECES = 0  # pieces on the board
+MILLS = 1  # closed mills
+TWO_PIECES = 2  # lines with two own pieces and an empty point
+BLOCKED = 3  # pieces with no empty neighbour
+MOBILITY = 4  # steps to an empty neighbour
+DOUBLE_MILLS = 5  # pieces in two closed mills
+FORKS = 6  # empty points that would close two mills at once
+FEATURE_COUNT = 7
+
+# Weights of each feature in each phase of a player, pieces in hand are worth a piece on the board
+PHASE_WEIGHTS: Dict[MoveType, Tuple[int, ...]] = {
+    MoveType.PLACE: (100, 26, 12, -2, 1, 20, 10),
+    MoveType.MOVE: (110, 40, 8, -10, 4, 45, 8),
+    MoveType.FLY: (120, 16, 30, 0, 0, 0, 25),
+}
+
+# State of a line seen from one of its points
+_NO_PATTERN = 0
+_GREEN_MILL = 1
+_BLUE_MILL = 2
+_GREEN_OPEN = 3  # two green pieces and the point is empty
+_BLUE_OPEN = 4  # two blue pieces and the point is empty
+_LINE_STATE_COUNT = 5
+
+# No feature to count
+_NO_FEATURE = -1
+
+
+def _create_line_features() -> Tuple[int, ...]:
+    """
+    Creates the feature counted for every occupancy of a line. A line code has a bit for each green piece in bits 0-2 and each blue piece in bits 3-5
+
+    Returns:
+        Tuple[int, ...]: Feature count index, indexed by line code
+    """
+    features: List[int] = []
+    for code in range(64):
+        green_count: int = (code & 0b111).bit_count()
+        blue_count: int = (code >> 3).bit_count()
+        if code & code >> 3:
+            # a point cannot hold both colours
+            features.append(_NO_FEATURE)
+        elif green_count == 3:
+            features.append(MILLS * 2 + True)
+        elif blue_count == 3:
+            features.append(MILLS * 2 + False)
+        elif green_count == 2 and not blue_count:
+            features.append(TWO_PIECES * 2 + True)
+        elif blue_count == 2 and not green_count:
+            features.append(TWO_PIECES * 2 + False)
+        else:
+            features.append(_NO_FEATURE)
+    return tuple(features)
+
+
+def _create_line_states() -> Tuple[int, ...]:
+    """
+    Creates the state of every occupancy of a line seen from each of its three points
+
+    Returns:
+        Tuple[int, ...]: Line state, indexed by line code * 3 + point number in the line
+    """
+    states: List[int] = []
+    for code in range(64):
+        for point in range(3):
+            bit: int = 1 << point
+            is_empty: bool = not code & (bit | bit << 3)
+            if code & 0b111 == 0b111:
+                states.append(_GREEN_MILL)
+            elif code >> 3 == 0b111:
+                states.append(_BLUE_MILL)
+            elif is_empty and code == 0b111 ^ bit:
+                states.append(_GREEN_OPEN)
+            elif is_empty and code == (0b111 ^ bit) << 3:
+                states.append(_BLUE_OPEN)
+            else:
+                states.append(_NO_PATTERN)
+    return tuple(states)
+
+
+def _create_point_features() -> Tuple[int, ...]:
+    """
+    Creates the feature counted for a point from the states of the two lines through it
+
+    Returns:
+        Tuple[int, ...]: Feature count index, indexed by first line state * 5 + second line state
+    """
+    point_features: Dict[int, int] = {
+        _GREEN_MILL: DOUBLE_MILLS * 2 + True,
+        _BLUE_MILL: DOUBLE_MILLS * 2 + False,
+        _GREEN_OPEN: FORKS * 2 + True,
+        _BLUE_OPEN: FORKS * 2 + False,
+    }
+    return tuple(
+        (
+            point_features.get(first_state, _NO_FEATURE)
+            if first_state == second_state
+            else _NO_FEATURE
+        )
+        for first_state in range(_LINE_STATE_COUNT)
+        for second_state in range(_LINE_STATE_COUNT)
+    )
+
+
+def _create_point_lines() -> Tuple[Tuple[Tuple[int, int], ...], ...]:
+    """
+    Creates the lines through each point with the number of the point in each line
+
+    Returns:
+        Tuple[Tuple[Tuple[int, int], ...], ...]: Line index and point number of the two lines through each point
+    """
+    point_lines: List[List[Tuple[int, int]]] = [[] for _ in range(BOARD_SIZE)]
+    for line_index, line in enumerate(MILL_LINES):
+        for point, index in enumerate(line):
+            point_lines[index].append((line_index, point))
+    return tuple(tuple(lines) for lines in point_lines)
+
+
+# Feature counted for each line code
+LINE_FEATURES: Tuple[int, ...] = _create_line_features()
+
+# State of each line code seen from each of its points
+LINE_STATES: Tuple[int, ...] = _create_line_states()
+
+# Feature counted for each pair of line states through a point
+POINT_FEATURES: Tuple[int, ...] = _create_point_features()
+
+# Line index and point number of the two lines through each point
+POINT_LINES: Tuple[Tuple[Tuple[int, int], ...], ...] = _create_point_lines()
+
+# Points sharing a line with each point, including the point itself
+LINE_NEIGHBOURS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(
+        sorted({index for line_index, _ in lines for index in MILL_LINES[line_index]})
+    )
+    for lines in POINT_LINES
+)
+
+
+class Evaluator:
+    def __init__(self) -> None:
+        """
+        Initialises evaluator. Feature counts are looked up from pattern tables and kept up to date as moves are made and unmade, so scoring a position only sums the counts
+        """
+        self._occupants: List[bool | None] = []
+        self._line_codes: List[int] = []
+        self._point_features: List[int] = []
+        self._free_neighbours: List[int] = []
+        self._counts: List[int] = []
+        self._undo_stack: List[Tuple[Move, bool]] = []
+        self._clear()
+
+    def reset(self, game_state: GameState) -> None:
+        """
+        Recounts every feature for a game state
+
+        Args:
+            game_state (GameState): Game state to count features of
+        """
+        self._clear()
+        bitboard = game_state.get_bitboard()
+        for is_green in (True, False):
+            for index in iter_indexes(bitboard.get_colour_mask(is_green)):
+                self._set_point(index, is_green)
+
+    def make_move(self, game_state: GameState, move: Move) -> None:
+        """
+        Updates the feature counts for a move, called before the move is made on the game state
+
+        Args:
+            game_state (GameState): Game state the move is about to be made on
+            move (Move): Move to be made
+        """
+        is_green: bool = game_state.get_is_green_to_move()
+        self._undo_stack.append((move, is_green))
+
+        if move.origin is not None:
+            self._set_point(move.origin, None)
+        if move.destination is not None:
+            self._set_point(move.destination, is_green)
+        if move.remove is not None:
+            self._set_point(move.remove, None)
+
+    def unmake_move(self) -> None:
+        """
+        Restores the feature counts from before the last move
+
+        Raises:
+            Exception: If there is no move to unmake
+        """
+        if not self._undo_stack:
+            raise Exception("No move to unmake")
+
+        move, is_green = self._undo_stack.pop()
+        if move.remove is not None:
+            self._set_point(move.remove, not is_green)
+        if move.destination is not None:
+            self._set_point(move.destination, None)
+        if move.origin is not None:
+            self._set_point(move.origin, is_green)
+
+    def get_count(self, feature: int, is_green: bool) -> int:
+        """
+        Gets the count of a feature for a player
+
+        Args:
+            feature (int): Feature to count
+            is_green (bool): Whether to count for green or blue
+
+        Returns:
+            int: Count of the feature
+        """
+        return self._counts[feature * 2 + is_green]
+
+    def evaluate(self, game_state: GameState) -> int:
+        """
+        Scores a position by summing the feature counts with the weights of each player's phase
+
+        Args:
+            game_state (GameState): Game state the counts are up to date with
+
+        Returns:
+            int: Score from the point of view of the side to move
+        """
+        is_green: bool = game_state.get_is_green_to_move()
+        return self._score_player(game_state, is_green) - self._score_player(
+            game_state, not is_green
+        )
+
+    def _score_player(self, game_state: GameState, is_green: bool) -> int:
+        """
+        Scores the features of one player
+
+        Args:
+            game_state (GameState): Game state the counts are up to date with
+            is_green (bool): Whether to score green or blue
+
+        Returns:
+            int: Score of the player
+        """
+        counts: List[int] = self._counts
+        if not game_state.is_pieces_placed():
+            weights: Tuple[int, ...] = PHASE_WEIGHTS[MoveType.PLACE]
+        elif counts[PIECES * 2 + is_green] <= CONSTANTS.FLYING_PIECE_COUNT:
+            weights = PHASE_WEIGHTS[MoveType.FLY]
+        else:
+            weights = PHASE_WEIGHTS[MoveType.MOVE]
+
+        score: int = weights[PIECES] * game_state.get_pieces_in_hand(is_green)
+        for feature in range(FEATURE_COUNT):
+            score += weights[feature] * counts[feature * 2 + is_green]
+        return score
+
+    def _clear(self) -> None:
+        """
+        Clears the counts for an empty board
+        """
+        self._occupants = [None] * BOARD_SIZE
+        self._line_codes = [0] * len(MILL_LINES)
+        self._point_features = [_NO_FEATURE] * BOARD_SIZE
+        self._free_neighbours = [len(adjacent) for adjacent in ADJACENT_INDEXES]
+        self._counts = [0] * (FEATURE_COUNT * 2)
+        self._undo_stack = []
+
+    def _set_point(self, index: int, is_green: bool | None) -> None:
+        """
+        Puts a piece on an empty point or empties an occupied point, updating the counts of the lines and neighbours it touches
+
+        Args:
+            index (int): Index of the point
+            is_green (bool | None): Colour of the piece put there, None to empty the point
+        """
+        counts: List[int] = self._counts
+        line_codes: List[int] = self._line_codes
+        occupants: List[bool | None] = self._occupants
+        free_neighbours: List[int] = self._free_neighbours
+        previous: bool | None = occupants[index]
+        occupants[index] = is_green
+
+        for line_index, point in POINT_LINES[index]:
+            code: int = line_codes[line_index]
+            feature: int = LINE_FEATURES[code]
+            if feature != _NO_FEATURE:
+                counts[feature] -= 1
+
+            bit: int = 1 << point
+            if is_green is None:
+                code &= ~(bit | bit << 3)
+            else:
+                code |= bit if is_green else bit << 3
+            line_codes[line_index] = code
+
+            feature = LINE_FEATURES[code]
+            if feature != _NO_FEATURE:
+                counts[feature] += 1
+
+        point_features: List[int] = self._point_features
+        for neighbour in LINE_NEIGHBOURS[index]:
+            feature = point_features[neighbour]
+            if feature != _NO_FEATURE:
+                counts[feature] -= 1
+
+            (first_line, first_point), (second_line, second_point) = POINT_LINES[
+                neighbour
+            ]
+            feature = POINT_FEATURES[
+                LINE_STATES[line_codes[first_line] * 3 + first_point]
+                * _LINE_STATE_COUNT
+                + LINE_STATES[line_codes[second_line] * 3 + second_point]
+            ]
+            point_features[neighbour] = feature
+            if feature != _NO_FEATURE:
+                counts[feature] += 1
+
+        free: int = free_neighbours[index]
+        if is_green is None:
+            counts[PIECES * 2 + previous] -= 1
+            counts[MOBILITY * 2 + previous] -= free
+            if not free:
+                counts[BLOCKED * 2 + previous] -= 1
+            for neighbour in ADJACENT_INDEXES[index]:
+                occupant: bool | None = occupants[neighbour]
+                if occupant is not None:
+                    counts[MOBILITY * 2 + occupant] += 1
+                    if not free_neighbours[neighbour]:
+                        counts[BLOCKED * 2 + occupant] -= 1
+                free_neighbours[neighbour] += 1
+        else:
+            counts[PIECES * 2 + is_green] += 1
+            counts[MOBILITY * 2 + is_green] += free
+            if not free:
+                counts[BLOCKED * 2 + is_green] += 1
+            for neighbour in ADJACENT_INDEXES[index]:
+                free_neighbours[neighbour] -= 1
+                occupant = occupants[neighbour]
+                if occupant is not None:
+                    counts[MOBILITY * 2 + occupant] -= 1
+                    if not free_neighbours[neighbour]:
+                        counts[BLOCKED * 2 + occupant] += 1
+
+
+def evaluate(game_state: GameState) -> int:
+    """
+    Scores a position without keeping counts between calls, a search should keep an Evaluator up to date instead
+
+    Args:
+        game_state (GameState): Game state to score
+
+    Returns:
+        int: Score from the point of view of the side to move
+    """
+    evaluator = Evaluator()
+    evaluator.reset(game_state)
+    return evaluator.evaluate(game_state)
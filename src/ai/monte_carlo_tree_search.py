@@ -0,0 +1,500 @@
+from __future__ import annotations
+
+import math
+import random
+import time
+from typing import TYPE_CHECKING, List, Tuple
+
+import CONSTANTS
+from ai.strategy import Strategy
+from engine.board_layout import ADJACENCY_MASKS, FULL_BOARD_MASK, MILL_MASKS
+from engine.move_generator import forms_mill, generate_moves
+
+if TYPE_CHECKING:
+    from engine.game_state import GameState
+    from engine.move import Move
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+# Exploration constant of the UCT formula
+EXPLORATION = math.sqrt(2)
+
+# Playouts run from each new leaf in one call
+PLAYOUT_BATCH_SIZE = 8
+
+# Plies a playout may last before it counts as a draw
+PLAYOUT_MAX_PLIES = 120
+
+# Result of a playout for the side to move at its start
+WIN_RESULT = 1.0
+DRAW_RESULT = 0.5
+LOSS_RESULT = 0.0
+
+
+def run_playouts(
+    game_state: GameState,
+    playout_count: int,
+    random_generator: random.Random,
+    max_plies: int = PLAYOUT_MAX_PLIES,
+) -> float:
+    """
+    Plays random games from a position. The games are played on bitmasks without creating moves or changing the game state, so a whole batch runs in one call
+
+    Args:
+        game_state (GameState): Game state to play from, it is left unchanged
+        playout_count (int): Number of games to play
+        random_generator (random.Random): Random number generator choosing the moves
+        max_plies (int, optional): Plies a game may last before it counts as a draw. Defaults to PLAYOUT_MAX_PLIES.
+
+    Returns:
+        float: Sum of the results for the side to move, 1 for a win, 0.5 for a draw and 0 for a loss
+    """
+    bitboard = game_state.get_bitboard()
+    is_green: bool = bitboard.get_is_green_to_move()
+    mover_mask: int = bitboard.get_colour_mask(is_green)
+    opponent_mask: int = bitboard.get_colour_mask(not is_green)
+    mover_hand: int = game_state.get_pieces_in_hand(is_green)
+    opponent_hand: int = game_state.get_pieces_in_hand(not is_green)
+    is_pending_remove: bool = game_state.is_pending_remove()
+
+    total: float = 0.0
+    for _ in range(playout_count):
+        total += _play_out(
+            mover_mask,
+            opponent_mask,
+            mover_hand,
+            opponent_hand,
+            is_pending_remove,
+            random_generator,
+            max_plies,
+        )
+    return total
+
+
+class TreeNode:
+    __slots__ = ("move", "parent", "children", "untried_moves", "visits", "value")
+
+    def __init__(self, move: Move | None, parent: TreeNode | None) -> None:
+        """
+        Initialises a node of the search tree. Its value is from the point of view of the side that played its move
+
+        Args:
+            move (Move | None): Move leading to the node, None for the root
+            parent (TreeNode | None): Parent node, None for the root
+        """
+        self.move: Move | None = move
+        self.parent: TreeNode | None = parent
+        self.children: List[TreeNode] = []
+        # moves not yet added as children, None until the node is first reached
+        self.untried_moves: List[Move] | None = None
+        self.visits: int = 0
+        self.value: float = 0.0
+
+    def get_subtree_size(self) -> int:
+        """
+        Counts the nodes in the subtree under the node
+
+        Returns:
+            int: Number of nodes, including the node
+        """
+        size: int = 0
+        nodes: List[TreeNode] = [self]
+        while nodes:
+            node: TreeNode = nodes.pop()
+            size += 1
+            nodes.extend(node.children)
+        return size
+
+
+class MonteCarloTreeSearch(Strategy):
+    def __init__(
+        self,
+        time_budget: float = CONSTANTS.AI_TIME_BUDGET,
+        max_nodes: int = CONSTANTS.AI_MONTE_CARLO_MAX_NODES,
+        playout_batch_size: int = PLAYOUT_BATCH_SIZE,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Initialises Monte Carlo tree search with UCT. It can stop at any time with a move and keeps the tree under the opponent's reply for its next move
+
+        Args:
+            time_budget (float, optional): Seconds allowed per move. Defaults to CONSTANTS.AI_TIME_BUDGET.
+            max_nodes (int, optional): Most nodes kept in the tree, once reached leaves below the root are played out without being expanded. Defaults to CONSTANTS.AI_MONTE_CARLO_MAX_NODES.
+            playout_batch_size (int, optional): Playouts run from each new leaf. Defaults to PLAYOUT_BATCH_SIZE.
+            seed (int | None, optional): Seed for the random choices. Defaults to None.
+        """
+        self._time_budget: float = time_budget
+        self._max_nodes: int = max_nodes
+        self._playout_batch_size: int = max(1, playout_batch_size)
+        self._random = random.Random(seed)
+        self._root: TreeNode | None = None
+        self._root_state: GameState | None = None
+        self._node_count: int = 0
+        self._iteration_count: int = 0
+        self._playout_count: int = 0
+        self._is_stopped: bool = False
+
+    def choose_move(self, game_state: GameState) -> Move:
+        """
+        Chooses the most visited move at the root
+
+        Args:
+            game_state (GameState): Game state to choose a move in
+
+        Returns:
+            Move: Best move found
+        """
+        return self.search(game_state)[0]
+
+    def search(self, game_state: GameState) -> Tuple[Move, float]:
+        """
+        Grows the tree until the time budget runs out
+
+        Args:
+            game_state (GameState): Game state to search, it is left unchanged
+
+        Raises:
+            Exception: No available moves
+
+        Returns:
+            Tuple[Move, float]: Most visited move and its average result for the side to move, from 0 for a loss to 1 for a win
+        """
+        deadline: float = time.perf_counter() + self._time_budget
+        self._iteration_count = 0
+        self._playout_count = 0
+        game_state = game_state.copy()
+        self._set_root(game_state)
+
+        root: TreeNode = self._root
+        if root.untried_moves is None:
+            root.untried_moves = self._get_moves(game_state)
+        if not root.untried_moves and not root.children:
+            raise Exception("No available moves. Game should already be over")
+
+        while True:
+            self._run_iteration(game_state)
+            self._iteration_count += 1
+            if time.perf_counter() >= deadline or self._is_stopped:
+                break
+            if len(root.children) == 1 and not root.untried_moves:
+                # the only move needs no more search
+                break
+
+        best_child: TreeNode = max(root.children, key=lambda child: child.visits)
+        return best_child.move, best_child.value / best_child.visits
+
+    def get_node_count(self) -> int:
+        """
+        Gets the number of nodes in the tree
+
+        Returns:
+            int: Number of nodes
+        """
+        return self._node_count
+
+    def get_iteration_count(self) -> int:
+        """
+        Gets the number of times the tree was grown in the last search
+
+        Returns:
+            int: Number of iterations
+        """
+        return self._iteration_count
+
+    def get_playout_count(self) -> int:
+        """
+        Gets the number of random games played in the last search
+
+        Returns:
+            int: Number of playouts
+        """
+        return self._playout_count
+
+    def get_root_visits(self) -> int:
+        """
+        Gets the number of results counted at the root, including those kept from earlier searches
+
+        Returns:
+            int: Visits of the root
+        """
+        return 0 if self._root is None else self._root.visits
+
+    def set_time_budget(self, time_budget: float) -> None:
+        """
+        Sets the time allowed per move
+
+        Args:
+            time_budget (float): Seconds allowed per move
+        """
+        self._time_budget = time_budget
+
+    def set_is_stopped(self, is_stopped: bool) -> None:
+        """
+        Stops searches running on another thread, which return the most visited move so far, until set back to False
+
+        Args:
+            is_stopped (bool): True to stop searching
+        """
+        self._is_stopped = is_stopped
+
+    def clear(self) -> None:
+        """
+        Forgets the tree, the next search starts a new one
+        """
+        self._root = None
+        self._root_state = None
+        self._node_count = 0
+
+    def _set_root(self, game_state: GameState) -> None:
+        """
+        Makes the node of a game state the root, reusing the last tree if the game state is the last root or follows it by one or two moves
+
+        Args:
+            game_state (GameState): Game state to search
+        """
+        root: TreeNode | None = None
+        if self._root is not None:
+            root = self._find_node(self._root, game_state.get_hash(), 2)
+
+        if root is None:
+            root = TreeNode(None, None)
+            self._node_count = 1
+        elif root is not self._root:
+            root.parent = None
+            self._node_count = root.get_subtree_size()
+
+        self._root = root
+        self._root_state = game_state.copy()
+
+    def _find_node(
+        self, node: TreeNode, target_hash: int, max_depth: int
+    ) -> TreeNode | None:
+        """
+        Finds the node of a position in the subtree under a node by replaying moves on the last root's game state
+
+        Args:
+            node (TreeNode): Node whose game state the last root's game state is in
+            target_hash (int): Zobrist hash of the position to find
+            max_depth (int): Most moves below the node to look
+
+        Returns:
+            TreeNode | None: Node of the position, None if it is not in the subtree
+        """
+        if self._root_state.get_hash() == target_hash:
+            return node
+        if max_depth == 0:
+            return None
+
+        for child in node.children:
+            self._root_state.make_move(child.move)
+            found_node: TreeNode | None = self._find_node(
+                child, target_hash, max_depth - 1
+            )
+            self._root_state.unmake_move()
+            if found_node is not None:
+                return found_node
+        return None
+
+    def _run_iteration(self, game_state: GameState) -> None:
+        """
+        Selects a leaf with UCT, expands it by one move, plays a batch of random games from it and counts their results on the path
+
+        Args:
+            game_state (GameState): Game state of the root, moves made on it are unmade before returning
+        """
+        node: TreeNode = self._root
+        depth: int = 0
+
+        # selection
+        while not node.untried_moves and node.children:
+            node = self._select_child(node)
+            game_state.make_move(node.move)
+            depth += 1
+
+        # expansion
+        if node.untried_moves is None:
+            node.untried_moves = self._get_moves(game_state)
+        # the root is always expanded so there is a move to choose
+        if node.untried_moves and (
+            self._node_count < self._max_nodes or node is self._root
+        ):
+            child = TreeNode(node.untried_moves.pop(), node)
+            node.children.append(child)
+            self._node_count += 1
+            node = child
+            game_state.make_move(node.move)
+            depth += 1
+
+        # simulation, results for the side to move
+        winner: bool | None = game_state.get_winner()
+        if winner is None:
+            total: float = run_playouts(
+                game_state, self._playout_batch_size, self._random
+            )
+            self._playout_count += self._playout_batch_size
+        elif winner == game_state.get_is_green_to_move():
+            total = WIN_RESULT * self._playout_batch_size
+        else:
+            total = LOSS_RESULT * self._playout_batch_size
+
+        # backpropagation, each node counts results for the side that played its move
+        result: float = self._playout_batch_size - total
+        while node is not None:
+            node.visits += self._playout_batch_size
+            node.value += result
+            result = self._playout_batch_size - result
+            node = node.parent
+
+        for _ in range(depth):
+            game_state.unmake_move()
+
+    def _select_child(self, node: TreeNode) -> TreeNode:
+        """
+        Selects the child with the highest upper confidence bound
+
+        Args:
+            node (TreeNode): Node with every move expanded
+
+        Returns:
+            TreeNode: Selected child
+        """
+        log_visits: float = math.log(node.visits)
+        best_child: TreeNode = node.children[0]
+        best_bound: float = -math.inf
+        for child in node.children:
+            bound: float = child.value / child.visits + EXPLORATION * math.sqrt(
+                log_visits / child.visits
+            )
+            if bound > best_bound:
+                best_child, best_bound = child, bound
+        return best_child
+
+    def _get_moves(self, game_state: GameState) -> List[Move]:
+        """
+        Gets the moves of a newly reached node in random order, none if the game is over
+
+        Args:
+            game_state (GameState): Game state of the node
+
+        Returns:
+            List[Move]: Moves not yet tried
+        """
+        if game_state.get_winner() is not None:
+            return []
+        moves: List[Move] = generate_moves(game_state)
+        self._random.shuffle(moves)
+        return moves
+
+
+def _play_out(
+    mover_mask: int,
+    opponent_mask: int,
+    mover_hand: int,
+    opponent_hand: int,
+    is_pending_remove: bool,
+    random_generator: random.Random,
+    max_plies: int,
+) -> float:
+    """
+    Plays one random game on bitmasks with the rules of the game state
+
+    Args:
+        mover_mask (int): Bitmask of the pieces of the side to move
+        opponent_mask (int): Bitmask of the pieces of the opponent
+        mover_hand (int): Pieces the side to move has left to place
+        opponent_hand (int): Pieces the opponent has left to place
+        is_pending_remove (bool): True if the side to move has to remove a piece first
+        random_generator (random.Random): Random number generator choosing the moves
+        max_plies (int): Plies the game may last before it counts as a draw
+
+    Returns:
+        float: Result for the side to move at the start
+    """
+    is_first_mover: bool = True
+    if is_pending_remove:
+        opponent_mask ^= _choose_bit(
+            _get_removable_mask(opponent_mask), random_generator
+        )
+        mover_mask, opponent_mask = opponent_mask, mover_mask
+        mover_hand, opponent_hand = opponent_hand, mover_hand
+        is_first_mover = False
+
+    for _ in range(max_plies):
+        if mover_hand:
+            mover_hand -= 1
+            destination_bit: int = _choose_bit(
+                FULL_BOARD_MASK & ~(mover_mask | opponent_mask), random_generator
+            )
+            mover_mask |= destination_bit
+        else:
+            if opponent_hand == 0 and (
+                mover_mask.bit_count() <= CONSTANTS.LOSING_PIECE_COUNT
+            ):
+                return LOSS_RESULT if is_first_mover else WIN_RESULT
+
+            empty_mask: int = FULL_BOARD_MASK & ~(mover_mask | opponent_mask)
+            if mover_mask.bit_count() <= CONSTANTS.FLYING_PIECE_COUNT:
+                origin_bit: int = _choose_bit(mover_mask, random_generator)
+                destination_bit = _choose_bit(empty_mask, random_generator)
+            else:
+                origins: List[int] = []
+                remaining_mask: int = mover_mask
+                while remaining_mask:
+                    bit: int = remaining_mask & -remaining_mask
+                    if ADJACENCY_MASKS[bit.bit_length() - 1] & empty_mask:
+                        origins.append(bit)
+                    remaining_mask ^= bit
+                if not origins:
+                    return LOSS_RESULT if is_first_mover else WIN_RESULT
+                origin_bit = random_generator.choice(origins)
+                destination_bit = _choose_bit(
+                    ADJACENCY_MASKS[origin_bit.bit_length() - 1] & empty_mask,
+                    random_generator,
+                )
+            mover_mask ^= origin_bit | destination_bit
+
+        if forms_mill(mover_mask, destination_bit.bit_length() - 1):
+            removable_mask: int = _get_removable_mask(opponent_mask)
+            if removable_mask:
+                opponent_mask ^= _choose_bit(removable_mask, random_generator)
+
+        mover_mask, opponent_mask = opponent_mask, mover_mask
+        mover_hand, opponent_hand = opponent_hand, mover_hand
+        is_first_mover = not is_first_mover
+
+    return DRAW_RESULT
+
+
+def _get_removable_mask(colour_mask: int) -> int:
+    """
+    Gets the pieces of a player that can be removed, those outside mills unless every piece is in a mill
+
+    Args:
+        colour_mask (int): Bitmask of the player's pieces
+
+    Returns:
+        int: Bitmask of the removable pieces
+    """
+    mill_mask: int = 0
+    for line_mask in MILL_MASKS:
+        if colour_mask & line_mask == line_mask:
+            mill_mask |= line_mask
+    removable_mask: int = colour_mask & ~mill_mask
+    return removable_mask if removable_mask else colour_mask
+
+
+def _choose_bit(mask: int, random_generator: random.Random) -> int:
+    """
+    Chooses one of the set bits of a mask uniformly
+
+    Args:
+        mask (int): Bitmask with at least one bit set
+        random_generator (random.Random): Random number generator
+
+    Returns:
+        int: Mask with only the chosen bit set
+    """
+    for _ in range(random_generator.randrange(mask.bit_count())):
+        mask &= mask - 1
+    return mask & -mask
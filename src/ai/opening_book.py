@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import mmap
+import struct
+from typing import TYPE_CHECKING, List, NamedTuple
+
+import CONSTANTS
+from engine.move import Move, decode_move
+from engine.symmetry import get_canonical_key, untransform_move
+
+if TYPE_CHECKING:
+    from engine.game_state import GameState
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+# Book file header: magic, version and number of records
+HEADER_FORMAT = "<4sII"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+MAGIC = b"NMOB"
+VERSION = 1
+
+# Record: canonical key, move in the canonical position, score and weight, sorted by key then best record first
+RECORD_FORMAT = "<QHhHxx"
+RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+KEY_FORMAT = "<Q"
+
+# Range of a stored score
+MAX_BOOK_SCORE = 0x7FFF
+
+
+class BookEntry(NamedTuple):
+    """
+    Responsible for a move read from the opening book
+
+    Args:
+        NamedTuple (NamedTuple): Move in the probed position, score from the point of view of the side to move and weight, higher is better
+    """
+
+    move: Move
+    score: int
+    weight: int
+
+
+class OpeningBook:
+    def __init__(self, path: str = CONSTANTS.OPENING_BOOK_PATH) -> None:
+        """
+        Initialises opening book prober. The book file is memory mapped when first probed and searched in place, so nothing is read up front
+
+        Args:
+            path (str, optional): Path of the book file. Defaults to CONSTANTS.OPENING_BOOK_PATH.
+        """
+        self._path: str = path
+        self._memory_map: mmap.mmap | None = None
+        self._record_count: int = 0
+        self._is_opened: bool = False
+
+    def __getstate__(self) -> str:
+        """
+        Pickles the prober as its path, the file is mapped again by each process
+
+        Returns:
+            str: Path of the book file
+        """
+        return self._path
+
+    def __setstate__(self, path: str) -> None:
+        """
+        Creates the prober a pickle was made from
+
+        Args:
+            path (str): Path of the book file
+        """
+        self.__init__(path)
+
+    def get_path(self) -> str:
+        """
+        Gets the path of the book file
+
+        Returns:
+            str: Path
+        """
+        return self._path
+
+    def get_record_count(self) -> int:
+        """
+        Gets the number of records in the book
+
+        Returns:
+            int: Number of records, 0 if the file is missing
+        """
+        self._open()
+        return self._record_count
+
+    def probe(self, game_state: GameState) -> List[BookEntry]:
+        """
+        Looks up the book moves of a position in the placement phase
+
+        Args:
+            game_state (GameState): Game state to look up
+
+        Returns:
+            List[BookEntry]: Book moves, best first, empty if the position is not in the book
+        """
+        if game_state.is_pieces_placed() or not self._open():
+            return []
+
+        key, transform = get_canonical_key(game_state)
+        entries: List[BookEntry] = []
+        record: int = self._find_first_record(key)
+        while record < self._record_count:
+            record_key, move_code, score, weight = struct.unpack_from(
+                RECORD_FORMAT, self._memory_map, HEADER_SIZE + record * RECORD_SIZE
+            )
+            if record_key != key:
+                break
+            entries.append(
+                BookEntry(
+                    untransform_move(decode_move(move_code), transform), score, weight
+                )
+            )
+            record += 1
+        return entries
+
+    def get_best_entry(
+        self, game_state: GameState, legal_moves: List[Move] | None = None
+    ) -> BookEntry | None:
+        """
+        Gets the best book move of a position, the same move every time
+
+        Args:
+            game_state (GameState): Game state to look up
+            legal_moves (List[Move] | None, optional): Legal moves of the position, book moves not among them are skipped. Defaults to None to trust the book.
+
+        Returns:
+            BookEntry | None: Best book move, None if the position is not in the book
+        """
+        for entry in self.probe(game_state):
+            if legal_moves is None or entry.move in legal_moves:
+                return entry
+        return None
+
+    def get_move(self, game_state: GameState) -> Move | None:
+        """
+        Gets the best book move of a position, the same move every time
+
+        Args:
+            game_state (GameState): Game state to look up
+
+        Returns:
+            Move | None: Book move, None if the position is not in the book
+        """
+        entry: BookEntry | None = self.get_best_entry(game_state)
+        return None if entry is None else entry.move
+
+    def close(self) -> None:
+        """
+        Closes the book file, it is mapped again by the next probe
+        """
+        if self._memory_map is not None:
+            self._memory_map.close()
+        self._memory_map = None
+        self._record_count = 0
+        self._is_opened = False
+
+    def _open(self) -> bool:
+        """
+        Maps the book file on first use after checking its header
+
+        Returns:
+            bool: True if the book is open
+        """
+        if not self._is_opened:
+            self._is_opened = True
+            try:
+                with open(self._path, "rb") as file:
+                    memory_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                return False
+
+            if len(memory_map) >= HEADER_SIZE:
+                magic, version, record_count = struct.unpack_from(
+                    HEADER_FORMAT, memory_map
+                )
+                if (magic, version) == (MAGIC, VERSION) and len(
+                    memory_map
+                ) >= HEADER_SIZE + record_count * RECORD_SIZE:
+                    self._memory_map = memory_map
+                    self._record_count = record_count
+                    return True
+            memory_map.close()
+
+        return self._memory_map is not None
+
+    def _find_first_record(self, key: int) -> int:
+        """
+        Binary searches for the first record with a key at least as large as a key
+
+        Args:
+            key (int): Canonical key
+
+        Returns:
+            int: Index of the record
+        """
+        low: int = 0
+        high: int = self._record_count
+        while low < high:
+            middle: int = (low + high) // 2
+            (middle_key,) = struct.unpack_from(
+                KEY_FORMAT, self._memory_map, HEADER_SIZE + middle * RECORD_SIZE
+            )
+            if middle_key < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import os
+import struct
+import time
+from typing import TYPE_CHECKING, Dict, List, Set, Tuple
+
+from ai.opening_book import (
+    HEADER_FORMAT,
+    MAGIC,
+    MAX_BOOK_SCORE,
+    RECORD_FORMAT,
+    VERSION,
+)
+from engine.game_state import GameState
+from engine.move import encode_move
+from engine.move_generator import generate_moves
+from engine.symmetry import get_canonical_key, transform_move
+
+if TYPE_CHECKING:
+    from ai.alpha_beta_search import AlphaBetaSearch
+    from engine.move import Move
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+# Weight given to the best move of a search, so searched moves are preferred over moves seen in few games
+SEARCH_WEIGHT = 100
+
+# Weight given to a move for each recorded game the side that played it won or drew, moves of the losing side are not added
+GAME_WIN_WEIGHT = 2
+GAME_DRAW_WEIGHT = 1
+
+# Largest stored weight
+MAX_WEIGHT = 0xFFFF
+
+
+class OpeningBookBuilder:
+    def __init__(self, is_verbose: bool = False) -> None:
+        """
+        Initialises opening book builder. Moves are collected per canonical position, so symmetric positions share their records, and written sorted by key
+
+        Args:
+            is_verbose (bool, optional): True to report progress on standard output. Defaults to False.
+        """
+        self._is_verbose: bool = is_verbose
+        # canonical key to encoded canonical move to score and weight
+        self._positions: Dict[int, Dict[int, List[int]]] = {}
+
+    def get_position_count(self) -> int:
+        """
+        Gets the number of positions in the book
+
+        Returns:
+            int: Number of positions
+        """
+        return len(self._positions)
+
+    def get_record_count(self) -> int:
+        """
+        Gets the number of records the book file will hold
+
+        Returns:
+            int: Number of records, one per move of each position
+        """
+        return sum(len(moves) for moves in self._positions.values())
+
+    def add_move(
+        self, game_state: GameState, move: Move, score: int | None, weight: int
+    ) -> None:
+        """
+        Adds a move of a placement phase position, adding its weight to any weight it already has. A score replaces the move's score, which is 0 until a move is scored
+
+        Args:
+            game_state (GameState): Game state the move is played in
+            move (Move): Move
+            score (int | None): Score from the point of view of the side to move, clamped to the stored range, None to keep the move's score
+            weight (int): Weight, higher is better
+        """
+        if game_state.is_pieces_placed():
+            return
+
+        key, transform = get_canonical_key(game_state)
+        move_code: int = encode_move(transform_move(move, transform))
+        record: List[int] = self._positions.setdefault(key, {}).setdefault(
+            move_code, [0, 0]
+        )
+        if score is not None:
+            record[0] = max(-MAX_BOOK_SCORE, min(MAX_BOOK_SCORE, score))
+        record[1] = min(MAX_WEIGHT, record[1] + weight)
+
+    def add_game(self, moves: List[Move], winner: bool | None) -> None:
+        """
+        Adds the placement phase moves of a recorded game played from the start
+
+        Args:
+            moves (List[Move]): Moves of the game in order
+            winner (bool | None): True if green won, False if blue won, None for a draw
+        """
+        game_state = GameState()
+        for move in moves:
+            if game_state.is_pieces_placed():
+                break
+
+            is_green: bool = game_state.get_bitboard().get_is_green_to_move()
+            if winner is None:
+                self.add_move(game_state, move, None, GAME_DRAW_WEIGHT)
+            elif winner == is_green:
+                self.add_move(game_state, move, None, GAME_WIN_WEIGHT)
+            game_state.make_move(move)
+
+    def add_searches(
+        self, search: AlphaBetaSearch, max_plies: int, full_width_plies: int
+    ) -> int:
+        """
+        Searches placement phase positions from the start of the game and adds the best move of each.
+        Every move is followed for the first plies, after that only the best move, so each line ends in a searched position
+
+        Args:
+            search (AlphaBetaSearch): Search to choose the moves with, its time budget sets how deep the book is searched
+            max_plies (int): Plies from the start of the game to search positions up to
+            full_width_plies (int): Plies from the start of the game to follow every move for
+
+        Returns:
+            int: Number of positions searched
+        """
+        start_time: float = time.perf_counter()
+        searched_keys: Set[int] = set()
+        frontier: List[GameState] = [GameState()]
+
+        for ply in range(max_plies):
+            next_frontier: List[GameState] = []
+            for game_state in frontier:
+                key, _ = get_canonical_key(game_state)
+                if key in searched_keys:
+                    continue
+                searched_keys.add(key)
+
+                best_move, score = search.search(game_state)
+                self.add_move(game_state, best_move, score, SEARCH_WEIGHT)
+
+                moves: List[Move] = (
+                    generate_moves(game_state)
+                    if ply < full_width_plies
+                    else [best_move]
+                )
+                for move in moves:
+                    child: GameState = game_state.copy()
+                    child.make_move(move)
+                    if not child.is_pieces_placed() and child.get_winner() is None:
+                        next_frontier.append(child)
+            frontier = next_frontier
+
+            if self._is_verbose:
+                print(
+                    f"ply {ply + 1}: {len(searched_keys)} positions searched in "
+                    f"{time.perf_counter() - start_time:.1f}s"
+                )
+
+        return len(searched_keys)
+
+    def write(self, path: str) -> None:
+        """
+        Writes the book file: header and records sorted by key, the best move of each position first, little endian
+
+        Args:
+            path (str): Path of the book file
+        """
+        records: List[Tuple[int, int, int, int]] = []
+        for key in sorted(self._positions):
+            moves: Dict[int, List[int]] = self._positions[key]
+            # prefer high weights, then high scores, then the lowest code so the order is deterministic
+            for move_code in sorted(
+                moves, key=lambda code: (-moves[code][1], -moves[code][0], code)
+            ):
+                score, weight = moves[move_code]
+                records.append((key, move_code, score, weight))
+
+        directory: str = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary_path: str = path + ".tmp"
+        with open(temporary_path, "wb") as file:
+            file.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, len(records)))
+            for record in records:
+                file.write(struct.pack(RECORD_FORMAT, *record))
+        os.replace(temporary_path, path)
+
+        if self._is_verbose:
+            print(f"{len(self._positions)} positions, {len(records)} moves: {path}")
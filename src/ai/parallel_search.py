@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import multiprocessing
+import time
+import weakref
+from multiprocessing.pool import Pool
+from typing import TYPE_CHECKING, List, Tuple
+
+import CONSTANTS
+from ai.alpha_beta_search import MAX_PLY, AlphaBetaSearch, score_tablebase_result
+from ai.opening_book import BookEntry, OpeningBook
+from ai.shared_transposition_table import SharedTranspositionTable
+from ai.strategy import Strategy
+from ai.tablebase import Tablebase
+from engine.move_generator import generate_moves
+
+if TYPE_CHECKING:
+    from engine.game_state import GameState
+    from engine.move import Move
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+# Seconds of the time budget kept back for sending work to the workers and collecting results
+DISPATCH_MARGIN = 0.05
+
+# Result of a worker: best move and score of each completed iteration, whether it timed out and nodes searched
+ShareResult = Tuple[List[Tuple["Move", int]], bool, int]
+
+# Search of a worker process, kept between moves
+_worker_search: AlphaBetaSearch | None = None
+
+
+def _initialise_worker(
+    max_depth: int,
+    transposition_table: SharedTranspositionTable,
+    tablebase: Tablebase | None,
+) -> None:
+    """
+    Creates the search of a worker process
+
+    Args:
+        max_depth (int): Deepest iteration to search
+        transposition_table (SharedTranspositionTable): Transposition table shared by every worker
+        tablebase (Tablebase | None): Endgame tablebase, None for no tablebase
+    """
+    global _worker_search
+    _worker_search = AlphaBetaSearch(
+        max_depth=max_depth,
+        transposition_table=transposition_table,
+        tablebase=tablebase,
+    )
+
+
+def _search_share(
+    game_state: GameState, root_moves: List[Move], deadline: float
+) -> ShareResult:
+    """
+    Searches a worker's share of the root moves
+
+    Args:
+        game_state (GameState): Game state to search
+        root_moves (List[Move]): Root moves given to the worker
+        deadline (float): time.monotonic() to stop searching at, counting from when the search was asked for rather than when the worker got the work
+
+    Returns:
+        ShareResult: Best move and score of each completed iteration, whether the search timed out and nodes searched
+    """
+    _worker_search.search(game_state, root_moves, deadline)
+    return (
+        _worker_search.get_iterations(),
+        _worker_search.is_timed_out(),
+        _worker_search.get_node_count(),
+    )
+
+
+class ParallelSearch(Strategy):
+    def __init__(
+        self,
+        worker_count: int = CONSTANTS.AI_WORKER_COUNT,
+        time_budget: float = CONSTANTS.AI_TIME_BUDGET,
+        max_depth: int = MAX_PLY,
+        table_size_mb: float = CONSTANTS.AI_TRANSPOSITION_TABLE_MB,
+        tablebase: Tablebase | None = None,
+        opening_book: OpeningBook | None = None,
+    ) -> None:
+        """
+        Initialises root splitting search. The root moves are shared between worker processes that each run an alpha-beta search on their share until the deadline.
+        The workers read and write one transposition table in shared memory, so they reuse each other's results. The workers are started here, so the first move is not kept waiting for them
+
+        Args:
+            worker_count (int, optional): Number of worker processes. Defaults to CONSTANTS.AI_WORKER_COUNT.
+            time_budget (float, optional): Seconds allowed per move. Defaults to CONSTANTS.AI_TIME_BUDGET.
+            max_depth (int, optional): Deepest iteration to search. Defaults to MAX_PLY.
+            table_size_mb (float, optional): Memory cap of the shared transposition table in megabytes. Defaults to CONSTANTS.AI_TRANSPOSITION_TABLE_MB.
+            tablebase (Tablebase | None, optional): Endgame tablebase giving exact results once every piece is placed. Defaults to None for no tablebase.
+            opening_book (OpeningBook | None, optional): Opening book played instead of searching in the placement phase. Defaults to None for no book.
+        """
+        self._worker_count: int = max(1, worker_count)
+        self._time_budget: float = time_budget
+        self._max_depth: int = max_depth
+        self._table_size_mb: float = table_size_mb
+        self._tablebase: Tablebase | None = tablebase
+        self._opening_book: OpeningBook | None = opening_book
+        self._pool: Pool | None = None
+        self._transposition_table: SharedTranspositionTable | None = None
+        self._node_count: int = 0
+        self._completed_depth: int = 0
+        self._get_pool()
+
+    def choose_move(self, game_state: GameState) -> Move:
+        """
+        Chooses the best move of the deepest iteration completed by every worker
+
+        Args:
+            game_state (GameState): Game state to choose a move in
+
+        Returns:
+            Move: Best move found
+        """
+        return self.search(game_state)[0]
+
+    def search(self, game_state: GameState) -> Tuple[Move, int]:
+        """
+        Shares the root moves between the workers and combines their results
+
+        Args:
+            game_state (GameState): Game state to search, it is left unchanged
+
+        Raises:
+            Exception: No available moves
+
+        Returns:
+            Tuple[Move, int]: Best move and its score from the point of view of the side to move
+        """
+        deadline: float = time.monotonic() + self._time_budget
+        self._node_count = 0
+        self._completed_depth = 0
+
+        moves: List[Move] = generate_moves(game_state)
+        if not moves:
+            raise Exception("No available moves. Game should already be over")
+        if len(moves) == 1:
+            return moves[0], 0
+
+        if self._opening_book is not None:
+            book_entry: BookEntry | None = self._opening_book.get_best_entry(
+                game_state, moves
+            )
+            if book_entry is not None:
+                return book_entry.move, book_entry.score
+
+        if self._tablebase is not None:
+            tablebase_move = self._tablebase.get_best_move(game_state)
+            if tablebase_move is not None:
+                best_move, result = tablebase_move
+                return best_move, score_tablebase_result(result, 0)
+
+        # deal the moves forming a mill out first so every worker gets some
+        moves.sort(key=lambda move: move.remove is None)
+        shares: List[List[Move]] = [
+            moves[worker :: self._worker_count]
+            for worker in range(min(self._worker_count, len(moves)))
+        ]
+
+        # the workers share this process's clock, so starting them and sending the work counts against the deadline
+        game_state = game_state.copy()
+        results: List[ShareResult] = self._get_pool().starmap(
+            _search_share,
+            [(game_state, share, deadline - DISPATCH_MARGIN) for share in shares],
+        )
+        return self._combine_results(results, moves[0])
+
+    def get_worker_count(self) -> int:
+        """
+        Gets the number of worker processes
+
+        Returns:
+            int: Number of workers
+        """
+        return self._worker_count
+
+    def get_node_count(self) -> int:
+        """
+        Gets the number of nodes searched by every worker in the last search
+
+        Returns:
+            int: Number of nodes
+        """
+        return self._node_count
+
+    def get_completed_depth(self) -> int:
+        """
+        Gets the depth the best move of the last search was chosen at
+
+        Returns:
+            int: Depth in plies
+        """
+        return self._completed_depth
+
+    def get_transposition_table(self) -> SharedTranspositionTable | None:
+        """
+        Gets the transposition table shared by the workers
+
+        Returns:
+            SharedTranspositionTable | None: Transposition table, None before the first search
+        """
+        return self._transposition_table
+
+    def set_time_budget(self, time_budget: float) -> None:
+        """
+        Sets the time allowed per move
+
+        Args:
+            time_budget (float): Seconds allowed per move
+        """
+        self._time_budget = time_budget
+
+    def close(self) -> None:
+        """
+        Stops the worker processes and frees the shared transposition table, they are created again by the next search
+        """
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool = None
+        if self._transposition_table is not None:
+            self._transposition_table.close()
+            self._transposition_table = None
+
+    def _get_pool(self) -> Pool:
+        """
+        Gets the pool of worker processes, starting it on first use
+
+        Returns:
+            Pool: Pool of workers
+        """
+        if self._pool is None:
+            if self._transposition_table is None:
+                self._transposition_table = SharedTranspositionTable(
+                    self._table_size_mb
+                )
+            self._pool = multiprocessing.Pool(
+                self._worker_count,
+                _initialise_worker,
+                (self._max_depth, self._transposition_table, self._tablebase),
+            )
+            # stop the workers once this search is no longer used
+            weakref.finalize(self, self._pool.terminate)
+        return self._pool
+
+    def _combine_results(
+        self, results: List[ShareResult], default_move: Move
+    ) -> Tuple[Move, int]:
+        """
+        Picks the best move at the deepest iteration every worker completed. A worker that stopped early on a forced result keeps its last score for deeper iterations
+
+        Args:
+            results (List[ShareResult]): Result of each worker
+            default_move (Move): Move to play if no worker completed an iteration
+
+        Returns:
+            Tuple[Move, int]: Best move and its score
+        """
+        self._node_count = sum(node_count for _, _, node_count in results)
+        timed_out_depths: List[int] = [
+            len(iterations) for iterations, is_timed_out, _ in results if is_timed_out
+        ]
+        depth: int = (
+            min(timed_out_depths)
+            if timed_out_depths
+            else max(len(iterations) for iterations, _, _ in results)
+        )
+
+        best_move: Move = default_move
+        best_score: int | None = None
+        if depth:
+            for iterations, _, _ in results:
+                move, score = iterations[min(depth, len(iterations)) - 1]
+                if best_score is None or score > best_score:
+                    best_move, best_score = move, score
+
+        self._completed_depth = depth
+        return best_move, best_score if best_score is not None else 0
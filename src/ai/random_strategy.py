@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING
+
+from ai.strategy import Strategy
+from engine.move_generator import generate_moves
+
+if TYPE_CHECKING:
+    from engine.game_state import GameState
+    from engine.move import Move
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+
+class RandomStrategy(Strategy):
+    def __init__(self, seed: int | None = None) -> None:
+        """
+        Initialises random strategy, which picks uniformly from the legal moves
+
+        Args:
+            seed (int | None, optional): Seed for the random choices. Defaults to None.
+        """
+        self._random = random.Random(seed)
+
+    def choose_move(self, game_state: GameState) -> Move:
+        """
+        Chooses a random legal move
+
+        Args:
+            game_state (GameState): Game state to choose a move in
+
+        Raises:
+            Exception: No available moves
+
+        Returns:
+            Move: Randomly chosen move
+        """
+        moves = generate_moves(game_state)
+        if not moves:
+            raise Exception("No available moves. Game should already be over")
+        return self._random.choice(moves)
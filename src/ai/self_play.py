@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+from enum import Enum
+from typing import Any, Dict, List, NamedTuple
+
+import CONSTANTS
+from actions.move_type import MoveType
+from ai.alpha_beta_search import AlphaBetaSearch
+from ai.monte_carlo_tree_search import MonteCarloTreeSearch
+from ai.opening_book import OpeningBook
+from ai.random_strategy import RandomStrategy
+from ai.strategy import Strategy
+from ai.tablebase import Tablebase
+from ai.transposition_table import TranspositionTable
+from engine.game_state import GameState
+from engine.move import encode_move
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+# Names of the strategies games can be played between
+STRATEGY_NAMES = ("random", "alpha_beta", "monte_carlo")
+
+
+class EndReason(Enum):
+    """
+    Enum for why a game ended
+
+    Args:
+        Enum (Enum): Loser down to two pieces, loser unable to move, or the ply limit was reached
+    """
+
+    PIECES = "pieces"
+    BLOCKED = "blocked"
+    PLY_LIMIT = "ply_limit"
+
+
+class GameSettings(NamedTuple):
+    """
+    Responsible for the settings of one game, sent to the process playing it
+
+    Args:
+        NamedTuple (NamedTuple): Index of the game, seed for its random choices, strategy names of green and blue, seconds per move, ply limit and whether to record the moves
+    """
+
+    game: int
+    seed: int
+    green: str
+    blue: str
+    time_budget: float
+    max_plies: int
+    is_recording_moves: bool
+
+
+class GameRecord(NamedTuple):
+    """
+    Responsible for the result of one game
+
+    Args:
+        NamedTuple (NamedTuple): Settings, winner (True green, False blue, None for a draw), plies played, ply every piece was placed at and plies each player started flying at (None if never), why the game ended and the encoded moves if recorded
+    """
+
+    settings: GameSettings
+    winner: bool | None
+    plies: int
+    movement_ply: int | None
+    green_flying_ply: int | None
+    blue_flying_ply: int | None
+    reason: EndReason
+    moves: List[int]
+
+
+def create_game_settings(
+    game_count: int,
+    green: str,
+    blue: str,
+    is_swapping_colours: bool,
+    time_budget: float,
+    max_plies: int,
+    first_seed: int,
+    is_recording_moves: bool,
+) -> List[GameSettings]:
+    """
+    Creates the settings of a series of games between two strategies, each game seeded one higher than the last
+
+    Args:
+        game_count (int): Number of games
+        green (str): Strategy name playing green, or in even games if swapping colours
+        blue (str): Strategy name playing blue, or in even games if swapping colours
+        is_swapping_colours (bool): True to swap the strategies' colours every other game
+        time_budget (float): Seconds allowed per move
+        max_plies (int): Plies a game may last before it counts as a draw
+        first_seed (int): Seed of the first game
+        is_recording_moves (bool): True to record the moves of every game
+
+    Returns:
+        List[GameSettings]: Settings of each game
+    """
+    games: List[GameSettings] = []
+    for game in range(game_count):
+        is_swapped: bool = is_swapping_colours and game % 2 == 1
+        games.append(
+            GameSettings(
+                game,
+                first_seed + game,
+                blue if is_swapped else green,
+                green if is_swapped else blue,
+                time_budget,
+                max_plies,
+                is_recording_moves,
+            )
+        )
+    return games
+
+
+def create_strategy(name: str, time_budget: float, seed: int) -> Strategy:
+    """
+    Creates a strategy from its name
+
+    Args:
+        name (str): One of STRATEGY_NAMES
+        time_budget (float): Seconds allowed per move
+        seed (int): Seed for random choices
+
+    Raises:
+        Exception: Unknown strategy name
+
+    Returns:
+        Strategy: New strategy
+    """
+    if name == "random":
+        return RandomStrategy(seed)
+    if name == "alpha_beta":
+        return AlphaBetaSearch(
+            time_budget,
+            transposition_table=TranspositionTable(),
+            tablebase=Tablebase(),
+            opening_book=OpeningBook(),
+        )
+    if name == "monte_carlo":
+        return MonteCarloTreeSearch(time_budget, seed=seed)
+    raise Exception(f"Unknown strategy {name}, expected one of {STRATEGY_NAMES}")
+
+
+def play_game(settings: GameSettings) -> GameRecord:
+    """
+    Plays a game between two strategies on a game state, with no display, sound or delays
+
+    Args:
+        settings (GameSettings): Settings of the game
+
+    Returns:
+        GameRecord: Result of the game
+    """
+    strategies: Dict[bool, Strategy] = {
+        True: create_strategy(settings.green, settings.time_budget, 2 * settings.seed),
+        False: create_strategy(
+            settings.blue, settings.time_budget, 2 * settings.seed + 1
+        ),
+    }
+    game_state = GameState()
+    movement_ply: int | None = None
+    flying_plies: Dict[bool, int | None] = {True: None, False: None}
+    moves: List[int] = []
+    ply: int = 0
+
+    while game_state.get_winner() is None and ply < settings.max_plies:
+        is_green: bool = game_state.get_is_green_to_move()
+        if movement_ply is None and game_state.is_pieces_placed():
+            movement_ply = ply
+        if (
+            flying_plies[is_green] is None
+            and game_state.get_move_type() == MoveType.FLY
+        ):
+            flying_plies[is_green] = ply
+
+        move = strategies[is_green].choose_move(game_state.copy())
+        game_state.make_move(move)
+        if settings.is_recording_moves:
+            moves.append(encode_move(move))
+        ply += 1
+
+    winner: bool | None = game_state.get_winner()
+    if winner is None:
+        reason: EndReason = EndReason.PLY_LIMIT
+    elif game_state.count_pieces(not winner) <= CONSTANTS.LOSING_PIECE_COUNT:
+        reason = EndReason.PIECES
+    else:
+        reason = EndReason.BLOCKED
+
+    return GameRecord(
+        settings,
+        winner,
+        ply,
+        movement_ply,
+        flying_plies[True],
+        flying_plies[False],
+        reason,
+        moves,
+    )
+
+
+def record_to_dict(record: GameRecord) -> Dict[str, Any]:
+    """
+    Converts a game record to a dictionary that can be written as JSON
+
+    Args:
+        record (GameRecord): Game record
+
+    Returns:
+        Dict[str, Any]: Fields of the record, the moves only if they were recorded
+    """
+    fields: Dict[str, Any] = {
+        "game": record.settings.game,
+        "seed": record.settings.seed,
+        "green": record.settings.green,
+        "blue": record.settings.blue,
+        "winner": (
+            "draw" if record.winner is None else "green" if record.winner else "blue"
+        ),
+        "reason": record.reason.value,
+        "plies": record.plies,
+        "movement_ply": record.movement_ply,
+        "green_flying_ply": record.green_flying_ply,
+        "blue_flying_ply": record.blue_flying_ply,
+    }
+    if record.settings.is_recording_moves:
+        fields["moves"] = record.moves
+    return fields
@@ -0,0 +1,566 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+import threading
+import time
+from collections import deque
+from typing import Any, BinaryIO, Callable, Deque, Dict, Iterator, List, Set, Tuple
+
+from ai.alpha_beta_search import AlphaBetaSearch
+from ai.self_play import GameSettings, play_game, record_to_dict
+from ai.tablebase import Tablebase
+from ai.transposition_table import TranspositionTable
+from engine.game_state import GameState
+from engine.move import decode_move, encode_move
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+# Host and port, or the path of a Unix socket
+Address = Tuple[str, int] | str
+
+# A task or a result, sent as one line of JSON
+Message = Dict[str, Any]
+
+# Tasks handed to a worker when it asks for work
+BATCH_SIZE = 4
+
+# Times a task is handed out before it counts as failed, more than one so tasks of workers that die are retried
+MAX_ATTEMPTS = 3
+
+# Seconds a worker keeps trying to connect to a coordinator that has not started yet
+CONNECT_TIMEOUT = 10.0
+
+# Multiple of the longest a batch of tasks should take that a worker may stay silent for before it counts as dead, as the search overruns its budget a little on every move
+WORKER_TIMEOUT_FACTOR = 2.0
+
+# Fewest seconds a worker may stay silent, so batches of quick tasks are not cut short by a slow start
+MIN_WORKER_TIMEOUT = 30.0
+
+# Seconds a TCP connection is idle before the operating system checks the worker's machine is still there, then between checks
+KEEPALIVE_INTERVAL = 60
+
+
+def create_game_task(settings: GameSettings) -> Message:
+    """
+    Creates a task playing a game, its result is the game record as a dictionary
+
+    Args:
+        settings (GameSettings): Settings of the game
+
+    Returns:
+        Message: Task
+    """
+    return {"kind": "game", "settings": settings._asdict()}
+
+
+def create_position_task(moves: List[int], time_budget: float) -> Message:
+    """
+    Creates a task searching the position after some moves from the start, its result is the best move, score and depth searched
+
+    Args:
+        moves (List[int]): Encoded moves leading to the position
+        time_budget (float): Seconds to search for
+
+    Returns:
+        Message: Task
+    """
+    return {"kind": "position", "moves": moves, "time_budget": time_budget}
+
+
+def run_task(task: Message) -> Message:
+    """
+    Runs a task created by create_game_task or create_position_task
+
+    Args:
+        task (Message): Task
+
+    Raises:
+        Exception: Unknown task kind
+
+    Returns:
+        Message: Result of the task
+    """
+    if task["kind"] == "game":
+        return record_to_dict(play_game(GameSettings(**task["settings"])))
+
+    if task["kind"] == "position":
+        game_state = GameState()
+        for move in task["moves"]:
+            game_state.make_move(decode_move(move))
+        search = AlphaBetaSearch(
+            task["time_budget"],
+            transposition_table=TranspositionTable(),
+            tablebase=Tablebase(),
+        )
+        move, score = search.search(game_state)
+        return {
+            "move": encode_move(move),
+            "score": score,
+            "depth": search.get_completed_depth(),
+        }
+
+    raise Exception(f"Unknown task kind {task['kind']}")
+
+
+def get_task_time(task: Message) -> float:
+    """
+    Gets the most seconds a task should take, from the time budget of each move searched
+
+    Args:
+        task (Message): Task created by create_game_task or create_position_task
+
+    Returns:
+        float: Seconds
+    """
+    if task["kind"] == "game":
+        return task["settings"]["time_budget"] * task["settings"]["max_plies"]
+    return task["time_budget"]
+
+
+def get_worker_timeout(tasks: List[Message], batch_size: int = BATCH_SIZE) -> float:
+    """
+    Gets the seconds a worker may stay silent before it counts as dead, long enough for a batch of the longest task
+
+    Args:
+        tasks (List[Message]): Tasks to run
+        batch_size (int, optional): Tasks handed to a worker when it asks for work. Defaults to BATCH_SIZE.
+
+    Returns:
+        float: Seconds
+    """
+    longest_time: float = max((get_task_time(task) for task in tasks), default=0)
+    return max(
+        MIN_WORKER_TIMEOUT, longest_time * max(1, batch_size) * WORKER_TIMEOUT_FACTOR
+    )
+
+
+def run_worker(address: Address, connect_timeout: float = CONNECT_TIMEOUT) -> int:
+    """
+    Connects to a coordinator and runs the tasks it hands out until every task is done.
+    Each result is sent as soon as its task finishes, and the coordinator's reply says which of the worker's remaining tasks were stolen by idle workers
+
+    Args:
+        address (Address): Address of the coordinator
+        connect_timeout (float, optional): Seconds to keep trying to connect. Defaults to CONNECT_TIMEOUT.
+
+    Returns:
+        int: Number of tasks run
+    """
+    connection: socket.socket = _connect(address, connect_timeout)
+    task_count: int = 0
+    with connection, connection.makefile("rwb") as stream:
+        try:
+            while True:
+                _send_message(stream, {"type": "request"})
+                reply: Message | None = _receive_message(stream)
+                if reply is None or reply["type"] == "done":
+                    return task_count
+
+                batch: Deque[Message] = deque(reply["tasks"])
+                while batch:
+                    entry: Message = batch.popleft()
+                    result: Message = run_task(entry["task"])
+                    task_count += 1
+                    _send_message(
+                        stream, {"type": "result", "id": entry["id"], "result": result}
+                    )
+                    reply = _receive_message(stream)
+                    if reply is None:
+                        return task_count
+                    stolen_ids: Set[int] = set(reply["stolen"])
+                    batch = deque(
+                        entry for entry in batch if entry["id"] not in stolen_ids
+                    )
+        except ConnectionError:
+            # the coordinator stopped, so there is nothing left to do
+            return task_count
+
+
+class SelfPlayCoordinator:
+    def __init__(
+        self,
+        tasks: List[Message],
+        address: Address = ("127.0.0.1", 0),
+        batch_size: int = BATCH_SIZE,
+        max_attempts: int = MAX_ATTEMPTS,
+        worker_timeout: float | None = None,
+    ) -> None:
+        """
+        Initialises coordinator handing out tasks to workers over TCP or Unix sockets.
+        Workers ask for a batch of tasks at a time, an idle worker steals the back half of the busiest worker's unstarted tasks once none are left to hand out,
+        tasks of a worker that disconnects go back to the front of the queue, and results are released in task order
+
+        Args:
+            tasks (List[Message]): Tasks to run
+            address (Address, optional): Address to listen on, a port of 0 picks a free port. Defaults to ("127.0.0.1", 0).
+            batch_size (int, optional): Tasks handed to a worker when it asks for work. Defaults to BATCH_SIZE.
+            max_attempts (int, optional): Times a task is handed out before it counts as failed. Defaults to MAX_ATTEMPTS.
+            worker_timeout (float | None, optional): Seconds of silence after which a worker counts as dead and its tasks are handed out again, 0 to wait for the connection to close.
+                Defaults to None for get_worker_timeout of the tasks.
+        """
+        self._tasks: List[Message] = tasks
+        self._address: Address = address
+        self._batch_size: int = max(1, batch_size)
+        self._max_attempts: int = max(1, max_attempts)
+        self._worker_timeout: float | None = (
+            get_worker_timeout(tasks, batch_size)
+            if worker_timeout is None
+            else worker_timeout or None
+        )
+        self._listener: socket.socket | None = None
+        self._threads: List[threading.Thread] = []
+        self._condition = threading.Condition()
+        self._pending: Deque[int] = deque(range(len(tasks)))
+        # tasks of each worker in the order it runs them, the first is running
+        self._assigned: Dict[int, Deque[int]] = {}
+        self._stolen: Dict[int, List[int]] = {}
+        self._attempts: List[int] = [0] * len(tasks)
+        self._results: Dict[int, Message | None] = {}
+        self._next_worker: int = 0
+        self._steal_count: int = 0
+        self._retry_count: int = 0
+        self._failed_count: int = 0
+
+    def start(self) -> Address:
+        """
+        Starts listening for workers
+
+        Returns:
+            Address: Address workers connect to
+        """
+        if isinstance(self._address, str):
+            if os.path.exists(self._address):
+                os.remove(self._address)
+            self._listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listener.bind(self._address)
+        self._listener.listen()
+        self._address = self._listener.getsockname()
+        threading.Thread(target=self._accept_workers, daemon=True).start()
+        return self._address
+
+    def get_address(self) -> Address:
+        """
+        Gets the address workers connect to
+
+        Returns:
+            Address: Address
+        """
+        return self._address
+
+    def get_worker_timeout(self) -> float | None:
+        """
+        Gets the seconds of silence after which a worker counts as dead
+
+        Returns:
+            float | None: Seconds, None to wait for the connection to close
+        """
+        return self._worker_timeout
+
+    def get_steal_count(self) -> int:
+        """
+        Gets the number of times an idle worker stole tasks
+
+        Returns:
+            int: Number of steals
+        """
+        return self._steal_count
+
+    def get_retry_count(self) -> int:
+        """
+        Gets the number of tasks handed out again after their worker died
+
+        Returns:
+            int: Number of retries
+        """
+        return self._retry_count
+
+    def get_failed_count(self) -> int:
+        """
+        Gets the number of tasks that failed every attempt
+
+        Returns:
+            int: Number of failed tasks
+        """
+        return self._failed_count
+
+    def iter_results(self) -> Iterator[Message | None]:
+        """
+        Waits for the results and yields them in task order, each as soon as every earlier task has finished
+
+        Returns:
+            Iterator[Message | None]: Result of each task, None if it failed every attempt
+        """
+        for index in range(len(self._tasks)):
+            with self._condition:
+                self._condition.wait_for(lambda: index in self._results)
+                result: Message | None = self._results[index]
+            yield result
+
+    def run(
+        self, on_result: Callable[[int, Message | None], None] | None = None
+    ) -> List[Message | None]:
+        """
+        Starts the coordinator if needed and waits for every task
+
+        Args:
+            on_result (Callable[[int, Message | None], None] | None, optional): Called with the index and result of each task in task order. Defaults to None.
+
+        Returns:
+            List[Message | None]: Result of each task, None if it failed every attempt
+        """
+        if self._listener is None:
+            self.start()
+        results: List[Message | None] = []
+        for index, result in enumerate(self.iter_results()):
+            if on_result is not None:
+                on_result(index, result)
+            results.append(result)
+        return results
+
+    def close(self, timeout: float = 1.0) -> None:
+        """
+        Stops listening for workers and gives the threads serving them time to tell them every task is done
+
+        Args:
+            timeout (float, optional): Seconds to wait for each thread. Defaults to 1.0.
+        """
+        for thread in self._threads:
+            thread.join(timeout)
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+            if isinstance(self._address, str) and os.path.exists(self._address):
+                os.remove(self._address)
+
+    def _accept_workers(self) -> None:
+        """
+        Accepts worker connections, serving each on its own thread
+        """
+        while self._listener is not None:
+            try:
+                connection, _ = self._listener.accept()
+            except OSError:
+                return
+            with self._condition:
+                worker: int = self._next_worker
+                self._next_worker += 1
+            thread = threading.Thread(
+                target=self._serve_worker, args=(worker, connection), daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def _serve_worker(self, worker: int, connection: socket.socket) -> None:
+        """
+        Answers a worker's requests for work and records its results, returning its tasks to the queue if it disconnects
+
+        Args:
+            worker (int): Identifier of the worker
+            connection (socket.socket): Connection to the worker
+        """
+        connection.settimeout(self._worker_timeout)
+        if connection.family == socket.AF_INET:
+            # a worker whose machine went away never closes the connection, so have the operating system check on it
+            connection.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                connection.setsockopt(
+                    socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, KEEPALIVE_INTERVAL
+                )
+                connection.setsockopt(
+                    socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, KEEPALIVE_INTERVAL
+                )
+        try:
+            with connection, connection.makefile("rwb") as stream:
+                while True:
+                    message: Message | None = _receive_message(stream)
+                    if message is None:
+                        break
+
+                    if message["type"] == "request":
+                        task_ids: List[int] | None = self._assign_tasks(worker)
+                        if task_ids is None:
+                            _send_message(stream, {"type": "done"})
+                            break
+                        _send_message(
+                            stream,
+                            {
+                                "type": "batch",
+                                "tasks": [
+                                    {"id": task_id, "task": self._tasks[task_id]}
+                                    for task_id in task_ids
+                                ],
+                            },
+                        )
+                    elif message["type"] == "result":
+                        stolen_ids: List[int] = self._complete_task(
+                            worker, message["id"], message["result"]
+                        )
+                        _send_message(stream, {"type": "ack", "stolen": stolen_ids})
+        except (OSError, ValueError, KeyError):
+            pass
+        finally:
+            self._release_worker(worker)
+
+    def _assign_tasks(self, worker: int) -> List[int] | None:
+        """
+        Gives a worker a batch of tasks from the queue, or steals some from the busiest worker, waiting until there are tasks or every task is done
+
+        Args:
+            worker (int): Identifier of the worker asking for work
+
+        Returns:
+            List[int] | None: Identifiers of the tasks, None once every task is done
+        """
+        with self._condition:
+            while len(self._results) < len(self._tasks):
+                task_ids: List[int] = []
+                if self._pending:
+                    while self._pending and len(task_ids) < self._batch_size:
+                        task_ids.append(self._pending.popleft())
+                else:
+                    task_ids = self._steal_tasks(worker)
+
+                if task_ids:
+                    for task_id in task_ids:
+                        self._attempts[task_id] += 1
+                    self._assigned[worker] = deque(task_ids)
+                    return task_ids
+                self._condition.wait()
+            return None
+
+    def _steal_tasks(self, thief: int) -> List[int]:
+        """
+        Takes the back half of the unstarted tasks of the worker with the most, telling it with its next acknowledgement. Called with the lock held
+
+        Args:
+            thief (int): Identifier of the idle worker
+
+        Returns:
+            List[int]: Identifiers of the stolen tasks, empty if no worker has an unstarted task
+        """
+        victim: int | None = None
+        for worker, task_ids in self._assigned.items():
+            if worker != thief and len(task_ids) > 1:
+                if victim is None or len(task_ids) > len(self._assigned[victim]):
+                    victim = worker
+        if victim is None:
+            return []
+
+        victim_ids: Deque[int] = self._assigned[victim]
+        stolen_ids: List[int] = [victim_ids.pop() for _ in range(len(victim_ids) // 2)][
+            ::-1
+        ]
+        self._stolen.setdefault(victim, []).extend(stolen_ids)
+        self._steal_count += 1
+        # the stolen tasks were counted as handed out when the victim got them
+        for task_id in stolen_ids:
+            self._attempts[task_id] -= 1
+        return stolen_ids
+
+    def _complete_task(self, worker: int, task_id: int, result: Message) -> List[int]:
+        """
+        Records a task's result
+
+        Args:
+            worker (int): Identifier of the worker that ran the task
+            task_id (int): Identifier of the task
+            result (Message): Result of the task
+
+        Returns:
+            List[int]: Tasks stolen from the worker since its last acknowledgement, it must skip them
+        """
+        with self._condition:
+            task_ids: Deque[int] | None = self._assigned.get(worker)
+            if task_ids is not None and task_id in task_ids:
+                task_ids.remove(task_id)
+            if task_id not in self._results:
+                self._results[task_id] = result
+            self._condition.notify_all()
+            return self._stolen.pop(worker, [])
+
+    def _release_worker(self, worker: int) -> None:
+        """
+        Returns the unfinished tasks of a worker that disconnected to the front of the queue.
+        Only the task it was running counts as an attempt, and fails once out of attempts
+
+        Args:
+            worker (int): Identifier of the worker
+        """
+        with self._condition:
+            task_ids: Deque[int] = self._assigned.pop(worker, deque())
+            self._stolen.pop(worker, None)
+            for position in range(len(task_ids) - 1, -1, -1):
+                task_id: int = task_ids[position]
+                if position > 0:
+                    # never started
+                    self._attempts[task_id] -= 1
+                elif self._attempts[task_id] >= self._max_attempts:
+                    self._results[task_id] = None
+                    self._failed_count += 1
+                    continue
+                else:
+                    self._retry_count += 1
+                self._pending.appendleft(task_id)
+            self._condition.notify_all()
+
+
+def _connect(address: Address, connect_timeout: float) -> socket.socket:
+    """
+    Connects to a coordinator, retrying until it is listening
+
+    Args:
+        address (Address): Address of the coordinator
+        connect_timeout (float): Seconds to keep trying
+
+    Raises:
+        OSError: The coordinator could not be reached in time
+
+    Returns:
+        socket.socket: Connection
+    """
+    deadline: float = time.monotonic() + connect_timeout
+    while True:
+        family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+        connection = socket.socket(family, socket.SOCK_STREAM)
+        try:
+            connection.connect(address if isinstance(address, str) else tuple(address))
+            return connection
+        except OSError:
+            connection.close()
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.1)
+
+
+def _send_message(stream: BinaryIO, message: Message) -> None:
+    """
+    Sends a message as one line of JSON
+
+    Args:
+        stream (BinaryIO): Stream of the connection
+        message (Message): Message
+    """
+    stream.write(json.dumps(message, separators=(",", ":")).encode() + b"\n")
+    stream.flush()
+
+
+def _receive_message(stream: BinaryIO) -> Message | None:
+    """
+    Receives a message sent by _send_message
+
+    Args:
+        stream (BinaryIO): Stream of the connection
+
+    Returns:
+        Message | None: Message, None if the connection closed
+    """
+    line: bytes = stream.readline()
+    if not line:
+        return None
+    return json.loads(line)
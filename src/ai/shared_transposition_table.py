@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import weakref
+from multiprocessing.shared_memory import SharedMemory
+from typing import Tuple
+
+import CONSTANTS
+from ai.transposition_table import (
+    BUCKET_SIZE,
+    ENTRY_SIZE,
+    Bound,
+    TableEntry,
+    TranspositionTable,
+    pack_entry,
+    unpack_entry,
+)
+from engine.move import Move
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+
+def _release_shared_memory(
+    shared_memory: SharedMemory, views: Tuple[memoryview, ...], is_owner: bool
+) -> None:
+    """
+    Releases a process's mapping of a shared table, removing the block if the process created it
+
+    Args:
+        shared_memory (SharedMemory): Shared memory block
+        views (Tuple[memoryview, ...]): Views of the block, released before the block is closed
+        is_owner (bool): True if the process created the block
+    """
+    for view in views:
+        view.release()
+    shared_memory.close()
+    if is_owner:
+        shared_memory.unlink()
+
+
+def _attach_shared_memory(name: str) -> SharedMemory:
+    """
+    Attaches to a shared memory block created by another process without taking over its clean up
+
+    Args:
+        name (str): Name of the block
+
+    Returns:
+        SharedMemory: Shared memory block
+    """
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:
+        # before Python 3.13 the block is also registered with the resource tracker, which worker processes share with their parent
+        return SharedMemory(name=name)
+
+
+class SharedTranspositionTable(TranspositionTable):
+    def __init__(
+        self,
+        size_mb: float = CONSTANTS.AI_TRANSPOSITION_TABLE_MB,
+        name: str | None = None,
+    ) -> None:
+        """
+        Initialises a transposition table in shared memory that every process attached to it reads and writes.
+        Entries are stored as the key XORed with the data, so an entry torn by writes from two processes fails to verify and reads as a miss, no locks are needed
+
+        Args:
+            size_mb (float, optional): Memory cap in megabytes, must match the creator when attaching. Defaults to CONSTANTS.AI_TRANSPOSITION_TABLE_MB.
+            name (str | None, optional): Name of a table to attach to. Defaults to None to create a new table.
+        """
+        self._size_mb: float = size_mb
+        self._name: str | None = name
+        self._shared_memory: SharedMemory | None = None
+        self._finalizer: weakref.finalize | None = None
+        super().__init__(size_mb)
+
+    def __getstate__(self) -> Tuple[float, str]:
+        """
+        Pickles the table as its name so another process attaches to the same memory
+
+        Returns:
+            Tuple[float, str]: Memory cap in megabytes and name of the table
+        """
+        return self._size_mb, self._name
+
+    def __setstate__(self, state: Tuple[float, str]) -> None:
+        """
+        Attaches to the table a pickle was made from
+
+        Args:
+            state (Tuple[float, str]): Memory cap in megabytes and name of the table
+        """
+        self.__init__(*state)
+
+    def get_name(self) -> str:
+        """
+        Gets the name other processes attach to the table with
+
+        Returns:
+            str: Name of the shared memory block
+        """
+        return self._name
+
+    def close(self) -> None:
+        """
+        Detaches this process from the table, the creator also frees the memory
+        """
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+            self._shared_memory = None
+
+    def probe(self, key: int) -> TableEntry | None:
+        """
+        Looks up a position, entries that fail to verify are misses
+
+        Args:
+            key (int): Zobrist hash of the position
+
+        Returns:
+            TableEntry | None: Stored entry, None if the position is not stored
+        """
+        slot: int = (key & self._bucket_mask) * BUCKET_SIZE
+        is_occupied: bool = False
+
+        for offset in range(BUCKET_SIZE):
+            data: int = self._data[slot + offset]
+            if data and self._keys[slot + offset] ^ data == key:
+                self._hits += 1
+                return unpack_entry(data)
+            is_occupied = is_occupied or data != 0
+
+        self._misses += 1
+        if is_occupied:
+            self._collisions += 1
+        return None
+
+    def store(
+        self, key: int, depth: int, score: int, bound: Bound, best_move: Move | None
+    ) -> None:
+        """
+        Stores a position. It goes in the depth-preferred slot if it is the same position, searched at least as deep or the slot does not verify, otherwise in the always-replace slot
+
+        Args:
+            key (int): Zobrist hash of the position
+            depth (int): Depth searched
+            score (int): Score
+            bound (Bound): Bound type of the score
+            best_move (Move | None): Best move found
+        """
+        slot: int = (key & self._bucket_mask) * BUCKET_SIZE
+        data: int = pack_entry(depth, score, bound, best_move)
+        stored_data: int = self._data[slot]
+
+        if (
+            not stored_data
+            or self._keys[slot] ^ stored_data == key
+            or depth >= stored_data >> 16 & 0xFF
+        ):
+            self._data[slot] = data
+            self._keys[slot] = key ^ data
+        else:
+            self._data[slot + 1] = data
+            self._keys[slot + 1] = key ^ data
+
+    def _allocate(self, entry_count: int) -> None:
+        """
+        Creates or attaches to the shared memory, clearing it if this process already has it
+
+        Args:
+            entry_count (int): Number of entries
+        """
+        if self._shared_memory is not None:
+            self._shared_memory.buf[: entry_count * ENTRY_SIZE] = bytes(
+                entry_count * ENTRY_SIZE
+            )
+            return
+
+        is_owner: bool = self._name is None
+        if is_owner:
+            # new shared memory is filled with zeros, which are empty entries
+            self._shared_memory = SharedMemory(
+                create=True, size=entry_count * ENTRY_SIZE
+            )
+            self._name = self._shared_memory.name
+        else:
+            self._shared_memory = _attach_shared_memory(self._name)
+
+        words: memoryview = self._shared_memory.buf[: entry_count * ENTRY_SIZE].cast(
+            "Q"
+        )
+        self._keys = words[:entry_count]
+        self._data = words[entry_count:]
+        self._finalizer = weakref.finalize(
+            self,
+            _release_shared_memory,
+            self._shared_memory,
+            (self._keys, self._data, words),
+            is_owner,
+        )
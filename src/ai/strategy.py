@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from engine.game_state import GameState
+    from engine.move import Move
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+
+class Strategy(ABC):
+    @abstractmethod
+    def choose_move(self, game_state: GameState) -> Move:
+        """
+        Abstract method for choosing a move for the side to move
+
+        Args:
+            game_state (GameState): Game state to choose a move in, may be changed by the strategy
+
+        Returns:
+            Move: Chosen move
+        """
+        raise NotImplementedError
+
+    def set_is_stopped(self, is_stopped: bool) -> None:
+        """
+        Stops searches running on another thread, which return the best move found so far, until set back to False. Does nothing by default
+
+        Args:
+            is_stopped (bool): True to stop searching
+        """
+
+    def close(self) -> None:
+        """
+        Frees what the strategy keeps between moves, such as worker processes. Does nothing by default
+        """
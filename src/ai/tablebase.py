@@ -0,0 +1,410 @@
+from __future__ import annotations
+
+import math
+import mmap
+import os
+import struct
+from enum import IntEnum
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Tuple
+
+import CONSTANTS
+from engine.board_layout import BOARD_SIZE
+from engine.move_generator import generate_moves
+from engine.symmetry import canonicalise_masks
+
+if TYPE_CHECKING:
+    from engine.game_state import GameState
+    from engine.move import Move
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+# Shard file header: magic, version, pieces of the side to move, pieces of the opponent, number of canonical mover placements and number of opponent placements per mover placement
+HEADER_FORMAT = "<4sBBBxII"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+MAGIC = b"NMTB"
+VERSION = 1
+
+# Ordinal of a mover placement that is not canonical
+NOT_CANONICAL = 0xFFFFFFFF
+
+# Formats of a mover ordinal and of a stored value
+ORDINAL_FORMAT = "<I"
+VALUE_FORMAT = "<h"
+
+# Stored value of a draw, wins are stored as the plies to win and losses as minus one more than the plies to lose
+DRAW_VALUE = 0
+
+# Binomial coefficients, indexed [n][k]
+BINOMIALS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(math.comb(n, k) for k in range(CONSTANTS.PIECES_PER_PLAYER + 1))
+    for n in range(BOARD_SIZE + 1)
+)
+
+
+class Outcome(IntEnum):
+    """
+    Enum for the result of a position with perfect play, from the point of view of the side to move
+
+    Args:
+        IntEnum (IntEnum): Loss, draw or win
+    """
+
+    LOSS = -1
+    DRAW = 0
+    WIN = 1
+
+
+class TablebaseResult(NamedTuple):
+    """
+    Responsible for a position read from the tablebase
+
+    Args:
+        NamedTuple (NamedTuple): Outcome for the side to move and plies until the game ends with perfect play, 0 for a draw
+    """
+
+    outcome: Outcome
+    distance: int
+
+
+def encode_result(outcome: Outcome, distance: int) -> int:
+    """
+    Encodes a result as a stored value
+
+    Args:
+        outcome (Outcome): Outcome for the side to move
+        distance (int): Plies until the game ends
+
+    Returns:
+        int: Stored value
+    """
+    if outcome == Outcome.WIN:
+        return distance
+    if outcome == Outcome.LOSS:
+        return -distance - 1
+    return DRAW_VALUE
+
+
+def decode_result(value: int) -> TablebaseResult:
+    """
+    Decodes a stored value
+
+    Args:
+        value (int): Stored value
+
+    Returns:
+        TablebaseResult: Outcome and distance
+    """
+    if value > 0:
+        return TablebaseResult(Outcome.WIN, value)
+    if value < 0:
+        return TablebaseResult(Outcome.LOSS, -value - 1)
+    return TablebaseResult(Outcome.DRAW, 0)
+
+
+def rank_placement(mask: int) -> int:
+    """
+    Ranks a placement of pieces among every placement of as many pieces, in colexicographic order
+
+    Args:
+        mask (int): Bitmask of the pieces
+
+    Returns:
+        int: Rank of the placement
+    """
+    rank: int = 0
+    count: int = 0
+    while mask:
+        lowest_bit: int = mask & -mask
+        count += 1
+        rank += BINOMIALS[lowest_bit.bit_length() - 1][count]
+        mask ^= lowest_bit
+    return rank
+
+
+def rank_opponent_placement(mover_mask: int, opponent_mask: int) -> int:
+    """
+    Ranks the placement of the opponent's pieces among the points left empty by the side to move
+
+    Args:
+        mover_mask (int): Bitmask of the pieces of the side to move
+        opponent_mask (int): Bitmask of the pieces of the opponent
+
+    Returns:
+        int: Rank of the placement
+    """
+    rank: int = 0
+    count: int = 0
+    while opponent_mask:
+        lowest_bit: int = opponent_mask & -opponent_mask
+        count += 1
+        # position among the points not taken by the side to move
+        point: int = (
+            lowest_bit.bit_length() - 1 - (mover_mask & (lowest_bit - 1)).bit_count()
+        )
+        rank += BINOMIALS[point][count]
+        opponent_mask ^= lowest_bit
+    return rank
+
+
+def get_shard_path(directory: str, mover_count: int, opponent_count: int) -> str:
+    """
+    Gets the path of the shard file for some piece counts
+
+    Args:
+        directory (str): Directory of the tablebase
+        mover_count (int): Pieces of the side to move
+        opponent_count (int): Pieces of the opponent
+
+    Returns:
+        str: Path of the shard file
+    """
+    return os.path.join(directory, f"{mover_count}v{opponent_count}.tb")
+
+
+class Shard(NamedTuple):
+    """
+    Responsible for an open shard file
+
+    Args:
+        NamedTuple (NamedTuple): Memory map of the file, opponent placements per mover placement and offset of the values
+    """
+
+    memory_map: mmap.mmap
+    opponent_placements: int
+    values_offset: int
+
+
+class Tablebase:
+    def __init__(self, directory: str = CONSTANTS.TABLEBASE_DIRECTORY) -> None:
+        """
+        Initialises tablebase prober. Shard files are memory mapped when first probed, so nothing is read up front and lookups only touch the pages they need
+
+        Args:
+            directory (str, optional): Directory of the shard files. Defaults to CONSTANTS.TABLEBASE_DIRECTORY.
+        """
+        self._directory: str = directory
+        self._shards: Dict[Tuple[int, int], Shard | None] = {}
+
+    def __getstate__(self) -> str:
+        """
+        Pickles the prober as its directory, the shards are mapped again by each process
+
+        Returns:
+            str: Directory of the shard files
+        """
+        return self._directory
+
+    def __setstate__(self, directory: str) -> None:
+        """
+        Creates the prober a pickle was made from
+
+        Args:
+            directory (str): Directory of the shard files
+        """
+        self.__init__(directory)
+
+    def get_directory(self) -> str:
+        """
+        Gets the directory of the shard files
+
+        Returns:
+            str: Directory
+        """
+        return self._directory
+
+    def probe(self, game_state: GameState) -> TablebaseResult | None:
+        """
+        Looks up the result of a position with perfect play
+
+        Args:
+            game_state (GameState): Game state to look up
+
+        Returns:
+            TablebaseResult | None: Result for the side to move, None if the position is not covered by the tablebase
+        """
+        if not game_state.is_pieces_placed() or game_state.is_pending_remove():
+            return None
+
+        bitboard = game_state.get_bitboard()
+        is_green: bool = bitboard.get_is_green_to_move()
+        mover_mask: int = bitboard.get_colour_mask(is_green)
+        opponent_mask: int = bitboard.get_colour_mask(not is_green)
+        return self.probe_masks(mover_mask, opponent_mask)
+
+    def probe_masks(
+        self, mover_mask: int, opponent_mask: int
+    ) -> TablebaseResult | None:
+        """
+        Looks up the result of a position with every piece placed
+
+        Args:
+            mover_mask (int): Bitmask of the pieces of the side to move
+            opponent_mask (int): Bitmask of the pieces of the opponent
+
+        Returns:
+            TablebaseResult | None: Result for the side to move, None if the position is not covered by the tablebase
+        """
+        value: int | None = self.probe_value(mover_mask, opponent_mask)
+        return None if value is None else decode_result(value)
+
+    def probe_value(self, mover_mask: int, opponent_mask: int) -> int | None:
+        """
+        Looks up the stored value of a position with every piece placed
+
+        Args:
+            mover_mask (int): Bitmask of the pieces of the side to move
+            opponent_mask (int): Bitmask of the pieces of the opponent
+
+        Returns:
+            int | None: Stored value, None if the position is not covered by the tablebase
+        """
+        mover_count: int = mover_mask.bit_count()
+        opponent_count: int = opponent_mask.bit_count()
+        if (
+            mover_count <= CONSTANTS.LOSING_PIECE_COUNT
+            or opponent_count <= CONSTANTS.LOSING_PIECE_COUNT
+        ):
+            return None
+
+        shard: Shard | None = self._get_shard(mover_count, opponent_count)
+        if shard is None:
+            return None
+
+        mover_mask, opponent_mask, _ = canonicalise_masks(mover_mask, opponent_mask)
+        (ordinal,) = struct.unpack_from(
+            ORDINAL_FORMAT,
+            shard.memory_map,
+            HEADER_SIZE + rank_placement(mover_mask) * struct.calcsize(ORDINAL_FORMAT),
+        )
+        index: int = ordinal * shard.opponent_placements + rank_opponent_placement(
+            mover_mask, opponent_mask
+        )
+        (value,) = struct.unpack_from(
+            VALUE_FORMAT,
+            shard.memory_map,
+            shard.values_offset + index * struct.calcsize(VALUE_FORMAT),
+        )
+        return value
+
+    def get_best_move(
+        self, game_state: GameState
+    ) -> Tuple[Move, TablebaseResult] | None:
+        """
+        Gets the move keeping the best result: the fastest win, a draw, or the slowest loss
+
+        Args:
+            game_state (GameState): Game state to choose a move in, it is left unchanged
+
+        Returns:
+            Tuple[Move, TablebaseResult] | None: Best move and the result of the position, None if the position or one of its moves is not covered
+        """
+        if self.probe(game_state) is None:
+            return None
+
+        best_move: Move | None = None
+        best_key: Tuple[int, int] | None = None
+        best_result: TablebaseResult | None = None
+        moves: List[Move] = generate_moves(game_state)
+
+        for move in moves:
+            game_state.make_move(move)
+            if game_state.get_winner() is not None:
+                # only the side that moved can have won
+                result = TablebaseResult(Outcome.WIN, 1)
+            else:
+                child_result: TablebaseResult | None = self.probe(game_state)
+                result = (
+                    None
+                    if child_result is None
+                    else TablebaseResult(
+                        Outcome(-child_result.outcome),
+                        child_result.distance + 1 if child_result.outcome else 0,
+                    )
+                )
+            game_state.unmake_move()
+
+            if result is None:
+                return None
+            # prefer wins, then short wins, then draws, then long losses
+            key: Tuple[int, int] = (result.outcome, -result.outcome * result.distance)
+            if best_key is None or key > best_key:
+                best_move, best_key, best_result = move, key, result
+
+        if best_move is None:
+            return None
+        return best_move, best_result
+
+    def close(self) -> None:
+        """
+        Closes every mapped shard
+        """
+        for shard in self._shards.values():
+            if shard is not None:
+                shard.memory_map.close()
+        self._shards = {}
+
+    def _get_shard(self, mover_count: int, opponent_count: int) -> Shard | None:
+        """
+        Gets a shard, mapping its file on first use
+
+        Args:
+            mover_count (int): Pieces of the side to move
+            opponent_count (int): Pieces of the opponent
+
+        Returns:
+            Shard | None: Shard, None if its file is missing or invalid
+        """
+        counts: Tuple[int, int] = (mover_count, opponent_count)
+        if counts not in self._shards:
+            self._shards[counts] = open_shard(
+                get_shard_path(self._directory, mover_count, opponent_count),
+                mover_count,
+                opponent_count,
+            )
+        return self._shards[counts]
+
+
+def open_shard(path: str, mover_count: int, opponent_count: int) -> Shard | None:
+    """
+    Memory maps a shard file after checking its header
+
+    Args:
+        path (str): Path of the shard file
+        mover_count (int): Pieces of the side to move the file should hold
+        opponent_count (int): Pieces of the opponent the file should hold
+
+    Returns:
+        Shard | None: Shard, None if the file is missing or does not match
+    """
+    try:
+        with open(path, "rb") as file:
+            memory_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if len(memory_map) < HEADER_SIZE:
+        memory_map.close()
+        return None
+
+    (
+        magic,
+        version,
+        file_mover_count,
+        file_opponent_count,
+        _,
+        opponent_placements,
+    ) = struct.unpack_from(HEADER_FORMAT, memory_map)
+    if (magic, version, file_mover_count, file_opponent_count) != (
+        MAGIC,
+        VERSION,
+        mover_count,
+        opponent_count,
+    ):
+        memory_map.close()
+        return None
+
+    values_offset: int = HEADER_SIZE + BINOMIALS[BOARD_SIZE][
+        mover_count
+    ] * struct.calcsize(ORDINAL_FORMAT)
+    return Shard(memory_map, opponent_placements, values_offset)
@@ -0,0 +1,471 @@
+from __future__ import annotations
+
+import os
+import struct
+import sys
+import time
+from array import array
+from itertools import combinations
+from typing import Dict, List, Tuple
+
+import CONSTANTS
+from ai.tablebase import (
+    BINOMIALS,
+    HEADER_FORMAT,
+    MAGIC,
+    NOT_CANONICAL,
+    VERSION,
+    Outcome,
+    Tablebase,
+    decode_result,
+    encode_result,
+    get_shard_path,
+    rank_opponent_placement,
+    rank_placement,
+)
+from engine.bitboard import iter_indexes
+from engine.board_layout import (
+    ADJACENCY_MASKS,
+    BOARD_SIZE,
+    FULL_BOARD_MASK,
+    MILL_MASKS,
+)
+from engine.move_generator import forms_mill
+from engine.symmetry import SYMMETRY_COUNT, canonicalise_masks, transform_mask
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+
+class ShardLayout:
+    def __init__(self, mover_count: int, opponent_count: int) -> None:
+        """
+        Initialises the index of a shard. Placements of the side to move are reduced by symmetry and every placement of the opponent on the remaining points is kept
+
+        Args:
+            mover_count (int): Pieces of the side to move
+            opponent_count (int): Pieces of the opponent
+        """
+        self._mover_count: int = mover_count
+        self._opponent_count: int = opponent_count
+        self._opponent_placements: int = BINOMIALS[BOARD_SIZE - mover_count][
+            opponent_count
+        ]
+        self._ordinals = (
+            array("I", [NOT_CANONICAL]) * BINOMIALS[BOARD_SIZE][mover_count]
+        )
+        self._mover_masks: List[int] = []
+
+        for points in combinations(range(BOARD_SIZE), mover_count):
+            mask: int = sum(1 << point for point in points)
+            if all(
+                transform_mask(mask, transform) >= mask
+                for transform in range(1, SYMMETRY_COUNT)
+            ):
+                self._ordinals[rank_placement(mask)] = len(self._mover_masks)
+                self._mover_masks.append(mask)
+
+    def get_counts(self) -> Tuple[int, int]:
+        """
+        Gets the piece counts of the shard
+
+        Returns:
+            Tuple[int, int]: Pieces of the side to move and of the opponent
+        """
+        return self._mover_count, self._opponent_count
+
+    def get_size(self) -> int:
+        """
+        Gets the number of positions in the shard
+
+        Returns:
+            int: Number of positions
+        """
+        return len(self._mover_masks) * self._opponent_placements
+
+    def get_ordinals(self) -> array:
+        """
+        Gets the ordinal of each placement of the side to move, by colexicographic rank
+
+        Returns:
+            array: Ordinals, NOT_CANONICAL for placements that are not canonical
+        """
+        return self._ordinals
+
+    def get_opponent_placements(self) -> int:
+        """
+        Gets the number of opponent placements per placement of the side to move
+
+        Returns:
+            int: Number of placements
+        """
+        return self._opponent_placements
+
+    def get_index(self, mover_mask: int, opponent_mask: int) -> int:
+        """
+        Gets the index of a position that is already canonical
+
+        Args:
+            mover_mask (int): Bitmask of the pieces of the side to move
+            opponent_mask (int): Bitmask of the pieces of the opponent
+
+        Returns:
+            int: Index of the position in the shard
+        """
+        return self._ordinals[
+            rank_placement(mover_mask)
+        ] * self._opponent_placements + rank_opponent_placement(
+            mover_mask, opponent_mask
+        )
+
+    def iter_positions(self):
+        """
+        Iterates over the positions of the shard in index order
+
+        Yields:
+            Tuple[int, int]: Bitmask of the pieces of the side to move and of the opponent
+        """
+        for mover_mask in self._mover_masks:
+            free_points: List[int] = [
+                point for point in range(BOARD_SIZE) if not mover_mask >> point & 1
+            ]
+            # colexicographic order matches the opponent ranks
+            for points in sorted(
+                combinations(free_points, self._opponent_count),
+                key=lambda points: points[::-1],
+            ):
+                yield mover_mask, sum(1 << point for point in points)
+
+
+class TablebaseGenerator:
+    def __init__(
+        self,
+        directory: str = CONSTANTS.TABLEBASE_DIRECTORY,
+        max_pieces: int = CONSTANTS.TABLEBASE_MAX_PIECES,
+        is_verbose: bool = False,
+    ) -> None:
+        """
+        Initialises retrograde tablebase generator for positions with every piece placed.
+        Shards are solved in order of total pieces, a capture leads into a shard solved before
+
+        Args:
+            directory (str, optional): Directory to write the shard files to. Defaults to CONSTANTS.TABLEBASE_DIRECTORY.
+            max_pieces (int, optional): Most pieces on the board, both players together. Defaults to CONSTANTS.TABLEBASE_MAX_PIECES.
+            is_verbose (bool, optional): True to report progress on standard output. Defaults to False.
+        """
+        self._directory: str = directory
+        self._max_pieces: int = max_pieces
+        self._is_verbose: bool = is_verbose
+        self._tablebase: Tablebase = Tablebase(directory)
+
+    def generate(self) -> None:
+        """
+        Solves and writes every shard up to the piece limit
+        """
+        os.makedirs(self._directory, exist_ok=True)
+        smallest_count: int = CONSTANTS.LOSING_PIECE_COUNT + 1
+
+        for total in range(2 * smallest_count, self._max_pieces + 1):
+            for mover_count in range(smallest_count, total // 2 + 1):
+                opponent_count: int = total - mover_count
+                if opponent_count > CONSTANTS.PIECES_PER_PLAYER:
+                    continue
+                # moves without a capture swap the shard with its mirror, so both are solved together
+                counts: List[Tuple[int, int]] = [(mover_count, opponent_count)]
+                if opponent_count != mover_count:
+                    counts.append((opponent_count, mover_count))
+                self.solve(counts)
+
+    def solve(self, counts: List[Tuple[int, int]]) -> None:
+        """
+        Solves shards whose moves without a capture lead into each other and writes them
+
+        Args:
+            counts (List[Tuple[int, int]]): Pieces of the side to move and of the opponent of each shard
+        """
+        start_time: float = time.perf_counter()
+        shard_names: str = ", ".join(
+            f"{mover}v{opponent}" for mover, opponent in counts
+        )
+        layouts: Dict[Tuple[int, int], ShardLayout] = {
+            shard_counts: ShardLayout(*shard_counts) for shard_counts in counts
+        }
+        offsets: Dict[Tuple[int, int], int] = {}
+        node_count: int = 0
+        for shard_counts in counts:
+            offsets[shard_counts] = node_count
+            node_count += layouts[shard_counts].get_size()
+        if self._is_verbose:
+            # the largest shards take many minutes, so say which is being solved
+            print(f"{shard_names}: solving {node_count} positions", flush=True)
+
+        successors = array("I")
+        first_successors = array("Q", [0])
+        remaining_children = array("i")
+        # events by distance, each a node * 2 + 1 if a child was lost at that distance or + 0 if it was won
+        events: List[List[int]] = [[]]
+        lost_nodes: List[int] = []
+
+        for shard_counts in counts:
+            for mover_mask, opponent_mask in layouts[shard_counts].iter_positions():
+                node: int = len(remaining_children)
+                child_count: int = self._add_children(
+                    mover_mask,
+                    opponent_mask,
+                    node,
+                    layouts,
+                    offsets,
+                    successors,
+                    events,
+                )
+                remaining_children.append(child_count)
+                first_successors.append(len(successors))
+                if not child_count:
+                    lost_nodes.append(node)
+
+        predecessors, first_predecessors = self._invert(
+            successors, first_successors, node_count
+        )
+        del successors, first_successors
+
+        values = array("h", bytes(2 * node_count))
+        is_solved = bytearray(node_count)
+        for node in lost_nodes:
+            # no legal move loses at once
+            is_solved[node] = 1
+            values[node] = encode_result(Outcome.LOSS, 0)
+            for position in range(
+                first_predecessors[node], first_predecessors[node + 1]
+            ):
+                events[0].append(predecessors[position] * 2 + 1)
+        self._propagate(
+            events,
+            values,
+            is_solved,
+            remaining_children,
+            predecessors,
+            first_predecessors,
+        )
+
+        for shard_counts in counts:
+            offset: int = offsets[shard_counts]
+            self._write_shard(
+                layouts[shard_counts],
+                values[offset : offset + layouts[shard_counts].get_size()],
+            )
+
+        if self._is_verbose:
+            wins: int = sum(1 for value in values if value > 0)
+            losses: int = sum(1 for value in values if value < 0)
+            print(
+                f"{shard_names}: {node_count} positions, {wins} wins, {losses} losses, "
+                f"{node_count - wins - losses} draws in "
+                f"{time.perf_counter() - start_time:.1f}s"
+            )
+
+    def _add_children(
+        self,
+        mover_mask: int,
+        opponent_mask: int,
+        node: int,
+        layouts: Dict[Tuple[int, int], ShardLayout],
+        offsets: Dict[Tuple[int, int], int],
+        successors: array,
+        events: List[List[int]],
+    ) -> int:
+        """
+        Adds the positions after every move of a position. Captures lead out of the shards being solved, their results are known and become events
+
+        Args:
+            mover_mask (int): Bitmask of the pieces of the side to move
+            opponent_mask (int): Bitmask of the pieces of the opponent
+            node (int): Node of the position
+            layouts (Dict[Tuple[int, int], ShardLayout]): Layouts of the shards being solved
+            offsets (Dict[Tuple[int, int], int]): First node of each shard being solved
+            successors (array): Nodes after moves without a capture, added to
+            events (List[List[int]]): Events by distance, added to
+
+        Returns:
+            int: Number of moves
+        """
+        mover_count: int = mover_mask.bit_count()
+        opponent_count: int = opponent_mask.bit_count()
+        empty_mask: int = FULL_BOARD_MASK & ~(mover_mask | opponent_mask)
+        is_flying: bool = mover_count <= CONSTANTS.FLYING_PIECE_COUNT
+
+        opponent_mill_mask: int = 0
+        for mill_mask in MILL_MASKS:
+            if opponent_mask & mill_mask == mill_mask:
+                opponent_mill_mask |= mill_mask
+        removable_mask: int = opponent_mask & ~opponent_mill_mask or opponent_mask
+
+        child_layout: ShardLayout = layouts[(opponent_count, mover_count)]
+        child_offset: int = offsets[(opponent_count, mover_count)]
+        child_count: int = 0
+
+        for origin in iter_indexes(mover_mask):
+            destination_mask: int = (
+                empty_mask if is_flying else ADJACENCY_MASKS[origin] & empty_mask
+            )
+            for destination in iter_indexes(destination_mask):
+                moved_mask: int = mover_mask ^ (1 << origin) ^ (1 << destination)
+
+                if not forms_mill(moved_mask, destination):
+                    child_mover_mask, child_opponent_mask, _ = canonicalise_masks(
+                        opponent_mask, moved_mask
+                    )
+                    successors.append(
+                        child_offset
+                        + child_layout.get_index(child_mover_mask, child_opponent_mask)
+                    )
+                    child_count += 1
+                    continue
+
+                for remove in iter_indexes(removable_mask):
+                    child_count += 1
+                    remaining_mask: int = opponent_mask ^ (1 << remove)
+                    if opponent_count - 1 <= CONSTANTS.LOSING_PIECE_COUNT:
+                        self._add_event(events, 0, node * 2 + 1)
+                        continue
+
+                    value: int | None = self._tablebase.probe_value(
+                        remaining_mask, moved_mask
+                    )
+                    if value is None:
+                        raise Exception(
+                            f"Missing shard {opponent_count - 1}v{mover_count} in {self._directory}"
+                        )
+                    result = decode_result(value)
+                    if result.outcome != Outcome.DRAW:
+                        self._add_event(
+                            events,
+                            result.distance,
+                            node * 2 + (result.outcome == Outcome.LOSS),
+                        )
+
+        return child_count
+
+    def _add_event(self, events: List[List[int]], distance: int, event: int) -> None:
+        """
+        Adds an event at a distance
+
+        Args:
+            events (List[List[int]]): Events by distance
+            distance (int): Distance of the child's result
+            event (int): Node * 2 + 1 if the child was lost, + 0 if it was won
+        """
+        while len(events) <= distance:
+            events.append([])
+        events[distance].append(event)
+
+    def _invert(
+        self, successors: array, first_successors: array, node_count: int
+    ) -> Tuple[array, array]:
+        """
+        Inverts the successors of every node into its predecessors, one per move
+
+        Args:
+            successors (array): Successor nodes of every node
+            first_successors (array): Position of each node's first successor, with the total at the end
+            node_count (int): Number of nodes
+
+        Returns:
+            Tuple[array, array]: Predecessor nodes and position of each node's first predecessor, with the total at the end
+        """
+        first_predecessors = array("Q", bytes(8 * (node_count + 1)))
+        for successor in successors:
+            first_predecessors[successor + 1] += 1
+        for node in range(node_count):
+            first_predecessors[node + 1] += first_predecessors[node]
+
+        predecessors = array("I", bytes(4 * len(successors)))
+        next_positions = array("Q", first_predecessors)
+        for node in range(node_count):
+            for position in range(first_successors[node], first_successors[node + 1]):
+                successor: int = successors[position]
+                predecessors[next_positions[successor]] = node
+                next_positions[successor] += 1
+
+        return predecessors, first_predecessors
+
+    def _propagate(
+        self,
+        events: List[List[int]],
+        values: array,
+        is_solved: bytearray,
+        remaining_children: array,
+        predecessors: array,
+        first_predecessors: array,
+    ) -> None:
+        """
+        Solves nodes in order of distance. A node with a lost child is won one ply later, a node whose children are all won is lost one ply after the last of them.
+        Nodes never solved are draws
+
+        Args:
+            events (List[List[int]]): Events by distance
+            values (array): Stored value of each node, written to
+            is_solved (bytearray): Whether each node is solved, written to
+            remaining_children (array): Children of each node not yet known to be won
+            predecessors (array): Predecessor nodes of every node
+            first_predecessors (array): Position of each node's first predecessor
+        """
+        distance: int = 0
+        while distance < len(events):
+            for event in events[distance]:
+                node: int = event >> 1
+                if is_solved[node]:
+                    continue
+
+                if event & 1:
+                    outcome: Outcome = Outcome.WIN
+                else:
+                    remaining_children[node] -= 1
+                    if remaining_children[node]:
+                        continue
+                    outcome = Outcome.LOSS
+
+                is_solved[node] = 1
+                values[node] = encode_result(outcome, distance + 1)
+                for position in range(
+                    first_predecessors[node], first_predecessors[node + 1]
+                ):
+                    self._add_event(
+                        events,
+                        distance + 1,
+                        predecessors[position] * 2 + (outcome == Outcome.LOSS),
+                    )
+            events[distance] = []
+            distance += 1
+
+    def _write_shard(self, layout: ShardLayout, values: array) -> None:
+        """
+        Writes a shard file: header, mover ordinals and values, little endian
+
+        Args:
+            layout (ShardLayout): Layout of the shard
+            values (array): Stored value of each position
+        """
+        mover_count, opponent_count = layout.get_counts()
+        ordinals = array("I", layout.get_ordinals())
+        values = array("h", values)
+        if sys.byteorder == "big":
+            ordinals.byteswap()
+            values.byteswap()
+
+        path: str = get_shard_path(self._directory, mover_count, opponent_count)
+        temporary_path: str = path + ".tmp"
+        with open(temporary_path, "wb") as file:
+            file.write(
+                struct.pack(
+                    HEADER_FORMAT,
+                    MAGIC,
+                    VERSION,
+                    mover_count,
+                    opponent_count,
+                    layout.get_size() // layout.get_opponent_placements(),
+                    layout.get_opponent_placements(),
+                )
+            )
+            ordinals.tofile(file)
+            values.tofile(file)
+        os.replace(temporary_path, path)
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from array import array
+from enum import IntEnum
+from typing import NamedTuple
+
+import CONSTANTS
+from engine.move import Move, decode_move, encode_move
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+# Slots per bucket, the first is depth-preferred and the second is always replaced
+BUCKET_SIZE = 2
+
+# Bytes per entry, one 64 bit word for the key and one for the packed data
+ENTRY_SIZE = 16
+
+# Offset added to scores so that they are stored unsigned
+SCORE_OFFSET = 1 << 31
+
+
+class Bound(IntEnum):
+    """
+    Enum for what a stored score says about the real score
+
+    Args:
+        IntEnum (IntEnum): Exact score, lower bound (the search failed high) or upper bound (the search failed low)
+    """
+
+    EXACT = 0
+    LOWER = 1
+    UPPER = 2
+
+
+class TableEntry(NamedTuple):
+    """
+    Responsible for an entry read from the transposition table
+
+    Args:
+        NamedTuple (NamedTuple): Depth searched, score, bound type of the score and best move found
+    """
+
+    depth: int
+    score: int
+    bound: Bound
+    best_move: Move | None
+
+
+def pack_entry(depth: int, score: int, bound: Bound, best_move: Move | None) -> int:
+    """
+    Packs an entry into one 64 bit word: move in bits 0-15, depth in 16-23, bound in 24-25 and score in 32-63
+
+    Args:
+        depth (int): Depth searched
+        score (int): Score
+        bound (Bound): Bound type of the score
+        best_move (Move | None): Best move found
+
+    Returns:
+        int: Packed entry
+    """
+    return (
+        encode_move(best_move)
+        | min(depth, 0xFF) << 16
+        | bound << 24
+        | (score + SCORE_OFFSET) << 32
+    )
+
+
+def unpack_entry(data: int) -> TableEntry:
+    """
+    Unpacks an entry packed by pack_entry
+
+    Args:
+        data (int): Packed entry
+
+    Returns:
+        TableEntry: Unpacked entry
+    """
+    return TableEntry(
+        data >> 16 & 0xFF,
+        (data >> 32) - SCORE_OFFSET,
+        Bound(data >> 24 & 0x3),
+        decode_move(data & 0xFFFF),
+    )
+
+
+class TranspositionTable:
+    def __init__(self, size_mb: float = CONSTANTS.AI_TRANSPOSITION_TABLE_MB) -> None:
+        """
+        Initialises a fixed size transposition table. The memory is allocated once and never grows
+
+        Args:
+            size_mb (float, optional): Memory cap in megabytes. Defaults to CONSTANTS.AI_TRANSPOSITION_TABLE_MB.
+        """
+        bucket_count: int = max(1, int(size_mb * 2**20) // (ENTRY_SIZE * BUCKET_SIZE))
+        # round down to a power of two so a bucket is found by masking the key
+        self._bucket_mask: int = (1 << (bucket_count.bit_length() - 1)) - 1
+        self._hits: int = 0
+        self._misses: int = 0
+        self._collisions: int = 0
+        self._allocate((self._bucket_mask + 1) * BUCKET_SIZE)
+
+    def clear(self) -> None:
+        """
+        Clears every entry and the counters
+        """
+        self._allocate(len(self._keys))
+        self._hits = 0
+        self._misses = 0
+        self._collisions = 0
+
+    def probe(self, key: int) -> TableEntry | None:
+        """
+        Looks up a position
+
+        Args:
+            key (int): Zobrist hash of the position
+
+        Returns:
+            TableEntry | None: Stored entry, None if the position is not stored
+        """
+        slot: int = (key & self._bucket_mask) * BUCKET_SIZE
+        keys = self._keys
+
+        for offset in range(BUCKET_SIZE):
+            if keys[slot + offset] == key:
+                self._hits += 1
+                return unpack_entry(self._data[slot + offset])
+
+        self._misses += 1
+        if keys[slot] or keys[slot + 1]:
+            self._collisions += 1
+        return None
+
+    def store(
+        self, key: int, depth: int, score: int, bound: Bound, best_move: Move | None
+    ) -> None:
+        """
+        Stores a position. It goes in the depth-preferred slot if it is the same position or searched at least as deep, otherwise in the always-replace slot
+
+        Args:
+            key (int): Zobrist hash of the position
+            depth (int): Depth searched
+            score (int): Score
+            bound (Bound): Bound type of the score
+            best_move (Move | None): Best move found
+        """
+        slot: int = (key & self._bucket_mask) * BUCKET_SIZE
+        data: int = pack_entry(depth, score, bound, best_move)
+
+        if (
+            self._keys[slot] == key
+            or self._keys[slot] == 0
+            or depth >= self._data[slot] >> 16 & 0xFF
+        ):
+            self._keys[slot] = key
+            self._data[slot] = data
+        else:
+            self._keys[slot + 1] = key
+            self._data[slot + 1] = data
+
+    def get_entry_count(self) -> int:
+        """
+        Gets the number of entries the table can hold
+
+        Returns:
+            int: Number of entries
+        """
+        return len(self._keys)
+
+    def get_size_bytes(self) -> int:
+        """
+        Gets the memory used by the entries
+
+        Returns:
+            int: Size in bytes
+        """
+        return len(self._keys) * ENTRY_SIZE
+
+    def get_hits(self) -> int:
+        """
+        Gets the number of probes that found their position
+
+        Returns:
+            int: Number of hits
+        """
+        return self._hits
+
+    def get_misses(self) -> int:
+        """
+        Gets the number of probes that did not find their position
+
+        Returns:
+            int: Number of misses
+        """
+        return self._misses
+
+    def get_collisions(self) -> int:
+        """
+        Gets the number of misses where the bucket was holding other positions
+
+        Returns:
+            int: Number of collisions
+        """
+        return self._collisions
+
+    def _allocate(self, entry_count: int) -> None:
+        """
+        Allocates empty entries
+
+        Args:
+            entry_count (int): Number of entries
+        """
+        self._keys = array("Q", bytes(8 * entry_count))
+        self._data = array("Q", bytes(8 * entry_count))
@@ -2,10 +2,16 @@
 Start the application on this file to start the 9 Men's Morris Game, as it creates an instance of GameManager. Run the file to commence.
 """
 
+import multiprocessing
+
 from game_manager import GameManager
 
 __author__ = "Snekith, Patrick and Ashwin"
 __date__ = "17/06/2023"
 
-# Instantiate GameManager
-game_manager = GameManager()
+if __name__ == "__main__":
+    # lets the computer's worker processes start in a bundled executable
+    multiprocessing.freeze_support()
+
+    # Instantiate GameManager
+    game_manager = GameManager()
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import time
+from typing import Any, Callable, Dict, List, NamedTuple
+
+import pygame
+
+import CONSTANTS
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+# Version of the results file layout, results of another version are not compared
+RESULTS_VERSION = 1
+
+
+class Benchmark(NamedTuple):
+    """
+    Responsible for one benchmark
+
+    Args:
+        NamedTuple (NamedTuple): Name, function putting the game into the scenario before timing, and function timed
+    """
+
+    name: str
+    setup: Callable[[], Any]
+    function: Callable[[], Any]
+
+
+class BenchmarkResult(NamedTuple):
+    """
+    Responsible for the timing of one benchmark
+
+    Args:
+        NamedTuple (NamedTuple): Name, calls per round, rounds, and seconds per call of the fastest round and of the median round
+    """
+
+    name: str
+    calls: int
+    rounds: int
+    best: float
+    median: float
+
+
+class Comparison(NamedTuple):
+    """
+    Responsible for the comparison of one benchmark against the baseline
+
+    Args:
+        NamedTuple (NamedTuple): Name, seconds per call of the baseline and now, now divided by the baseline, and whether it is slower by more than the threshold
+    """
+
+    name: str
+    baseline: float
+    current: float
+    ratio: float
+    is_regression: bool
+
+
+def time_benchmark(
+    benchmark: Benchmark,
+    rounds: int = CONSTANTS.BENCHMARK_ROUNDS,
+    round_time: float = CONSTANTS.BENCHMARK_ROUND_TIME,
+) -> BenchmarkResult:
+    """
+    Times a benchmark. The calls per round are doubled until a round takes round_time, then that many calls are timed in each round
+
+    Args:
+        benchmark (Benchmark): Benchmark to time
+        rounds (int, optional): Rounds to time. Defaults to CONSTANTS.BENCHMARK_ROUNDS.
+        round_time (float, optional): Seconds a round should take at least. Defaults to CONSTANTS.BENCHMARK_ROUND_TIME.
+
+    Returns:
+        BenchmarkResult: Timing of the benchmark
+    """
+    benchmark.setup()
+
+    calls: int = 1
+    while _time_calls(benchmark.function, calls) < round_time:
+        calls *= 2
+
+    times: List[float] = [
+        _time_calls(benchmark.function, calls) / calls for _ in range(max(1, rounds))
+    ]
+    return BenchmarkResult(
+        benchmark.name, calls, len(times), min(times), statistics.median(times)
+    )
+
+
+def results_to_dict(results: List[BenchmarkResult]) -> Dict[str, Any]:
+    """
+    Converts benchmark results to a dictionary that can be written as JSON, with the versions they were measured with
+
+    Args:
+        results (List[BenchmarkResult]): Benchmark results
+
+    Returns:
+        Dict[str, Any]: Results by benchmark name and the environment
+    """
+    return {
+        "version": RESULTS_VERSION,
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "benchmarks": {
+            result.name: {
+                "calls": result.calls,
+                "rounds": result.rounds,
+                "best": result.best,
+                "median": result.median,
+            }
+            for result in results
+        },
+    }
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """
+    Loads benchmark results written by results_to_dict
+
+    Args:
+        path (str): Path of the JSON file
+
+    Raises:
+        Exception: File is not benchmark results of this version
+
+    Returns:
+        Dict[str, Any]: Results by benchmark name and the environment
+    """
+    with open(path) as file:
+        results: Dict[str, Any] = json.load(file)
+    if results.get("version") != RESULTS_VERSION or "benchmarks" not in results:
+        raise Exception(f"{path} is not a benchmark results file")
+    return results
+
+
+def compare_results(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, Any],
+    threshold: float = CONSTANTS.BENCHMARK_REGRESSION_THRESHOLD,
+) -> List[Comparison]:
+    """
+    Compares the fastest rounds of benchmark results against a baseline. Benchmarks missing from the baseline are left out
+
+    Args:
+        results (List[BenchmarkResult]): Benchmark results
+        baseline (Dict[str, Any]): Baseline loaded by load_results
+        threshold (float, optional): Fraction slower than the baseline that counts as a regression. Defaults to CONSTANTS.BENCHMARK_REGRESSION_THRESHOLD.
+
+    Returns:
+        List[Comparison]: Comparison of each benchmark in both
+    """
+    comparisons: List[Comparison] = []
+    for result in results:
+        if result.name not in baseline["benchmarks"]:
+            continue
+        baseline_time: float = baseline["benchmarks"][result.name]["best"]
+        ratio: float = result.best / baseline_time if baseline_time else 1.0
+        comparisons.append(
+            Comparison(
+                result.name, baseline_time, result.best, ratio, ratio > 1 + threshold
+            )
+        )
+    return comparisons
+
+
+def _time_calls(function: Callable[[], Any], calls: int) -> float:
+    """
+    Times calls of a function
+
+    Args:
+        function (Callable[[], Any]): Function to call
+        calls (int): Number of calls
+
+    Returns:
+        float: Seconds taken
+    """
+    start_time: float = time.perf_counter()
+    for _ in range(calls):
+        function()
+    return time.perf_counter() - start_time
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING, Callable, Dict, List
+
+import CONSTANTS
+from actions.move_type import MoveType
+from ai.alpha_beta_search import AlphaBetaSearch
+from benchmarks.benchmark import Benchmark
+from board_model.piece import Piece
+from engine.game_state import GameState
+from engine.move import Move
+from engine.move_generator import generate_moves
+from engine.perft import generate_actions
+from players.computer import Computer
+
+if TYPE_CHECKING:
+    from game_manager import GameManager
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+# Actions played before the placement scenario
+PLACEMENT_PLIES = 8
+
+# Random games tried when looking for a scenario before giving up
+MAX_SCENARIO_GAMES = 1000
+
+# Seconds an animation lasts in the animation benchmarks, long enough to never finish while being timed
+ANIMATION_DURATION = 10**6
+
+# Whether a game state, after a number of actions, is the position of each scenario
+SCENARIOS: Dict[str, Callable[[GameState, int], bool]] = {
+    "placement": lambda game_state, plies: plies == PLACEMENT_PLIES,
+    "removal": lambda game_state, plies: (
+        game_state.is_pieces_placed() and game_state.is_pending_remove()
+    ),
+    "movement": lambda game_state, plies: game_state.get_move_type() == MoveType.MOVE,
+    "flying": lambda game_state, plies: game_state.get_move_type() == MoveType.FLY,
+}
+
+
+def find_scenario_actions(
+    scenario: str, seed: int = CONSTANTS.BENCHMARK_SEED
+) -> List[Move]:
+    """
+    Finds the actions of a random game leading to the first position of a scenario, trying one seed after another from the given seed
+
+    Args:
+        scenario (str): One of SCENARIOS
+        seed (int, optional): Seed of the first game tried. Defaults to CONSTANTS.BENCHMARK_SEED.
+
+    Raises:
+        Exception: No game reached the scenario
+
+    Returns:
+        List[Move]: Actions from the start of the game, a mill and its removal being two actions
+    """
+    is_scenario: Callable[[GameState, int], bool] = SCENARIOS[scenario]
+    for game_seed in range(seed, seed + MAX_SCENARIO_GAMES):
+        game_random = random.Random(game_seed)
+        game_state = GameState()
+        actions: List[Move] = []
+
+        while game_state.get_winner() is None:
+            if is_scenario(game_state, len(actions)):
+                return actions
+            action: Move = game_random.choice(generate_actions(game_state))
+            game_state.make_move(action)
+            actions.append(action)
+
+    raise Exception(f"No random game reached the {scenario} scenario")
+
+
+def load_scenario(game_manager: GameManager, actions: List[Move]) -> None:
+    """
+    Starts a new game and plays actions through the board the way the action handlers do, without animations or sounds.
+    When a piece has to be moved, the first movable piece is selected so the handler has moves to show
+
+    Args:
+        game_manager (GameManager): Game manager of the game
+        actions (List[Move]): Actions from the start of the game
+    """
+    game_manager.initialise_game()
+    board = game_manager.get_board()
+
+    for action in actions:
+        if action.destination is None:
+            board.remove_piece(board.get_position_by_index(action.remove))
+        elif action.origin is None:
+            board.add_piece(
+                board.get_position_by_index(action.destination),
+                Piece(game_manager.get_is_player1_turn()),
+            )
+        else:
+            board.move_piece(
+                board.get_position_by_index(action.origin),
+                board.get_position_by_index(action.destination),
+            )
+        game_manager.update_current_player()
+    board.get_new_mill()
+
+    action_controller = game_manager.get_action_controller()
+    action_controller.update_action_handler()
+    if action_controller.get_move_type() in (MoveType.MOVE, MoveType.FLY):
+        action_controller.set_current_selected_position(
+            board.get_position_by_index(
+                generate_moves(board.get_game_state())[0].origin
+            )
+        )
+
+
+def create_benchmarks(
+    game_manager: GameManager, seed: int = CONSTANTS.BENCHMARK_SEED
+) -> List[Benchmark]:
+    """
+    Creates the benchmarks of the board model, action handlers, computer and renderer, each in the position of a scenario
+
+    Args:
+        game_manager (GameManager): Game manager created without running, with sounds muted
+        seed (int, optional): Seed of the random games the scenarios come from. Defaults to CONSTANTS.BENCHMARK_SEED.
+
+    Returns:
+        List[Benchmark]: Benchmarks
+    """
+    scenario_actions: Dict[str, List[Move]] = {
+        scenario: find_scenario_actions(scenario, seed) for scenario in SCENARIOS
+    }
+    board = game_manager.get_board()
+    action_controller = game_manager.get_action_controller()
+    display = game_manager.get_display()
+    token_renderer = display.get_token_renderer()
+    animation_handler = token_renderer.get_animation_handler()
+
+    def load(scenario: str, is_animating: bool = False) -> Callable[[], None]:
+        """
+        Creates the setup of a benchmark
+
+        Args:
+            scenario (str): Scenario to load
+            is_animating (bool, optional): True to animate every piece on the board. Defaults to False.
+
+        Returns:
+            Callable[[], None]: Setup function
+        """
+
+        def setup() -> None:
+            """
+            Loads the scenario
+            """
+            load_scenario(game_manager, scenario_actions[scenario])
+            if is_animating:
+                for position in board.get_occupied_positions():
+                    animation_handler.add_animation(
+                        position,
+                        position.get_is_green(),
+                        start_radius=0,
+                        duration=ANIMATION_DURATION,
+                    )
+
+        return setup
+
+    def choose_move() -> Move:
+        """
+        Chooses a move with a computer searching to a fixed depth
+
+        Returns:
+            Move: Move chosen
+        """
+        search = AlphaBetaSearch(
+            float("inf"), max_depth=CONSTANTS.BENCHMARK_SEARCH_DEPTH
+        )
+        return Computer(
+            game_manager, "CPU", game_manager.get_is_player1_turn(), search
+        ).get_planned_move()
+
+    def get_available_moves() -> List[int]:
+        """
+        Gets the available moves of the current action handler
+
+        Returns:
+            List[int]: Available moves
+        """
+        return action_controller.get_current_action_handler().get_available_moves()
+
+    def render_token_elements() -> None:
+        """
+        Renders the tokens with the mills on the board
+        """
+        token_renderer.render_token_elements(board.get_mills())
+
+    benchmarks: List[Benchmark] = [
+        Benchmark("Board.get_mills[movement]", load("movement"), board.get_mills),
+        Benchmark(
+            "MillManager.get_new_mill[movement]",
+            load("movement"),
+            board.get_mill_manager().get_new_mill,
+        ),
+    ]
+    for handler, scenario in (
+        ("PlaceActionHandler", "placement"),
+        ("RemoveActionHandler", "removal"),
+        ("MoveActionHandler", "movement"),
+        ("FlyActionHandler", "flying"),
+    ):
+        benchmarks.append(
+            Benchmark(
+                f"{handler}.get_available_moves[{scenario}]",
+                load(scenario),
+                get_available_moves,
+            )
+        )
+    benchmarks += [
+        Benchmark("Board.is_game_over[movement]", load("movement"), board.is_game_over),
+        Benchmark("Computer.choose_move[placement]", load("placement"), choose_move),
+        Benchmark("Computer.choose_move[movement]", load("movement"), choose_move),
+        Benchmark(
+            "AnimationHandler.tick[movement]",
+            load("movement", True),
+            animation_handler.tick,
+        ),
+        Benchmark(
+            "TokenRenderer.render_token_elements[movement]",
+            load("movement"),
+            render_token_elements,
+        ),
+        Benchmark(
+            "TokenRenderer.render_token_elements[movement, animating]",
+            load("movement", True),
+            render_token_elements,
+        ),
+        Benchmark(
+            "Display.draw_screen[placement]", load("placement"), display.draw_screen
+        ),
+        Benchmark(
+            "Display.draw_screen[movement]", load("movement"), display.draw_screen
+        ),
+        Benchmark(
+            "Display.clear_screen[movement]", load("movement"), display.clear_screen
+        ),
+    ]
+    return benchmarks
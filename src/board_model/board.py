@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Literal
+from typing import TYPE_CHECKING, List, Literal
 
 from board_model.mill_manager import MillManager
 from board_model.piece import Piece
 from board_model.position import Position
+from engine.bitboard import BitBoard, iter_indexes
+from engine.board_layout import NEIGHBOURS
+from engine.game_state import GameState
+from engine.move import Move
+from engine.move_generator import generate_moves
 
 if TYPE_CHECKING:
     from game_manager import GameManager
@@ -25,14 +30,17 @@ class Board:
         """
         self._positions: List[Position] = []
         self._game_manager: GameManager = game_manager
+        self._game_state = GameState()
+        self._bitboard: BitBoard = self._game_state.get_bitboard()
         self._mill_manager = MillManager(self)
         self._create_positions()
 
     def reset(self) -> None:
         """
-        Resetting board
+        Resetting board to the start of a game, keeping the positions as they are views of the game state
         """
-        self.__init__(self._game_manager)
+        self._game_state.reset()
+        self._mill_manager.reset()
 
     def get_positions(self) -> List[Position]:
         """
@@ -44,6 +52,36 @@ class Board:
 
         return self._positions
 
+    def get_game_state(self) -> GameState:
+        """
+        Get rules engine state the board is a view of
+
+        Returns:
+            GameState: Game state
+        """
+        return self._game_state
+
+    def get_bitboard(self) -> BitBoard:
+        """
+        Get bitboard holding the state of the board
+
+        Returns:
+            BitBoard: Bitboard
+        """
+        return self._bitboard
+
+    def _get_positions_from_mask(self, mask: int) -> List[Position]:
+        """
+        Get positions of the set bits of a mask
+
+        Args:
+            mask (int): Bitmask of positions
+
+        Returns:
+            List[Position]: List of positions
+        """
+        return [self._positions[index] for index in iter_indexes(mask)]
+
     def get_occupied_positions(self) -> list:
         """
         Get occupied positions
@@ -51,7 +89,7 @@ class Board:
         Returns:
             list: List of occupied positions
         """
-        return [position for position in self._positions if position.is_occupied()]
+        return self._get_positions_from_mask(self._bitboard.get_occupied_mask())
 
     def get_positions_from_colour(self, is_green=True) -> list:
         """
@@ -63,12 +101,7 @@ class Board:
         Returns:
             list: List of coloured pieces
         """
-        return [
-            position
-            for position in self._positions
-            if position.get_piece() is not None
-            and position.get_piece().get_is_green() == is_green
-        ]
+        return self._get_positions_from_mask(self._bitboard.get_colour_mask(is_green))
 
     def get_empty_positions(self) -> list:
         """
@@ -77,7 +110,19 @@ class Board:
         Returns:
             list: List of empty positions
         """
-        return [position for position in self._positions if not position.is_occupied()]
+        return self._get_positions_from_mask(self._bitboard.get_empty_mask())
+
+    def count_pieces(self, is_green: bool) -> int:
+        """
+        Count pieces of a colour on the board
+
+        Args:
+            is_green (bool): Whether to count green or blue pieces
+
+        Returns:
+            int: Number of pieces of the colour on the board
+        """
+        return self._bitboard.count_pieces(is_green)
 
     def get_mill_manager(self) -> MillManager:
         """
@@ -90,15 +135,15 @@ class Board:
 
     def add_piece(self, position: Position, piece: Piece) -> None:
         """
-        Adding piece to piece_list and decrementing token count
+        Placing piece of the side to move at the position
 
         Args:
+            position (Position): Position to place the piece
             piece (Piece): Piece to be added
         """
 
-        position.set_piece(piece)
-        self._game_manager.increment_token_board()
-        self._game_manager.decrement_token_count()
+        self._game_state.place_piece(position.get_index())
+        self._mill_manager.update_mills(position.get_index())
 
     def get_piece_from_position(self, position: Position) -> Piece | None:
         """
@@ -120,9 +165,8 @@ class Board:
             piece (Piece): Piece to be moved
             destination (Position): Destination position to move the piece
         """
-        piece: Piece = source.get_piece()
-        source.set_piece(None)
-        destination.set_piece(piece)
+        self._game_state.move_piece(source.get_index(), destination.get_index())
+        self._mill_manager.update_mills(source.get_index(), destination.get_index())
 
     def remove_piece(self, position: Position) -> None:
         """
@@ -131,15 +175,8 @@ class Board:
         Args:
             position (Position): Position to remove piece from
         """
-        position.set_piece(None)
-
-        if (
-            self._game_manager.get_mover_name()
-            == self._game_manager.get_player1().get_name()
-        ):
-            self._game_manager.decrement_blue_board()
-        else:
-            self._game_manager.decrement_green_board()
+        self._game_state.remove_piece(position.get_index())
+        self._mill_manager.update_mills(position.get_index())
 
     def get_piece_list(self) -> list[Piece]:
         """
@@ -148,11 +185,12 @@ class Board:
         Returns:
             list: Piece list
         """
-        piece_list = []
-        for position in self._positions:
-            if position.get_piece() is not None:
-                piece_list.append(position.get_piece())
-        return piece_list
+        return [
+            position.get_piece()
+            for position in self._get_positions_from_mask(
+                self._bitboard.get_occupied_mask()
+            )
+        ]
 
     def _create_positions(self) -> None:
         """
@@ -186,36 +224,10 @@ class Board:
             (822, 662),
         )
 
-        # List of neighbours for each position in the game board (ordered by each piece's index)
-        neighbours = [
-            {"top": None, "bottom": 9, "left": None, "right": 1},
-            {"top": None, "bottom": 4, "left": 0, "right": 2},
-            {"top": None, "bottom": 14, "left": 1, "right": None},
-            {"top": None, "bottom": 10, "left": None, "right": 4},
-            {"top": 1, "bottom": 7, "left": 3, "right": 5},
-            {"top": None, "bottom": 13, "left": 4, "right": None},
-            {"top": None, "bottom": 11, "left": None, "right": 7},
-            {"top": 4, "bottom": None, "left": 6, "right": 8},
-            {"top": None, "bottom": 12, "left": 7, "right": None},
-            {"top": 0, "bottom": 21, "left": None, "right": 10},
-            {"top": 3, "bottom": 18, "left": 9, "right": 11},
-            {"top": 6, "bottom": 15, "left": 10, "right": None},
-            {"top": 8, "bottom": 17, "left": None, "right": 13},
-            {"top": 5, "bottom": 20, "left": 12, "right": 14},
-            {"top": 2, "bottom": 23, "left": 13, "right": None},
-            {"top": 11, "bottom": None, "left": None, "right": 16},
-            {"top": None, "bottom": 19, "left": 15, "right": 17},
-            {"top": 12, "bottom": None, "left": 16, "right": None},
-            {"top": 10, "bottom": None, "left": None, "right": 19},
-            {"top": 16, "bottom": 22, "left": 18, "right": 20},
-            {"top": 13, "bottom": None, "left": 19, "right": None},
-            {"top": 9, "bottom": None, "left": None, "right": 22},
-            {"top": 19, "bottom": None, "left": 21, "right": 23},
-            {"top": 14, "bottom": None, "left": 22, "right": None},
-        ]
-
         for i in range(len(piece_locations)):
-            self._positions.append(Position(piece_locations[i], neighbours[i], i))
+            self._positions.append(
+                Position(piece_locations[i], NEIGHBOURS[i], i, self._bitboard)
+            )
 
     def is_pieces_placed(self) -> bool:
         """
@@ -224,50 +236,18 @@ class Board:
         Returns:
             bool: True if all pieces have been placed
         """
-        return (
-            self._game_manager.get_blue_token_count() == 0
-            and self._game_manager.get_green_token_count() == 0
-        )
+        return self._game_state.is_pieces_placed()
 
     def get_mills(self) -> list:
         """
         Checks the board for the presence of mills
+
+        Returns:
+            list: List of mills
         """
-        mills = []
-        for position in self._positions:
-            if position.is_occupied():
-                neighbours = position.get_neighbours()
-                # Checks if the position has neighbours on both sides of the position
-                for direction in (("top", "bottom"), ("left", "right")):
-                    if (
-                        neighbours[direction[0]] is not None
-                        and neighbours[direction[1]] is not None
-                    ):
-                        top_piece: Piece = self.get_position_by_index(
-                            neighbours[direction[0]]
-                        ).get_piece()
-                        middle_piece: Piece = position.get_piece()
-                        bottom_piece: Piece = self.get_position_by_index(
-                            neighbours[direction[1]]
-                        ).get_piece()
-
-                        if top_piece is None or bottom_piece is None:
-                            continue
-
-                        if (
-                            top_piece.get_is_green() == bottom_piece.get_is_green()
-                            and top_piece.get_is_green() == middle_piece.get_is_green()
-                        ):  # check if there are pieces of the same colour on either side of the piece
-                            mills.append(
-                                [
-                                    neighbours[direction[0]],
-                                    position.get_index(),
-                                    neighbours[direction[1]],
-                                ]
-                            )
-        return mills
-
-    def compare_mills(self, mills: list) -> Any | None:
+        return self._mill_manager.get_mills()
+
+    def compare_mills(self, mills: list) -> List[int] | None:
         """
         Returns new mill if present
 
@@ -275,30 +255,18 @@ class Board:
             mills (list): List of mills
 
         Returns:
-            Any | None: New mill if present, otherwise None
+            List[int] | None: New mill if present, otherwise None
         """
+        return self._mill_manager.compare_mills(mills)
 
-        new_mill = None
-
-        for mill in mills:
-            if mill not in self.mills:
-                new_mill = mill
-                break
-
-        self.mills = mills
-
-        return new_mill
-
-    def get_new_mill(self) -> Any | None:
+    def get_new_mill(self) -> List[int] | None:
         """
         Gets the new mill
 
         Returns:
-            Any | None: New mill if present, otherwise None
+            List[int] | None: New mill if present, otherwise None
         """
-
-        mills: list = self.get_mills()
-        return self.compare_mills(mills)
+        return self._mill_manager.get_new_mill()
 
     def get_position_by_index(self, index: int) -> Position:
         """
@@ -313,34 +281,19 @@ class Board:
         Returns:
             Position: Position at index
         """
-        for position in self._positions:
-            if position.get_index() == index:
-                return position
+        if index is None or not 0 <= index < len(self._positions):
+            raise Exception(f"Incorrect index given {index}")
 
-        raise Exception(f"Incorrect index given {index}")
+        return self._positions[index]
 
-    def get_all_available_moves(self) -> List[int]:
+    def get_all_available_moves(self) -> List[Move]:
         """
-        Returns all available moves
+        Returns all available moves for the side to move
 
         Returns:
-            List[int]: List of available moves
-        """
-        origin = self._game_manager._action_controller.get_current_selected_position()
-        all_available_moves = []
-        for position in self._positions:
-            if position.is_occupied() and self._game_manager.is_current_players_piece(
-                position
-            ):
-                self._game_manager._action_controller.set_current_selected_position(
-                    position
-                )
-            all_available_moves += (
-                self._game_manager._action_controller.get_current_action_handler().get_available_moves()
-            )
-
-        self._game_manager._action_controller.set_current_selected_position(origin)
-        return list(set(all_available_moves))
+            List[Move]: List of available moves as (origin, destination, remove)
+        """
+        return generate_moves(self._game_state)
 
     def is_game_over(self) -> str | Literal[False]:
         """
@@ -349,11 +302,10 @@ class Board:
         Returns:
             str | Literal[False]: Game over or not signal
         """
-        if self._game_manager._board.is_pieces_placed():
-            if self._game_manager.get_blue_pieces_on_board() <= 2:
-                return self._game_manager.get_player1().get_name()
-            elif self._game_manager.get_green_pieces_on_board() <= 2:
-                return self._game_manager.get_player2().get_name()
-            elif self.get_all_available_moves() == []:
-                return self._game_manager.get_other_player().get_name()
-        return False
+        is_green_winner: bool | None = self._game_state.get_winner()
+        if is_green_winner is None:
+            return False
+
+        if is_green_winner:
+            return self._game_manager.get_player1().get_name()
+        return self._game_manager.get_player2().get_name()
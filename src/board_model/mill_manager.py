@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Iterable, List, Set
 
 if TYPE_CHECKING:
     from board_model.board import Board
 
-from board_model.piece import Piece
-from board_model.position import Neighbours
+from engine.board_layout import (
+    LINES_THROUGH,
+    MILL_LINE_INDEXES,
+    MILL_LINES,
+    MILL_MASKS,
+)
 
 __author__ = "Snekith, Patrick and Ashwin"
 __date__ = "17/06/2023"
@@ -15,80 +19,91 @@ __date__ = "17/06/2023"
 class MillManager:
     def __init__(self, board: Board) -> None:
         """
-        Initialises mill manager
+        Initialises mill manager. The board reports every changed position so only the two lines through it are re-checked
 
         Args:
             board (Board): Board
         """
-        self.mills: list = []
+        self.mills: Set[int] = set()  # mill lines seen at the last comparison
+        self._current_mills: Set[int] = set()  # mill lines currently on the board
         self._board: Board = board
 
-    def get_mills(self) -> list:
+    def reset(self) -> None:
         """
-        Checks the board for the presence of mills
+        Resets mill manager for an empty board
         """
-        mills: list = []
-        for position in self._board.get_occupied_positions():
-            neighbours: Neighbours = position.get_neighbours()
-            # Checks if the position has neighbours on both sides of the position
-            for direction in (("top", "bottom"), ("left", "right")):
-                if (
-                    neighbours[direction[0]] is not None
-                    and neighbours[direction[1]] is not None
-                ):
-                    top_piece: Piece = self._board.get_position_by_index(
-                        neighbours[direction[0]]
-                    ).get_piece()
-                    middle_piece: Piece = position.get_piece()
-                    bottom_piece: Piece = self._board.get_position_by_index(
-                        neighbours[direction[1]]
-                    ).get_piece()
-
-                    if top_piece is None or bottom_piece is None:
-                        continue
-
-                    if (
-                        top_piece.get_is_green() == bottom_piece.get_is_green()
-                        and top_piece.get_is_green() == middle_piece.get_is_green()
-                    ):  # check if there are pieces of the same colour on either side of the piece
-                        mills.append(
-                            [
-                                neighbours[direction[0]],
-                                position.get_index(),
-                                neighbours[direction[1]],
-                            ]
-                        )
-        return mills
-
-    def compare_mills(self, mills: list) -> List[int] | None:
+        self.mills = set()
+        self._current_mills = set()
+
+    def update_mills(self, *indexes: int) -> None:
         """
-        Returns new mill if present
+        Re-checks the mill lines through the changed positions
 
         Args:
-            mills (list): List of mills
+            indexes (int): Indexes of the positions that changed
+        """
+        bitboard = self._board.get_bitboard()
+        green_mask: int = bitboard.get_green_mask()
+        blue_mask: int = bitboard.get_blue_mask()
 
-        Returns:
-            Any | None: New mill if present, otherwise None
+        for index in indexes:
+            for line_index in LINES_THROUGH[index]:
+                line_mask: int = MILL_MASKS[line_index]
+                if (
+                    green_mask & line_mask == line_mask
+                    or blue_mask & line_mask == line_mask
+                ):
+                    self._current_mills.add(line_index)
+                else:
+                    self._current_mills.discard(line_index)
+
+    def get_mills(self) -> list:
         """
+        Gets the mills on the board
 
-        new_mill = None
+        Returns:
+            list: List of mills, each a list of position indexes
+        """
+        return [
+            list(MILL_LINES[line_index]) for line_index in sorted(self._current_mills)
+        ]
 
-        for mill in mills:
-            if mill not in self.mills:
-                new_mill = mill
-                break
+    def compare_mills(self, mills: Iterable[Iterable[int]]) -> List[int] | None:
+        """
+        Returns new mill if present
 
-        self.mills = mills
+        Args:
+            mills (Iterable[Iterable[int]]): Mills to compare against the mills seen last time
 
-        return new_mill
+        Returns:
+            List[int] | None: New mill if present, otherwise None
+        """
+        return self._compare_mill_lines(
+            {MILL_LINE_INDEXES[frozenset(mill)] for mill in mills}
+        )
 
     def get_new_mill(self) -> List[int] | None:
         """
         Gets the new mill
 
         Returns:
-            Any | None: New mill if present, otherwise None
+            List[int] | None: New mill if present, otherwise None
+        """
+        return self._compare_mill_lines(set(self._current_mills))
+
+    def _compare_mill_lines(self, mill_lines: Set[int]) -> List[int] | None:
+        """
+        Finds a mill line that was not present at the last comparison and remembers the given lines
+
+        Args:
+            mill_lines (Set[int]): Indexes of the mill lines
+
+        Returns:
+            List[int] | None: New mill if present, otherwise None
         """
+        new_mill_lines: Set[int] = mill_lines - self.mills
+        self.mills = mill_lines
 
-        mills = self.get_mills()
-        return self.compare_mills(mills)
+        if not new_mill_lines:
+            return None
+        return list(MILL_LINES[min(new_mill_lines)])
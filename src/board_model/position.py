@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import CONSTANTS
+from board_model.piece import Piece
 from screens.renderable_token import RenderableToken
 
 from typing import TYPE_CHECKING, List, Tuple, TypedDict
@@ -9,11 +10,15 @@ import pygame
 from pygame import Rect
 
 if TYPE_CHECKING:
-    from .piece import Piece
+    from engine.bitboard import BitBoard
 
 __author__ = "Snekith, Patrick and Ashwin"
 __date__ = "17/06/2023"
 
+# Shared piece views, the bitboard is the source of truth for what is at a position
+GREEN_PIECE = Piece(True)
+BLUE_PIECE = Piece(False)
+
 
 class Neighbours(TypedDict):
     """
@@ -35,7 +40,7 @@ class Position(RenderableToken):
         center: Tuple[int, int],
         neighbours: Neighbours,
         index: int,
-        piece: Piece = None,
+        bitboard: BitBoard,
     ) -> None:
         """
         Initialising Position class
@@ -44,15 +49,14 @@ class Position(RenderableToken):
             center (Tuple[int, int]): Centre of position in the form [x, y]
             neighbours (Neighbours): Neighbours of a position. Contains the index of the neighbours in the position list at either left, right, top or bottom else None
             index (int): Index of position in position list
-            is_occupied (bool, optional): Boolean to see if position is occupied by another piece. Defaults to False.
-            piece (Piece): Piece at position
+            bitboard (BitBoard): Bitboard holding the piece at this position
         """
 
         self.index: int = index
         self.radius = CONSTANTS.BOARD_TOKEN_RADIUS
         self.x_pos: int = center[0]
         self.y_pos: int = center[1]
-        self._piece = piece
+        self._bitboard: BitBoard = bitboard
         self.neighbours: Neighbours = neighbours
         self.rect = pygame.Rect(
             self.x_pos - self.radius,
@@ -118,26 +122,30 @@ class Position(RenderableToken):
             bool: if position is occupied by another piece
         """
 
-        return self._piece is not None
+        return self._bitboard.is_occupied(self.index)
 
-    def get_piece(self) -> Piece:
+    def get_piece(self) -> Piece | None:
         """
         Gets piece at position
 
         Returns:
-            Piece: Piece at position
+            Piece | None: Piece at position, None if empty
         """
-
-        return self._piece
+        is_green: bool | None = self._bitboard.get_is_green(self.index)
+        if is_green is None:
+            return None
+        return GREEN_PIECE if is_green else BLUE_PIECE
 
     def set_piece(self, piece: Piece) -> None:
         """
         Sets piece at current position
 
         Args:
-            piece (Piece): New piece to be assigned at position
+            piece (Piece): New piece to be assigned at position, None to empty the position
         """
-        self._piece: Piece = piece
+        self._bitboard.set_piece(
+            self.index, None if piece is None else piece.get_is_green()
+        )
 
     def get_index(self) -> int:
         """
@@ -168,4 +176,4 @@ class Position(RenderableToken):
         Returns:
             bool: True if green
         """
-        return self._piece.get_is_green()
+        return self._bitboard.get_is_green(self.index)
@@ -0,0 +1,52 @@
+"""
+Run this file to build the opening book the computer player uses in the placement phase. Run it from the project directory so the book is written where the game reads it.
+"""
+
+import argparse
+
+import CONSTANTS
+from ai.alpha_beta_search import AlphaBetaSearch
+from ai.opening_book_builder import OpeningBookBuilder
+from ai.transposition_table import TranspositionTable
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Build the placement phase opening book from deep searches"
+    )
+    parser.add_argument(
+        "--max-plies",
+        type=int,
+        default=CONSTANTS.OPENING_BOOK_MAX_PLIES,
+        help="plies from the start of the game to search positions up to",
+    )
+    parser.add_argument(
+        "--full-width-plies",
+        type=int,
+        default=CONSTANTS.OPENING_BOOK_FULL_WIDTH_PLIES,
+        help="plies from the start of the game to follow every move for",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=2 * CONSTANTS.AI_TIME_BUDGET,
+        help="seconds to search each position for",
+    )
+    parser.add_argument(
+        "--output",
+        default=CONSTANTS.OPENING_BOOK_PATH,
+        help="path to write the book file to",
+    )
+    arguments = parser.parse_args()
+
+    builder = OpeningBookBuilder(True)
+    builder.add_searches(
+        AlphaBetaSearch(
+            arguments.time_budget, transposition_table=TranspositionTable()
+        ),
+        arguments.max_plies,
+        arguments.full_width_plies,
+    )
+    builder.write(arguments.output)
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+import CONSTANTS
+from actions.move_type import MoveType
+from engine.board_layout import ADJACENCY_MASKS, BOARD_SIZE, LINES_THROUGH, MILL_LINES
+
+if TYPE_CHECKING:
+    from engine.game_state import GameState
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+# Column of the move masks holding placements from the hand, the other columns are the points pieces move from
+PLACE_COLUMN = BOARD_SIZE
+COLUMN_COUNT = BOARD_SIZE + 1
+
+# Move types in the order of their codes in the move type arrays
+MOVE_TYPES: Tuple[MoveType, ...] = (
+    MoveType.PLACE,
+    MoveType.MOVE,
+    MoveType.REMOVE,
+    MoveType.FLY,
+)
+PLACE_CODE, MOVE_CODE, REMOVE_CODE, FLY_CODE = range(len(MOVE_TYPES))
+
+# Winner of a board that is not over
+NO_WINNER = -1
+
+# Bit of each point, and of each column with placements moving no piece
+POINT_BITS = np.left_shift(np.uint32(1), np.arange(BOARD_SIZE, dtype=np.uint32))
+ORIGIN_BITS = np.append(POINT_BITS, np.uint32(0))
+
+# Bitmask of the points adjacent to each point
+ADJACENCY = np.array(ADJACENCY_MASKS, dtype=np.uint32)
+
+# Bitmask of the points in each mill line
+MILLS = np.array(
+    [sum(1 << point for point in line) for line in MILL_LINES], dtype=np.uint32
+)
+
+# Bitmask of the other two points of each mill line through each point, shape (points, 2)
+MILL_PARTNERS = np.array(
+    [
+        [int(MILLS[line_index]) & ~(1 << point) for line_index in LINES_THROUGH[point]]
+        for point in range(BOARD_SIZE)
+    ],
+    dtype=np.uint32,
+)
+
+# Destinations whose mill line, the first or second through the destination, is broken by moving the piece at each origin, shape (columns, 2)
+BROKEN_DESTINATIONS = np.array(
+    [
+        [
+            sum(
+                1 << point
+                for point in range(BOARD_SIZE)
+                if int(MILL_PARTNERS[point, line]) & int(ORIGIN_BITS[column])
+            )
+            for line in range(2)
+        ]
+        for column in range(COLUMN_COUNT)
+    ],
+    dtype=np.uint32,
+)
+
+# Number of set bits of each byte
+_BYTE_BIT_COUNTS = np.array([bin(byte).count("1") for byte in range(256)], np.uint8)
+
+
+class BatchPositions(NamedTuple):
+    """
+    Responsible for many positions held as arrays, one element per board
+
+    Args:
+        NamedTuple (NamedTuple): Green and blue bitmasks (uint32), pieces left in each hand, side to move and whether the side to move has to remove a piece
+    """
+
+    green_masks: np.ndarray
+    blue_masks: np.ndarray
+    green_hands: np.ndarray
+    blue_hands: np.ndarray
+    is_green_to_move: np.ndarray
+    is_pending_remove: np.ndarray
+
+
+class BatchMoves(NamedTuple):
+    """
+    Responsible for the legal moves of many positions, one row per board.
+    Move masks have a column per point a piece moves from holding the points it can move to, and PLACE_COLUMN holding the points a piece can be placed on
+
+    Args:
+        NamedTuple (NamedTuple): Move type codes, indexes into MOVE_TYPES, move masks, the moves of the move masks that form a mill, opponent pieces that can be removed, number of legal moves and winners (1 green, 0 blue, NO_WINNER)
+    """
+
+    move_types: np.ndarray
+    move_masks: np.ndarray
+    mill_masks: np.ndarray
+    removable_masks: np.ndarray
+    move_counts: np.ndarray
+    winners: np.ndarray
+
+
+def create_batch_positions(game_states: Sequence[GameState]) -> BatchPositions:
+    """
+    Packs game states into arrays
+
+    Args:
+        game_states (Sequence[GameState]): Game states to pack
+
+    Returns:
+        BatchPositions: Positions of the game states
+    """
+    bitboards = [game_state.get_bitboard() for game_state in game_states]
+    return BatchPositions(
+        np.array([bitboard.get_green_mask() for bitboard in bitboards], np.uint32),
+        np.array([bitboard.get_blue_mask() for bitboard in bitboards], np.uint32),
+        np.array(
+            [game_state.get_pieces_in_hand(True) for game_state in game_states],
+            np.uint8,
+        ),
+        np.array(
+            [game_state.get_pieces_in_hand(False) for game_state in game_states],
+            np.uint8,
+        ),
+        np.array([bitboard.get_is_green_to_move() for bitboard in bitboards], bool),
+        np.array([game_state.is_pending_remove() for game_state in game_states], bool),
+    )
+
+
+def count_bits(masks: np.ndarray) -> np.ndarray:
+    """
+    Counts the set bits of every mask
+
+    Args:
+        masks (np.ndarray): Bitmasks, uint32
+
+    Returns:
+        np.ndarray: Number of set bits of each mask
+    """
+    masks = np.ascontiguousarray(masks, dtype=np.uint32)
+    byte_counts = _BYTE_BIT_COUNTS[masks.view(np.uint8)]
+    return byte_counts.reshape(masks.shape + (4,)).sum(axis=-1, dtype=np.int32)
+
+
+def get_mill_masks(colour_masks: np.ndarray) -> np.ndarray:
+    """
+    Gets the pieces of every board that are part of a mill
+
+    Args:
+        colour_masks (np.ndarray): Bitmasks of one player's pieces, uint32
+
+    Returns:
+        np.ndarray: Bitmasks of the pieces in mills
+    """
+    is_mill = colour_masks[..., None] & MILLS == MILLS
+    return np.bitwise_or.reduce(np.where(is_mill, MILLS, np.uint32(0)), axis=-1)
+
+
+def generate_batch_moves(positions: BatchPositions) -> BatchMoves:
+    """
+    Generates the legal moves, the moves forming a mill and the winner of every board with array operations, matching generate_moves and GameState.get_winner
+
+    Args:
+        positions (BatchPositions): Positions to generate moves for
+
+    Returns:
+        BatchMoves: Moves of every board
+    """
+    green_masks = np.asarray(positions.green_masks, np.uint32)
+    blue_masks = np.asarray(positions.blue_masks, np.uint32)
+    is_green_to_move = np.asarray(positions.is_green_to_move, bool)
+    is_pending_remove = np.asarray(positions.is_pending_remove, bool)
+    is_pieces_placed = (np.asarray(positions.green_hands) == 0) & (
+        np.asarray(positions.blue_hands) == 0
+    )
+
+    mover_masks = np.where(is_green_to_move, green_masks, blue_masks)
+    opponent_masks = np.where(is_green_to_move, blue_masks, green_masks)
+    empty_masks = ~(green_masks | blue_masks) & np.uint32((1 << BOARD_SIZE) - 1)
+    mover_counts = count_bits(mover_masks)
+
+    move_types = np.select(
+        [
+            is_pending_remove,
+            ~is_pieces_placed,
+            mover_counts <= CONSTANTS.FLYING_PIECE_COUNT,
+        ],
+        [REMOVE_CODE, PLACE_CODE, FLY_CODE],
+        MOVE_CODE,
+    ).astype(np.uint8)
+
+    # destinations of each piece of the side to move, then placements in the last column
+    has_piece = mover_masks[:, None] & POINT_BITS != 0
+    piece_destinations = np.where(
+        (move_types == FLY_CODE)[:, None],
+        empty_masks[:, None],
+        ADJACENCY & empty_masks[:, None],
+    )
+    piece_destinations = np.where(
+        has_piece & np.isin(move_types, (MOVE_CODE, FLY_CODE))[:, None],
+        piece_destinations,
+        np.uint32(0),
+    )
+    placements = np.where(move_types == PLACE_CODE, empty_masks, np.uint32(0))
+    move_masks = np.concatenate([piece_destinations, placements[:, None]], axis=1)
+
+    # a move forms a mill if both other points of a line through its destination hold pieces, unless the moving piece is one of them
+    is_line_complete = mover_masks[:, None, None] & MILL_PARTNERS == MILL_PARTNERS
+    complete_masks = np.bitwise_or.reduce(
+        np.where(is_line_complete, POINT_BITS[:, None], np.uint32(0)), axis=1
+    )
+    mill_masks = (
+        np.bitwise_or.reduce(complete_masks[:, None, :] & ~BROKEN_DESTINATIONS, axis=-1)
+        & move_masks
+    )
+
+    removable_masks = opponent_masks & ~get_mill_masks(opponent_masks)
+    removable_masks = np.where(removable_masks != 0, removable_masks, opponent_masks)
+    removable_counts = count_bits(removable_masks)
+
+    mill_move_counts = count_bits(mill_masks).sum(axis=1)
+    move_counts = (
+        count_bits(move_masks).sum(axis=1)
+        - mill_move_counts
+        + mill_move_counts * np.maximum(removable_counts, 1)
+    )
+    move_counts = np.where(is_pending_remove, removable_counts, move_counts)
+
+    # once every piece is placed a player loses with two pieces or when they cannot move
+    has_legal_moves = np.where(is_pending_remove, removable_counts > 0, move_counts > 0)
+    winners = np.select(
+        [
+            ~is_pieces_placed,
+            count_bits(blue_masks) <= CONSTANTS.LOSING_PIECE_COUNT,
+            count_bits(green_masks) <= CONSTANTS.LOSING_PIECE_COUNT,
+            ~has_legal_moves,
+        ],
+        [NO_WINNER, 1, 0, ~is_green_to_move],
+        NO_WINNER,
+    ).astype(np.int8)
+
+    return BatchMoves(
+        move_types,
+        move_masks,
+        mill_masks,
+        removable_masks,
+        move_counts.astype(np.int32),
+        winners,
+    )
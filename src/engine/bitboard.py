@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from typing import Iterator
+
+from engine.board_layout import FULL_BOARD_MASK
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+
+def iter_indexes(mask: int) -> Iterator[int]:
+    """
+    Iterates over the indexes of the set bits of a mask, lowest first
+
+    Args:
+        mask (int): Bitmask of points
+
+    Yields:
+        int: Index of a set bit
+    """
+    while mask:
+        lowest_bit: int = mask & -mask
+        yield lowest_bit.bit_length() - 1
+        mask ^= lowest_bit
+
+
+class BitBoard:
+    def __init__(
+        self, green_mask: int = 0, blue_mask: int = 0, is_green_to_move: bool = True
+    ) -> None:
+        """
+        Initialises bitboard. The board is stored as one 24 bit integer per colour plus the side to move
+
+        Args:
+            green_mask (int, optional): Bitmask of green pieces. Defaults to 0.
+            blue_mask (int, optional): Bitmask of blue pieces. Defaults to 0.
+            is_green_to_move (bool, optional): True if green (player 1) is to move. Defaults to True.
+        """
+        self._green_mask: int = green_mask
+        self._blue_mask: int = blue_mask
+        self._is_green_to_move: bool = is_green_to_move
+
+    def reset(self) -> None:
+        """
+        Resets bitboard to an empty board with green to move
+        """
+        self._green_mask = 0
+        self._blue_mask = 0
+        self._is_green_to_move = True
+
+    def get_green_mask(self) -> int:
+        """
+        Gets bitmask of green pieces
+
+        Returns:
+            int: Bitmask of green pieces
+        """
+        return self._green_mask
+
+    def get_blue_mask(self) -> int:
+        """
+        Gets bitmask of blue pieces
+
+        Returns:
+            int: Bitmask of blue pieces
+        """
+        return self._blue_mask
+
+    def get_colour_mask(self, is_green: bool) -> int:
+        """
+        Gets bitmask of pieces of a colour
+
+        Args:
+            is_green (bool): Whether to get green or blue pieces
+
+        Returns:
+            int: Bitmask of pieces of the colour
+        """
+        return self._green_mask if is_green else self._blue_mask
+
+    def get_occupied_mask(self) -> int:
+        """
+        Gets bitmask of occupied points
+
+        Returns:
+            int: Bitmask of occupied points
+        """
+        return self._green_mask | self._blue_mask
+
+    def get_empty_mask(self) -> int:
+        """
+        Gets bitmask of empty points
+
+        Returns:
+            int: Bitmask of empty points
+        """
+        return FULL_BOARD_MASK & ~(self._green_mask | self._blue_mask)
+
+    def count_pieces(self, is_green: bool) -> int:
+        """
+        Counts pieces of a colour
+
+        Args:
+            is_green (bool): Whether to count green or blue pieces
+
+        Returns:
+            int: Number of pieces of the colour on the board
+        """
+        return self.get_colour_mask(is_green).bit_count()
+
+    def is_occupied(self, index: int) -> bool:
+        """
+        Checks if point is occupied
+
+        Args:
+            index (int): Index of point
+
+        Returns:
+            bool: True if a piece is at the point
+        """
+        return bool((self._green_mask | self._blue_mask) >> index & 1)
+
+    def get_is_green(self, index: int) -> bool | None:
+        """
+        Gets the colour of the piece at a point
+
+        Args:
+            index (int): Index of point
+
+        Returns:
+            bool | None: True if green, False if blue, None if empty
+        """
+        if self._green_mask >> index & 1:
+            return True
+        if self._blue_mask >> index & 1:
+            return False
+        return None
+
+    def set_piece(self, index: int, is_green: bool | None) -> None:
+        """
+        Sets the piece at a point
+
+        Args:
+            index (int): Index of point
+            is_green (bool | None): Colour of the new piece, None to empty the point
+        """
+        bit: int = 1 << index
+        self._green_mask &= ~bit
+        self._blue_mask &= ~bit
+
+        if is_green is True:
+            self._green_mask |= bit
+        elif is_green is False:
+            self._blue_mask |= bit
+
+    def get_is_green_to_move(self) -> bool:
+        """
+        Gets side to move
+
+        Returns:
+            bool: True if green (player 1) is to move
+        """
+        return self._is_green_to_move
+
+    def toggle_side_to_move(self) -> None:
+        """
+        Passes the move to the other side
+        """
+        self._is_green_to_move = not self._is_green_to_move
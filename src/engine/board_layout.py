@@ -0,0 +1,89 @@
+from typing import Dict, List, Tuple
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+# Number of points on the board
+BOARD_SIZE = 24
+
+# Mask with a bit set for every point on the board
+FULL_BOARD_MASK = (1 << BOARD_SIZE) - 1
+
+# List of neighbours for each position in the game board (ordered by each piece's index)
+NEIGHBOURS: List[Dict[str, int | None]] = [
+    {"top": None, "bottom": 9, "left": None, "right": 1},
+    {"top": None, "bottom": 4, "left": 0, "right": 2},
+    {"top": None, "bottom": 14, "left": 1, "right": None},
+    {"top": None, "bottom": 10, "left": None, "right": 4},
+    {"top": 1, "bottom": 7, "left": 3, "right": 5},
+    {"top": None, "bottom": 13, "left": 4, "right": None},
+    {"top": None, "bottom": 11, "left": None, "right": 7},
+    {"top": 4, "bottom": None, "left": 6, "right": 8},
+    {"top": None, "bottom": 12, "left": 7, "right": None},
+    {"top": 0, "bottom": 21, "left": None, "right": 10},
+    {"top": 3, "bottom": 18, "left": 9, "right": 11},
+    {"top": 6, "bottom": 15, "left": 10, "right": None},
+    {"top": 8, "bottom": 17, "left": None, "right": 13},
+    {"top": 5, "bottom": 20, "left": 12, "right": 14},
+    {"top": 2, "bottom": 23, "left": 13, "right": None},
+    {"top": 11, "bottom": None, "left": None, "right": 16},
+    {"top": None, "bottom": 19, "left": 15, "right": 17},
+    {"top": 12, "bottom": None, "left": 16, "right": None},
+    {"top": 10, "bottom": None, "left": None, "right": 19},
+    {"top": 16, "bottom": 22, "left": 18, "right": 20},
+    {"top": 13, "bottom": None, "left": 19, "right": None},
+    {"top": 9, "bottom": None, "left": None, "right": 22},
+    {"top": 19, "bottom": None, "left": 21, "right": 23},
+    {"top": 14, "bottom": None, "left": 22, "right": None},
+]
+
+# Indexes of the points adjacent to each point
+ADJACENT_INDEXES: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(neighbour for neighbour in neighbours.values() if neighbour is not None)
+    for neighbours in NEIGHBOURS
+)
+
+# Bitmask of the points adjacent to each point
+ADJACENCY_MASKS: Tuple[int, ...] = tuple(
+    sum(1 << neighbour for neighbour in adjacent) for adjacent in ADJACENT_INDEXES
+)
+
+
+def _create_mill_lines() -> Tuple[Tuple[int, int, int], ...]:
+    """
+    Creates the mill lines from the neighbours of each point. A line runs through every point with neighbours on both sides in a direction
+
+    Returns:
+        Tuple[Tuple[int, int, int], ...]: Mill lines as index triples ordered end, middle, end
+    """
+    mill_lines: List[Tuple[int, int, int]] = []
+    for index, neighbours in enumerate(NEIGHBOURS):
+        for direction in (("top", "bottom"), ("left", "right")):
+            if (
+                neighbours[direction[0]] is not None
+                and neighbours[direction[1]] is not None
+            ):
+                mill_lines.append(
+                    (neighbours[direction[0]], index, neighbours[direction[1]])
+                )
+    return tuple(mill_lines)
+
+
+# The 16 lines of three points that form a mill
+MILL_LINES: Tuple[Tuple[int, int, int], ...] = _create_mill_lines()
+
+# Bitmask of the points in each mill line
+MILL_MASKS: Tuple[int, ...] = tuple(
+    (1 << line[0]) | (1 << line[1]) | (1 << line[2]) for line in MILL_LINES
+)
+
+# Indexes of the mill lines through each point, every point is on exactly two lines
+LINES_THROUGH: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(line_index for line_index, line in enumerate(MILL_LINES) if point in line)
+    for point in range(BOARD_SIZE)
+)
+
+# Lookup from a mill line (in any order) to its index in MILL_LINES
+MILL_LINE_INDEXES: Dict[frozenset, int] = {
+    frozenset(line): line_index for line_index, line in enumerate(MILL_LINES)
+}
@@ -0,0 +1,478 @@
+from __future__ import annotations
+
+from typing import List, Tuple
+
+import CONSTANTS
+from actions.move_type import MoveType
+from engine.bitboard import BitBoard, iter_indexes
+from engine.board_layout import ADJACENCY_MASKS, LINES_THROUGH, MILL_MASKS
+from engine.move import Move
+from engine.zobrist import (
+    BLUE_TO_MOVE_KEY,
+    HAND_KEYS,
+    PENDING_REMOVE_KEY,
+    PIECE_KEYS,
+    compute_hash,
+)
+
+# Undo record: move made, side that made it, pieces in hand of green and blue, pending remove and hash before the move
+UndoRecord = Tuple[Move, bool, int, int, bool, int]
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+
+class GameState:
+    def __init__(self) -> None:
+        """
+        Initialises the rules engine. Holds the board, the pieces left in each player's hand and whether the side to move has to remove a piece.
+        Has no display or audio dependencies so it can run anywhere
+        """
+        self._bitboard = BitBoard()
+        self._green_pieces_in_hand: int = CONSTANTS.PIECES_PER_PLAYER
+        self._blue_pieces_in_hand: int = CONSTANTS.PIECES_PER_PLAYER
+        self._is_pending_remove: bool = False
+        self._undo_stack: List[UndoRecord] = []
+        self._hash: int = compute_hash(self)
+
+    def reset(self) -> None:
+        """
+        Resets to the start of a game
+        """
+        self._bitboard.reset()
+        self._green_pieces_in_hand = CONSTANTS.PIECES_PER_PLAYER
+        self._blue_pieces_in_hand = CONSTANTS.PIECES_PER_PLAYER
+        self._is_pending_remove = False
+        self._undo_stack = []
+        self._hash = compute_hash(self)
+
+    def copy(self) -> GameState:
+        """
+        Copies the game state. The copy starts with an empty undo stack
+
+        Returns:
+            GameState: Independent copy of the game state
+        """
+        game_state = GameState()
+        game_state._bitboard = BitBoard(
+            self._bitboard.get_green_mask(),
+            self._bitboard.get_blue_mask(),
+            self._bitboard.get_is_green_to_move(),
+        )
+        game_state._green_pieces_in_hand = self._green_pieces_in_hand
+        game_state._blue_pieces_in_hand = self._blue_pieces_in_hand
+        game_state._is_pending_remove = self._is_pending_remove
+        game_state._hash = self._hash
+        return game_state
+
+    def set_position(
+        self,
+        green_mask: int,
+        blue_mask: int,
+        green_pieces_in_hand: int,
+        blue_pieces_in_hand: int,
+        is_green_to_move: bool,
+        is_pending_remove: bool = False,
+    ) -> None:
+        """
+        Sets up a position, such as one to analyse. The undo stack is cleared
+
+        Args:
+            green_mask (int): Bitmask of green pieces
+            blue_mask (int): Bitmask of blue pieces
+            green_pieces_in_hand (int): Pieces green has left to place
+            blue_pieces_in_hand (int): Pieces blue has left to place
+            is_green_to_move (bool): True if green (player 1) is to move
+            is_pending_remove (bool, optional): True if the side to move formed a mill and has to remove a piece. Defaults to False.
+        """
+        self._bitboard.reset()
+        for index in iter_indexes(green_mask):
+            self._bitboard.set_piece(index, True)
+        for index in iter_indexes(blue_mask):
+            self._bitboard.set_piece(index, False)
+        if not is_green_to_move:
+            self._bitboard.toggle_side_to_move()
+        self._green_pieces_in_hand = green_pieces_in_hand
+        self._blue_pieces_in_hand = blue_pieces_in_hand
+        self._is_pending_remove = is_pending_remove
+        self._undo_stack = []
+        self._hash = compute_hash(self)
+
+    def get_bitboard(self) -> BitBoard:
+        """
+        Gets bitboard
+
+        Returns:
+            BitBoard: Bitboard holding the pieces and side to move
+        """
+        return self._bitboard
+
+    def get_is_green_to_move(self) -> bool:
+        """
+        Gets side to move
+
+        Returns:
+            bool: True if green (player 1) is to move
+        """
+        return self._bitboard.get_is_green_to_move()
+
+    def get_hash(self) -> int:
+        """
+        Gets the Zobrist hash of the position, kept up to date on every move
+
+        Returns:
+            int: 64 bit hash of pieces, side to move, pieces in hand and pending remove
+        """
+        return self._hash
+
+    def get_pieces_in_hand(self, is_green: bool) -> int:
+        """
+        Gets pieces a player has left to place
+
+        Args:
+            is_green (bool): Whether to get green or blue pieces
+
+        Returns:
+            int: Pieces left to place
+        """
+        return self._green_pieces_in_hand if is_green else self._blue_pieces_in_hand
+
+    def count_pieces(self, is_green: bool) -> int:
+        """
+        Counts pieces a player has on the board
+
+        Args:
+            is_green (bool): Whether to count green or blue pieces
+
+        Returns:
+            int: Pieces on the board
+        """
+        return self._bitboard.count_pieces(is_green)
+
+    def is_pieces_placed(self) -> bool:
+        """
+        Checks if all pieces have been placed
+
+        Returns:
+            bool: True if both players have placed all their pieces
+        """
+        return self._green_pieces_in_hand == 0 and self._blue_pieces_in_hand == 0
+
+    def is_pending_remove(self) -> bool:
+        """
+        Checks if the side to move formed a mill and has to remove a piece
+
+        Returns:
+            bool: True if a piece has to be removed
+        """
+        return self._is_pending_remove
+
+    def get_move_type(self) -> MoveType:
+        """
+        Gets the type of move the side to move has to make
+
+        Returns:
+            MoveType: Move type
+        """
+        if self._is_pending_remove:
+            return MoveType.REMOVE
+        if not self.is_pieces_placed():
+            return MoveType.PLACE
+        if (
+            self._bitboard.count_pieces(self._bitboard.get_is_green_to_move())
+            <= CONSTANTS.FLYING_PIECE_COUNT
+        ):
+            return MoveType.FLY
+        return MoveType.MOVE
+
+    def get_mill_mask(self, is_green: bool) -> int:
+        """
+        Gets the positions of a player's pieces that are part of a mill
+
+        Args:
+            is_green (bool): Whether to get green or blue mills
+
+        Returns:
+            int: Bitmask of the pieces in mills
+        """
+        colour_mask: int = self._bitboard.get_colour_mask(is_green)
+        mill_mask = 0
+        for line_mask in MILL_MASKS:
+            if colour_mask & line_mask == line_mask:
+                mill_mask |= line_mask
+        return mill_mask
+
+    def is_in_mill(self, index: int) -> bool:
+        """
+        Checks if the piece at a position is part of a mill
+
+        Args:
+            index (int): Index of position
+
+        Returns:
+            bool: True if the piece is in a mill
+        """
+        is_green: bool | None = self._bitboard.get_is_green(index)
+        if is_green is None:
+            return False
+
+        colour_mask: int = self._bitboard.get_colour_mask(is_green)
+        for line_index in LINES_THROUGH[index]:
+            line_mask: int = MILL_MASKS[line_index]
+            if colour_mask & line_mask == line_mask:
+                return True
+        return False
+
+    def get_placeable_mask(self) -> int:
+        """
+        Gets the positions a piece can be placed on
+
+        Returns:
+            int: Bitmask of positions
+        """
+        return self._bitboard.get_empty_mask()
+
+    def get_destination_mask(self, origin: int) -> int:
+        """
+        Gets the positions the piece at the origin can move or fly to
+
+        Args:
+            origin (int): Index of the piece to move
+
+        Returns:
+            int: Bitmask of positions
+        """
+        if self.get_move_type() == MoveType.FLY:
+            return self._bitboard.get_empty_mask()
+        return ADJACENCY_MASKS[origin] & self._bitboard.get_empty_mask()
+
+    def get_removable_mask(self) -> int:
+        """
+        Gets the opponent pieces that can be removed. Pieces in mills can only be removed if every piece is in a mill
+
+        Returns:
+            int: Bitmask of positions
+        """
+        is_opponent_green: bool = not self._bitboard.get_is_green_to_move()
+        opponent_mask: int = self._bitboard.get_colour_mask(is_opponent_green)
+        removable_mask: int = opponent_mask & ~self.get_mill_mask(is_opponent_green)
+        return removable_mask if removable_mask else opponent_mask
+
+    def has_legal_moves(self) -> bool:
+        """
+        Checks if the side to move has any legal move
+
+        Returns:
+            bool: True if there is a legal move
+        """
+        move_type: MoveType = self.get_move_type()
+        if move_type == MoveType.REMOVE:
+            return self.get_removable_mask() != 0
+        if move_type in (MoveType.PLACE, MoveType.FLY):
+            return self._bitboard.get_empty_mask() != 0
+
+        empty_mask: int = self._bitboard.get_empty_mask()
+        colour_mask: int = self._bitboard.get_colour_mask(
+            self._bitboard.get_is_green_to_move()
+        )
+        for index, adjacency_mask in enumerate(ADJACENCY_MASKS):
+            if colour_mask >> index & 1 and adjacency_mask & empty_mask:
+                return True
+        return False
+
+    def get_winner(self) -> bool | None:
+        """
+        Gets the winner. Once all pieces are placed a player loses with two pieces or when they cannot move
+
+        Returns:
+            bool | None: True if green (player 1) won, False if blue won, None if the game is not over
+        """
+        if not self.is_pieces_placed():
+            return None
+        if self._bitboard.count_pieces(False) <= CONSTANTS.LOSING_PIECE_COUNT:
+            return True
+        if self._bitboard.count_pieces(True) <= CONSTANTS.LOSING_PIECE_COUNT:
+            return False
+        if not self.has_legal_moves():
+            return not self._bitboard.get_is_green_to_move()
+        return None
+
+    def is_game_over(self) -> bool:
+        """
+        Checks if the game is over
+
+        Returns:
+            bool: True if the game is over
+        """
+        return self.get_winner() is not None
+
+    def place_piece(self, index: int) -> bool:
+        """
+        Places a piece of the side to move
+
+        Args:
+            index (int): Index of position to place on
+
+        Raises:
+            Exception: If placing is not allowed
+
+        Returns:
+            bool: True if the piece formed a mill and a piece has to be removed
+        """
+        if (
+            self.get_move_type() != MoveType.PLACE
+            or not self.get_placeable_mask() >> index & 1
+        ):
+            raise Exception(f"Cannot place a piece on {index}")
+
+        self.make_move(Move(None, index, None))
+        return self._is_pending_remove
+
+    def move_piece(self, origin: int, destination: int) -> bool:
+        """
+        Moves or flies a piece of the side to move
+
+        Args:
+            origin (int): Index of position to move from
+            destination (int): Index of position to move to
+
+        Raises:
+            Exception: If the move is not allowed
+
+        Returns:
+            bool: True if the piece formed a mill and a piece has to be removed
+        """
+        is_green: bool = self._bitboard.get_is_green_to_move()
+        if (
+            self.get_move_type() not in (MoveType.MOVE, MoveType.FLY)
+            or self._bitboard.get_is_green(origin) != is_green
+            or not self.get_destination_mask(origin) >> destination & 1
+        ):
+            raise Exception(f"Cannot move a piece from {origin} to {destination}")
+
+        self.make_move(Move(origin, destination, None))
+        return self._is_pending_remove
+
+    def remove_piece(self, index: int) -> None:
+        """
+        Removes an opponent piece after forming a mill
+
+        Args:
+            index (int): Index of position to remove from
+
+        Raises:
+            Exception: If removing is not allowed
+        """
+        if not self._is_pending_remove or not self.get_removable_mask() >> index & 1:
+            raise Exception(f"Cannot remove a piece from {index}")
+
+        self.make_move(Move(None, None, index))
+
+    def make_move(self, move: Move) -> None:
+        """
+        Makes a move without checking it is legal and records how to unmake it.
+        A move that forms a mill without saying which piece to remove leaves the remove pending
+
+        Args:
+            move (Move): Move from the move generator, or one of its place, move or remove parts
+        """
+        is_green: bool = self._bitboard.get_is_green_to_move()
+        self._undo_stack.append(
+            (
+                move,
+                is_green,
+                self._green_pieces_in_hand,
+                self._blue_pieces_in_hand,
+                self._is_pending_remove,
+                self._hash,
+            )
+        )
+
+        if move.destination is not None:
+            if move.origin is None:
+                if is_green:
+                    pieces_in_hand: int = self._green_pieces_in_hand
+                    self._green_pieces_in_hand -= 1
+                else:
+                    pieces_in_hand = self._blue_pieces_in_hand
+                    self._blue_pieces_in_hand -= 1
+                self._hash ^= (
+                    HAND_KEYS[is_green][pieces_in_hand]
+                    ^ HAND_KEYS[is_green][pieces_in_hand - 1]
+                )
+            else:
+                self._bitboard.set_piece(move.origin, None)
+                self._hash ^= PIECE_KEYS[is_green][move.origin]
+            self._bitboard.set_piece(move.destination, is_green)
+            self._hash ^= PIECE_KEYS[is_green][move.destination]
+
+            if move.remove is None:
+                self._end_turn(move.destination)
+                return
+
+        self._bitboard.set_piece(move.remove, None)
+        self._hash ^= PIECE_KEYS[not is_green][move.remove] ^ BLUE_TO_MOVE_KEY
+        if self._is_pending_remove:
+            self._is_pending_remove = False
+            self._hash ^= PENDING_REMOVE_KEY
+        self._bitboard.toggle_side_to_move()
+
+    def unmake_move(self) -> Move:
+        """
+        Unmakes the last move made
+
+        Raises:
+            Exception: If there is no move to unmake
+
+        Returns:
+            Move: Move that was unmade
+        """
+        if not self._undo_stack:
+            raise Exception("No move to unmake")
+
+        (
+            move,
+            is_green,
+            self._green_pieces_in_hand,
+            self._blue_pieces_in_hand,
+            self._is_pending_remove,
+            self._hash,
+        ) = self._undo_stack.pop()
+
+        if self._bitboard.get_is_green_to_move() != is_green:
+            self._bitboard.toggle_side_to_move()
+        if move.remove is not None:
+            self._bitboard.set_piece(move.remove, not is_green)
+        if move.destination is not None:
+            self._bitboard.set_piece(move.destination, None)
+            if move.origin is not None:
+                self._bitboard.set_piece(move.origin, is_green)
+
+        return move
+
+    def get_undo_depth(self) -> int:
+        """
+        Gets the number of moves that can be unmade
+
+        Returns:
+            int: Number of moves on the undo stack
+        """
+        return len(self._undo_stack)
+
+    def _end_turn(self, destination: int) -> bool:
+        """
+        Ends the turn after a piece arrives at a position, unless it formed a mill and there is a piece to remove
+
+        Args:
+            destination (int): Index of the position the piece arrived at
+
+        Returns:
+            bool: True if the piece formed a mill and a piece has to be removed
+        """
+        if self.is_in_mill(destination) and self.get_removable_mask():
+            self._is_pending_remove = True
+            self._hash ^= PENDING_REMOVE_KEY
+        else:
+            self._bitboard.toggle_side_to_move()
+            self._hash ^= BLUE_TO_MOVE_KEY
+        return self._is_pending_remove
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+
+class Move(NamedTuple):
+    """
+    Responsible for a complete move of the side to move
+
+    Args:
+        NamedTuple (NamedTuple): Index of the origin (None when placing), index of the destination (None when only removing) and index of the opponent piece removed after forming a mill (None if no mill is formed)
+    """
+
+    origin: int | None
+    destination: int | None
+    remove: int | None
+
+
+def encode_move(move: Move | None) -> int:
+    """
+    Encodes a move into 15 bits, five bits each for origin, destination and remove offset by one so that 0 means None
+
+    Args:
+        move (Move | None): Move to encode
+
+    Returns:
+        int: Encoded move, 0 for no move
+    """
+    if move is None:
+        return 0
+
+    encoded_move = 0
+    for shift, index in enumerate(move):
+        if index is not None:
+            encoded_move |= (index + 1) << (shift * 5)
+    return encoded_move
+
+
+def decode_move(encoded_move: int) -> Move | None:
+    """
+    Decodes a move encoded by encode_move
+
+    Args:
+        encoded_move (int): Encoded move
+
+    Returns:
+        Move | None: Decoded move, None for no move
+    """
+    if encoded_move == 0:
+        return None
+
+    return Move(
+        *(
+            (
+                (encoded_move >> (shift * 5) & 0x1F) - 1
+                if encoded_move >> (shift * 5) & 0x1F
+                else None
+            )
+            for shift in range(3)
+        )
+    )
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List
+
+from actions.move_type import MoveType
+from engine.bitboard import iter_indexes
+from engine.board_layout import ADJACENCY_MASKS, LINES_THROUGH, MILL_MASKS
+from engine.move import Move
+
+if TYPE_CHECKING:
+    from engine.game_state import GameState
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+
+def forms_mill(colour_mask: int, destination: int) -> bool:
+    """
+    Checks if a piece arriving at the destination completes a mill
+
+    Args:
+        colour_mask (int): Bitmask of the mover's pieces after the piece arrived
+        destination (int): Index of the position the piece arrived at
+
+    Returns:
+        bool: True if a mill is formed through the destination
+    """
+    for line_index in LINES_THROUGH[destination]:
+        line_mask: int = MILL_MASKS[line_index]
+        if colour_mask & line_mask == line_mask:
+            return True
+    return False
+
+
+def generate_moves(game_state: GameState) -> List[Move]:
+    """
+    Generates every legal move for the side to move without changing any state. Moves that form a mill are generated once per piece that can be removed
+
+    Args:
+        game_state (GameState): Game state to generate moves for
+
+    Returns:
+        List[Move]: List of legal moves
+    """
+    move_type: MoveType = game_state.get_move_type()
+
+    if move_type == MoveType.REMOVE:
+        return [
+            Move(None, None, remove)
+            for remove in iter_indexes(game_state.get_removable_mask())
+        ]
+
+    bitboard = game_state.get_bitboard()
+    colour_mask: int = bitboard.get_colour_mask(bitboard.get_is_green_to_move())
+    empty_mask: int = bitboard.get_empty_mask()
+    removable_indexes: List[int] | None = None
+    moves: List[Move] = []
+
+    if move_type == MoveType.PLACE:
+        origins = (None,)
+    else:
+        origins = iter_indexes(colour_mask)
+
+    for origin in origins:
+        if origin is None:
+            origin_mask: int = colour_mask
+            destination_mask: int = empty_mask
+        else:
+            origin_mask = colour_mask & ~(1 << origin)
+            destination_mask = (
+                empty_mask
+                if move_type == MoveType.FLY
+                else ADJACENCY_MASKS[origin] & empty_mask
+            )
+
+        for destination in iter_indexes(destination_mask):
+            if not forms_mill(origin_mask | 1 << destination, destination):
+                moves.append(Move(origin, destination, None))
+                continue
+
+            # moving your own piece never changes which opponent pieces can be removed
+            if removable_indexes is None:
+                removable_indexes = list(iter_indexes(game_state.get_removable_mask()))
+            for remove in removable_indexes:
+                moves.append(Move(origin, destination, remove))
+            if not removable_indexes:
+                moves.append(Move(origin, destination, None))
+
+    return moves
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import time
+from typing import Callable, List, NamedTuple, Tuple
+
+import CONSTANTS
+from engine.board_layout import BOARD_SIZE
+from engine.game_state import GameState
+from engine.move import Move
+from engine.move_generator import generate_moves
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+# Generates the moves of a game state
+MoveGenerator = Callable[[GameState], List[Move]]
+
+# Characters of a green piece, a blue piece and an empty point in a position string
+GREEN_CHARACTER = "G"
+BLUE_CHARACTER = "B"
+EMPTY_CHARACTER = "."
+
+# Position string of the start of a game
+START_POSITION = (
+    f"{EMPTY_CHARACTER * BOARD_SIZE} g "
+    f"{CONSTANTS.PIECES_PER_PLAYER}/{CONSTANTS.PIECES_PER_PLAYER} -"
+)
+
+
+class PerftResult(NamedTuple):
+    """
+    Responsible for the result of a timed perft run
+
+    Args:
+        NamedTuple (NamedTuple): Depth, leaf nodes counted, seconds taken and leaf nodes per second
+    """
+
+    depth: int
+    nodes: int
+    seconds: float
+    nodes_per_second: float
+
+
+def generate_actions(game_state: GameState) -> List[Move]:
+    """
+    Generates the moves of a game state the way the action handlers play them: a move forming a mill is one action and the removal that follows is another
+
+    Args:
+        game_state (GameState): Game state to generate moves for
+
+    Returns:
+        List[Move]: Legal actions, a removal leaves the remove pending
+    """
+    actions: List[Move] = []
+    for move in generate_moves(game_state):
+        if move.remove is None or move.destination is None:
+            actions.append(move)
+        elif not actions or actions[-1][:2] != move[:2]:
+            # the move generator lists the removals of a mill together
+            actions.append(Move(move.origin, move.destination, None))
+    return actions
+
+
+def perft(
+    game_state: GameState, depth: int, move_generator: MoveGenerator = generate_actions
+) -> int:
+    """
+    Counts the leaf nodes of the game tree to a depth. Games that are over have no moves, so they only count as leaves at the final depth
+
+    Args:
+        game_state (GameState): Game state to count from, moves made on it are unmade before returning
+        depth (int): Plies to count to
+        move_generator (MoveGenerator, optional): Move generator to count, generate_moves counts a mill and its removal as one ply. Defaults to generate_actions.
+
+    Returns:
+        int: Number of leaf nodes
+    """
+    if depth == 0:
+        return 1
+    if game_state.get_winner() is not None:
+        return 0
+
+    moves: List[Move] = move_generator(game_state)
+    if depth == 1:
+        return len(moves)
+
+    nodes: int = 0
+    for move in moves:
+        game_state.make_move(move)
+        nodes += perft(game_state, depth - 1, move_generator)
+        game_state.unmake_move()
+    return nodes
+
+
+def divide(
+    game_state: GameState, depth: int, move_generator: MoveGenerator = generate_actions
+) -> List[Tuple[Move, int]]:
+    """
+    Counts the leaf nodes under each move, to find the move where two move generators disagree
+
+    Args:
+        game_state (GameState): Game state to count from, moves made on it are unmade before returning
+        depth (int): Plies to count to, at least 1
+        move_generator (MoveGenerator, optional): Move generator to count. Defaults to generate_actions.
+
+    Returns:
+        List[Tuple[Move, int]]: Each move and the leaf nodes under it
+    """
+    if game_state.get_winner() is not None:
+        return []
+
+    counts: List[Tuple[Move, int]] = []
+    for move in move_generator(game_state):
+        game_state.make_move(move)
+        counts.append((move, perft(game_state, depth - 1, move_generator)))
+        game_state.unmake_move()
+    return counts
+
+
+def time_perft(
+    game_state: GameState, depth: int, move_generator: MoveGenerator = generate_actions
+) -> PerftResult:
+    """
+    Counts the leaf nodes to a depth and times it
+
+    Args:
+        game_state (GameState): Game state to count from
+        depth (int): Plies to count to
+        move_generator (MoveGenerator, optional): Move generator to count. Defaults to generate_actions.
+
+    Returns:
+        PerftResult: Leaf nodes and speed
+    """
+    start_time: float = time.perf_counter()
+    nodes: int = perft(game_state, depth, move_generator)
+    seconds: float = time.perf_counter() - start_time
+    return PerftResult(depth, nodes, seconds, nodes / seconds if seconds else 0.0)
+
+
+def parse_position(position: str) -> GameState:
+    """
+    Creates a game state from a position string: the 24 points from G, B or ., the side to move g or b,
+    the pieces in green's and blue's hands separated by /, and r if a piece has to be removed or - otherwise, such as "G..B.................... g 8/8 -"
+
+    Args:
+        position (str): Position string
+
+    Raises:
+        Exception: Malformed position string
+
+    Returns:
+        GameState: Game state of the position
+    """
+    fields: List[str] = position.split()
+    if (
+        len(fields) != 4
+        or len(fields[0]) != BOARD_SIZE
+        or set(fields[0]) - {GREEN_CHARACTER, BLUE_CHARACTER, EMPTY_CHARACTER}
+        or fields[1] not in ("g", "b")
+        or fields[3] not in ("r", "-")
+    ):
+        raise Exception(f"Malformed position {position!r}")
+
+    green_hand, _, blue_hand = fields[2].partition("/")
+    if not green_hand.isdigit() or not blue_hand.isdigit():
+        raise Exception(f"Malformed position {position!r}")
+
+    game_state = GameState()
+    game_state.set_position(
+        sum(
+            1 << index
+            for index, point in enumerate(fields[0])
+            if point == GREEN_CHARACTER
+        ),
+        sum(
+            1 << index
+            for index, point in enumerate(fields[0])
+            if point == BLUE_CHARACTER
+        ),
+        int(green_hand),
+        int(blue_hand),
+        fields[1] == "g",
+        fields[3] == "r",
+    )
+    return game_state
+
+
+def format_position(game_state: GameState) -> str:
+    """
+    Creates the position string of a game state, the reverse of parse_position
+
+    Args:
+        game_state (GameState): Game state
+
+    Returns:
+        str: Position string
+    """
+    bitboard = game_state.get_bitboard()
+    points: str = "".join(
+        (
+            GREEN_CHARACTER
+            if is_green
+            else BLUE_CHARACTER if is_green is False else EMPTY_CHARACTER
+        )
+        for is_green in map(bitboard.get_is_green, range(BOARD_SIZE))
+    )
+    return (
+        f"{points} {'g' if bitboard.get_is_green_to_move() else 'b'} "
+        f"{game_state.get_pieces_in_hand(True)}/{game_state.get_pieces_in_hand(False)} "
+        f"{'r' if game_state.is_pending_remove() else '-'}"
+    )
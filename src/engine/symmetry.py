@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Tuple
+
+import CONSTANTS
+from engine.board_layout import BOARD_SIZE
+from engine.move import Move
+
+if TYPE_CHECKING:
+    from engine.game_state import GameState
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+# Ring (0 outer, 1 middle, 2 inner), column and row of each point, columns and rows run from -1 to 1
+POINT_COORDINATES: Tuple[Tuple[int, int, int], ...] = (
+    (0, -1, -1),
+    (0, 0, -1),
+    (0, 1, -1),
+    (1, -1, -1),
+    (1, 0, -1),
+    (1, 1, -1),
+    (2, -1, -1),
+    (2, 0, -1),
+    (2, 1, -1),
+    (0, -1, 0),
+    (1, -1, 0),
+    (2, -1, 0),
+    (2, 1, 0),
+    (1, 1, 0),
+    (0, 1, 0),
+    (2, -1, 1),
+    (2, 0, 1),
+    (2, 1, 1),
+    (1, -1, 1),
+    (1, 0, 1),
+    (1, 1, 1),
+    (0, -1, 1),
+    (0, 0, 1),
+    (0, 1, 1),
+)
+
+# Number of symmetries, the 8 rotations and reflections of the square each with and without swapping the inner and outer rings
+SYMMETRY_COUNT = 16
+
+# Transform that leaves the board unchanged
+IDENTITY = 0
+
+# Bits of a canonical key used by the pieces of one colour
+_MASK_BITS = BOARD_SIZE
+
+# Bits of a canonical key used by the pieces in one hand
+_HAND_BITS = CONSTANTS.PIECES_PER_PLAYER.bit_length()
+
+
+def _create_permutations() -> Tuple[Tuple[int, ...], ...]:
+    """
+    Creates the permutation of the points for each symmetry. Bit 0 of a transform transposes, bit 1 mirrors the columns, bit 2 mirrors the rows and bit 3 swaps the inner and outer rings
+
+    Returns:
+        Tuple[Tuple[int, ...], ...]: Index each point is moved to, indexed [transform][index]
+    """
+    coordinate_indexes = {
+        coordinates: index for index, coordinates in enumerate(POINT_COORDINATES)
+    }
+    permutations = []
+
+    for transform in range(SYMMETRY_COUNT):
+        permutation = []
+        for ring, column, row in POINT_COORDINATES:
+            if transform & 1:
+                column, row = row, column
+            if transform & 2:
+                column = -column
+            if transform & 4:
+                row = -row
+            if transform & 8:
+                ring = 2 - ring
+            permutation.append(coordinate_indexes[(ring, column, row)])
+        permutations.append(tuple(permutation))
+
+    return tuple(permutations)
+
+
+# Index each point is moved to, indexed [transform][index]
+PERMUTATIONS: Tuple[Tuple[int, ...], ...] = _create_permutations()
+
+# Transform that undoes each transform
+INVERSE_TRANSFORMS: Tuple[int, ...] = tuple(
+    next(
+        inverse
+        for inverse in range(SYMMETRY_COUNT)
+        if all(
+            PERMUTATIONS[inverse][PERMUTATIONS[transform][index]] == index
+            for index in range(BOARD_SIZE)
+        )
+    )
+    for transform in range(SYMMETRY_COUNT)
+)
+
+
+def _create_byte_tables() -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+    """
+    Creates lookup tables that permute a mask a byte at a time
+
+    Returns:
+        Tuple[Tuple[Tuple[int, ...], ...], ...]: Permuted bits of each byte value, indexed [transform][byte][value]
+    """
+    return tuple(
+        tuple(
+            tuple(
+                sum(
+                    1 << permutation[byte * 8 + bit]
+                    for bit in range(8)
+                    if value >> bit & 1
+                )
+                for value in range(256)
+            )
+            for byte in range(BOARD_SIZE // 8)
+        )
+        for permutation in PERMUTATIONS
+    )
+
+
+# Permuted bits of each byte value, indexed [transform][byte][value]
+_BYTE_TABLES: Tuple[Tuple[Tuple[int, ...], ...], ...] = _create_byte_tables()
+
+
+def transform_index(index: int, transform: int) -> int:
+    """
+    Moves a point through a transform
+
+    Args:
+        index (int): Index of the point
+        transform (int): Transform to apply
+
+    Returns:
+        int: Index of the point it is moved to
+    """
+    return PERMUTATIONS[transform][index]
+
+
+def transform_mask(mask: int, transform: int) -> int:
+    """
+    Moves every point of a mask through a transform
+
+    Args:
+        mask (int): Bitmask of points
+        transform (int): Transform to apply
+
+    Returns:
+        int: Bitmask of the points they are moved to
+    """
+    tables = _BYTE_TABLES[transform]
+    return tables[0][mask & 0xFF] | tables[1][mask >> 8 & 0xFF] | tables[2][mask >> 16]
+
+
+def transform_move(move: Move, transform: int) -> Move:
+    """
+    Moves every point of a move through a transform, taking a move in a position to the same move in the transformed position
+
+    Args:
+        move (Move): Move to transform
+        transform (int): Transform to apply
+
+    Returns:
+        Move: Transformed move
+    """
+    permutation = PERMUTATIONS[transform]
+    return Move(
+        None if move.origin is None else permutation[move.origin],
+        None if move.destination is None else permutation[move.destination],
+        None if move.remove is None else permutation[move.remove],
+    )
+
+
+def untransform_move(move: Move, transform: int) -> Move:
+    """
+    Undoes a transform on a move, taking a move found in a canonical position back to the position it was canonicalised from
+
+    Args:
+        move (Move): Move in the transformed position
+        transform (int): Transform that was applied
+
+    Returns:
+        Move: Move in the original position
+    """
+    return transform_move(move, INVERSE_TRANSFORMS[transform])
+
+
+def canonicalise_masks(green_mask: int, blue_mask: int) -> Tuple[int, int, int]:
+    """
+    Finds the transform giving the smallest piece masks, green compared first. Symmetric boards have the same canonical masks
+
+    Args:
+        green_mask (int): Bitmask of green pieces
+        blue_mask (int): Bitmask of blue pieces
+
+    Returns:
+        Tuple[int, int, int]: Canonical green mask, canonical blue mask and the transform taking the board to them
+    """
+    best_key: int = green_mask << _MASK_BITS | blue_mask
+    best_transform: int = IDENTITY
+
+    for transform in range(1, SYMMETRY_COUNT):
+        tables = _BYTE_TABLES[transform]
+        key: int = (
+            tables[0][green_mask & 0xFF]
+            | tables[1][green_mask >> 8 & 0xFF]
+            | tables[2][green_mask >> 16]
+        ) << _MASK_BITS | (
+            tables[0][blue_mask & 0xFF]
+            | tables[1][blue_mask >> 8 & 0xFF]
+            | tables[2][blue_mask >> 16]
+        )
+        if key < best_key:
+            best_key = key
+            best_transform = transform
+
+    return (
+        best_key >> _MASK_BITS,
+        best_key & ((1 << _MASK_BITS) - 1),
+        best_transform,
+    )
+
+
+def get_canonical_key(game_state: GameState) -> Tuple[int, int]:
+    """
+    Gets a key that is the same for a game state and every symmetric game state. The key is exact, different positions never share one
+
+    Args:
+        game_state (GameState): Game state to canonicalise
+
+    Returns:
+        Tuple[int, int]: Canonical key and the transform taking the game state to its canonical form
+    """
+    bitboard = game_state.get_bitboard()
+    green_mask, blue_mask, transform = canonicalise_masks(
+        bitboard.get_green_mask(), bitboard.get_blue_mask()
+    )
+
+    key: int = game_state.get_pieces_in_hand(True)
+    key = key << _HAND_BITS | game_state.get_pieces_in_hand(False)
+    key = key << 1 | bitboard.get_is_green_to_move()
+    key = key << 1 | game_state.is_pending_remove()
+    key = key << _MASK_BITS | green_mask
+    key = key << _MASK_BITS | blue_mask
+    return key, transform
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING, Tuple
+
+import CONSTANTS
+from engine.bitboard import iter_indexes
+from engine.board_layout import BOARD_SIZE
+
+if TYPE_CHECKING:
+    from engine.game_state import GameState
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+# Fixed seed so hashes are the same in every process and every run
+_random = random.Random(0x9E3779B97F4A7C15)
+
+# Keys for a piece of each colour at each position, indexed [is_green][index]
+PIECE_KEYS: Tuple[Tuple[int, ...], Tuple[int, ...]] = (
+    tuple(_random.getrandbits(64) for _ in range(BOARD_SIZE)),
+    tuple(_random.getrandbits(64) for _ in range(BOARD_SIZE)),
+)
+
+# Keys for the pieces left in each player's hand, indexed [is_green][pieces_in_hand]
+HAND_KEYS: Tuple[Tuple[int, ...], Tuple[int, ...]] = (
+    tuple(_random.getrandbits(64) for _ in range(CONSTANTS.PIECES_PER_PLAYER + 1)),
+    tuple(_random.getrandbits(64) for _ in range(CONSTANTS.PIECES_PER_PLAYER + 1)),
+)
+
+# Key toggled when blue is to move
+BLUE_TO_MOVE_KEY: int = _random.getrandbits(64)
+
+# Key toggled while the side to move has to remove a piece
+PENDING_REMOVE_KEY: int = _random.getrandbits(64)
+
+
+def compute_hash(game_state: GameState) -> int:
+    """
+    Computes the hash of a game state from scratch. Game states keep their hash up to date incrementally, this is for checking and for new positions
+
+    Args:
+        game_state (GameState): Game state to hash
+
+    Returns:
+        int: 64 bit Zobrist hash
+    """
+    bitboard = game_state.get_bitboard()
+    hash_value: int = 0
+
+    for is_green in (False, True):
+        for index in iter_indexes(bitboard.get_colour_mask(is_green)):
+            hash_value ^= PIECE_KEYS[is_green][index]
+        hash_value ^= HAND_KEYS[is_green][game_state.get_pieces_in_hand(is_green)]
+
+    if not bitboard.get_is_green_to_move():
+        hash_value ^= BLUE_TO_MOVE_KEY
+    if game_state.is_pending_remove():
+        hash_value ^= PENDING_REMOVE_KEY
+    return hash_value
@@ -7,38 +7,46 @@ from typing import List, Tuple
 import pygame
 import pygame_widgets
 from pygame.event import Event
-from pygame.time import Clock
 
 import CONSTANTS
 from actions.action_controller import ActionController
 from board_model.board import Board
 from board_model.game_over_controller import GameOverController
 from board_model.position import Position
-from players.computer import Computer
+from ai.strategy import Strategy
+from players.computer import Computer, create_strategy
 from players.human import Human
 from players.player import Player
+from screens.animation_handler import AnimationHandler
 from screens.display import Display
+from screens.game_loop_scheduler import GameLoopScheduler
 
 __author__ = "Snekith, Patrick and Ashwin"
 __date__ = "17/06/2023"
 
 
 class GameManager:
-    def __init__(self) -> None:
+    def __init__(self, is_running: bool = True) -> None:
         """
         Initialises GameManager Class
+
+        Args:
+            is_running (bool, optional): True to open the menu and run the game loop, False to only create the game, such as for benchmarks. Defaults to True.
         """
         self._is_vs_computer = False
+        # created by the first game against the computer and kept for every game after
+        self._computer_strategy: Strategy | None = None
+        self._computer: Computer | None = None
         self._board = Board(self)
         self._action_controller = ActionController(self)
         self._display = Display(self)
         self._game_over_controller = GameOverController(
             self, self._board, self._display
         )
-        self._ai_move_time = None
 
-        self._display.go_to_menu()
-        self._render_game()
+        if is_running:
+            self._display.go_to_menu()
+            self._render_game()
 
     def initialise_game(self) -> None:
         """
@@ -51,29 +59,37 @@ class GameManager:
 
         self._game_over_controller.hide_restart_button()
 
+        # the computer of the last game may still be searching with the strategy
+        if self._computer is not None:
+            self._computer.stop_search()
+            self._computer = None
+
         self._board.reset()  # Reset board
-        self.player1 = Human(self, "Player 1")
+        self.player1 = Human(self, "Player 1", True)
         self.current_player: Player = self.player1
 
         # Handle conditional whether it is a computer or not
         if not self._is_vs_computer:
-            self.player2 = Human(self, "Player 2")
+            self.player2 = Human(self, "Player 2", False)
         else:
-            self.player2 = Computer(self, "CPU")
+            if self._computer_strategy is None:
+                self._computer_strategy = create_strategy()
+            self._computer = Computer(self, "CPU", False, self._computer_strategy)
+            self.player2 = self._computer
         self._action_controller.reset()
 
-    def toggle_move(self) -> bool:
+    def update_current_player(self) -> bool:
         """
-        Toggles the move of the players.
+        Updates the current player.
 
-        This function switches the turn of the players by flipping a boolean flag. It returns the updated flag value.
+        This function hands the turn to the player the rules engine has to move, which is the same player after forming a mill. It returns the updated flag value.
 
         Returns:
            bool: True if it is player 1's turn, False otherwise.
         """
-        self.current_player = (
-            self.player1 if self.current_player == self.player2 else self.player2
-        )
+        is_player1_turn: bool = self.get_is_player1_turn()
+        self.current_player = self.player1 if is_player1_turn else self.player2
+        return is_player1_turn
 
     def get_is_player1_turn(self) -> bool:
         """
@@ -85,7 +101,7 @@ class GameManager:
             bool: True if it is player 1's turn, False otherwise.
         """
 
-        return self.current_player == self.player1
+        return self._board.get_bitboard().get_is_green_to_move()
 
     def get_green_token_count(self) -> int:
         """
@@ -127,32 +143,6 @@ class GameManager:
 
         return self.player2.get_pieces_on_board()
 
-    def decrement_token_count(self) -> None:
-        """
-        Decrement current player token count
-        """
-        self.current_player.decrement_piece_count()
-
-    def increment_token_board(self) -> None:
-        """
-        Increments current player piece on board
-        """
-        self.current_player.increment_piece_on_board()
-
-    def decrement_green_board(self) -> None:
-        """
-        Decrement green piece on board
-        """
-
-        return self.player1.decrement_piece_on_board()
-
-    def decrement_blue_board(self) -> None:
-        """
-        Decrement blue piece on board
-        """
-
-        return self.player2.decrement_piece_on_board()
-
     def get_board(self) -> Board:
         """
         Gets Board instance
@@ -303,43 +293,57 @@ class GameManager:
 
         This function handles the main game loop and renders the game on the screen.
         It checks for user input events and updates the screen accordingly.
-        It also limits the frame rate to 60 FPS using a clock object.
+        The game is updated in fixed timesteps for the real time passed, so animations and the computer run at the same speed at any frame rate,
+        and the frame rate is limited to CONSTANTS.FPS by a scheduler kept for the whole loop.
+        The computer chooses its moves on a background thread, so the window keeps responding while it thinks.
         It uses pygame_widgets to create and update widgets on the screen.
+        Only the areas of the screen drawn on are copied to the window, unless CONSTANTS.DIRTY_RECT_UPDATES is False or the whole screen changed.
+        While nothing is animating, the computer is not to move and no widget is hovered, it sleeps until an event arrives instead of drawing every frame.
         """
 
         running = True
         is_game_over = False
+        scheduler = GameLoopScheduler()
+        animation_handler: AnimationHandler = (
+            self._display.get_token_renderer().get_animation_handler()
+        )
 
         while running:
-            clock: Clock = Clock()
-
-            # Poll for events
+            # Poll for events, waiting for one if nothing on the screen is changing
             # pygame.QUIT event means the user clicked X to close your window
-            events: List[Event] = pygame.event.get()
+            is_idle: bool = self._is_idle(is_game_over)
+            events: List[Event] = self._display.get_events(is_idle)
+            if is_idle:
+                # time spent waiting is not game time
+                scheduler.skip_time()
+
             if pygame.QUIT in [event.type for event in events]:
                 running = False
                 continue
 
-            if not is_game_over:
-                if self.is_ai_turn():
+            # the window was drawn over, so only part of it is up to date
+            if any(
+                event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+                for event in events
+            ):
+                self._display.set_full_update()
+
+            if not is_game_over and not self.is_ai_turn():
+                for event in events:
+                    if (
+                        event.type == pygame.MOUSEBUTTONDOWN
+                    ):  # don't respond to clicks if the game is over
+                        self.check_click(pygame.mouse.get_pos())
+
+            # Update the game for the time passed, skipping frames under load
+            for _ in range(scheduler.get_updates()):
+                animation_handler.tick(scheduler.get_timestep())
+
+                if not is_game_over and self.is_ai_turn():
                     ai_player: Computer = self.get_current_player()
-                    ai_player.set_move_time()
 
                     if ai_player.is_time_to_move():
-                        self._action_controller.handle_ai_action(
-                            self.get_current_player()
-                        )
-
-                else:
-                    for event in events:
-                        if (
-                            event.type == pygame.MOUSEBUTTONDOWN
-                        ):  # don't respond to clicks if the game is over
-                            self.check_click(pygame.mouse.get_pos())
-
-            # check if mills exist
-            if self._board.get_mill_manager().get_new_mill():
-                self._action_controller.initiate_remove()
+                        self._action_controller.handle_ai_action(ai_player)
 
             # Fill the screen with a color to wipe away anything from last frame
             self._display.clear_screen()
@@ -351,9 +355,32 @@ class GameManager:
             is_game_over: bool = self._game_over_controller.is_game_over()
 
             pygame_widgets.update(events)
-            pygame.display.flip()
+            self._display.update_screen()
 
             # Limits FPS
-            clock.tick(CONSTANTS.FPS)
+            scheduler.tick()
 
+        if self._computer is not None:
+            self._computer.stop_search()
+        if self._computer_strategy is not None:
+            self._computer_strategy.close()
         pygame.quit()
+
+    def _is_idle(self, is_game_over: bool) -> bool:
+        """
+        Checks if the screen only changes in response to events, so the game loop can wait for one
+
+        Args:
+            is_game_over (bool): True if the game is over, so the computer does not move
+
+        Returns:
+            bool: True if nothing is animating, the computer is not to move and no widget is hovered
+        """
+        return (
+            CONSTANTS.IDLE_RENDERING
+            and not self._display.get_token_renderer()
+            .get_animation_handler()
+            .is_animating()
+            and (is_game_over or not self.is_ai_turn())
+            and not self._display.is_hovering_widget()
+        )
@@ -0,0 +1,31 @@
+"""
+Run this file to generate the endgame tablebase the computer player uses once every piece is placed. Run it from the project directory so the files are written where the game reads them.
+At the default of 7 pieces it takes about a quarter of an hour, printing each shard as it starts and finishes.
+"""
+
+import argparse
+
+import CONSTANTS
+from ai.tablebase_generator import TablebaseGenerator
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Generate the movement and flying endgame tablebase"
+    )
+    parser.add_argument(
+        "--max-pieces",
+        type=int,
+        default=CONSTANTS.TABLEBASE_MAX_PIECES,
+        help="most pieces on the board, both players together",
+    )
+    parser.add_argument(
+        "--directory",
+        default=CONSTANTS.TABLEBASE_DIRECTORY,
+        help="directory to write the shard files to",
+    )
+    arguments = parser.parse_args()
+
+    TablebaseGenerator(arguments.directory, arguments.max_pieces, True).generate()
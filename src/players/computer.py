@@ -1,13 +1,22 @@
 from __future__ import annotations
 
-import random
-import time
+import threading
 
+import CONSTANTS
 from actions.fly_action import FlyAction
 from actions.move_action import MoveAction
 from actions.place_action import PlaceAction
 from actions.remove_action import RemoveAction
+from ai.alpha_beta_search import AlphaBetaSearch
+from ai.monte_carlo_tree_search import MonteCarloTreeSearch
+from ai.opening_book import OpeningBook
+from ai.parallel_search import ParallelSearch
+from ai.strategy import Strategy
+from ai.tablebase import Tablebase
+from ai.transposition_table import TranspositionTable
 from board_model.position import Position
+from engine.game_state import GameState
+from engine.move import Move
 from players.player import Player
 
 from typing import TYPE_CHECKING
@@ -19,50 +28,100 @@ __author__ = "Snekith, Patrick and Ashwin"
 __date__ = "17/06/2023"
 
 
+def create_strategy() -> Strategy:
+    """
+    Creates the strategy the computer plays with. It is kept for every game, as it starts worker processes and maps the opening book and endgame tablebase
+
+    Returns:
+        Strategy: Monte Carlo tree search if CONSTANTS.AI_STRATEGY is "monte_carlo", otherwise an alpha-beta search with a transposition table, the opening book and the endgame tablebase, split across CONSTANTS.AI_WORKER_COUNT processes if more than one
+    """
+    if CONSTANTS.AI_STRATEGY == "monte_carlo":
+        return MonteCarloTreeSearch()
+    if CONSTANTS.AI_WORKER_COUNT > 1:
+        return ParallelSearch(tablebase=Tablebase(), opening_book=OpeningBook())
+    return AlphaBetaSearch(
+        transposition_table=TranspositionTable(),
+        tablebase=Tablebase(),
+        opening_book=OpeningBook(),
+    )
+
+
 class Computer(Player):
-    def __init__(self, game_manager: GameManager, name: str) -> None:
+    def __init__(
+        self,
+        game_manager: GameManager,
+        name: str,
+        is_green: bool,
+        strategy: Strategy | None = None,
+    ) -> None:
         """
         Initialising computer class
 
         Args:
             game_manager (GameManager): Player to execute action using gamemanager
+            name (str): Name of player
+            is_green (bool): True if the computer plays the green pieces
+            strategy (Strategy | None, optional): Strategy choosing the moves, shared with the computers of earlier games. Defaults to None for create_strategy.
         """
-        super().__init__(game_manager, name)
-        self._move_time = None
+        super().__init__(game_manager, name, is_green)
+        self._strategy: Strategy = create_strategy() if strategy is None else strategy
+        self._planned_move: Move | None = None
+        self._search_thread: threading.Thread | None = None
+        self._searched_move: Move | None = None
+        self._search_error: Exception | None = None
 
-    def get_random_available_position(self, current_selected_piece=None) -> Position:
+    def get_strategy(self) -> Strategy:
         """
-        Getting random available position
+        Gets the strategy choosing the moves
 
-        Args:
-            current_selected_piece (Piece, optional): Current selected piece. Defaults to None.
+        Returns:
+            Strategy: Strategy
+        """
+        return self._strategy
+
+    def get_planned_move(self) -> Move:
+        """
+        Gets the move being played, waiting for the search to choose one if there is none. A mill and its removal are chosen together and played as two actions
 
         Returns:
-            Position: Randomly selected position
+            Move: Move being played
         """
-        available_positions: list = self.get_positions_from_origin(
-            current_selected_piece
-        )
-        random_position: Position = random.choice(available_positions)
-        return self.game_manager.get_board().get_position_by_index(random_position)
+        if self._planned_move is None:
+            self.start_search()
+            self._search_thread.join()
+            self._finish_search()
+        return self._planned_move
 
-    def get_positions_from_origin(self, origin: Position) -> list:
+    def start_search(self) -> None:
         """
-        Gets positions from origin
+        Starts choosing the next move on a background thread, so the window keeps responding while the computer thinks.
+        Does nothing if a move is planned or already being chosen
+        """
+        if self._planned_move is not None or self._search_thread is not None:
+            return
+        game_state = self.game_manager.get_board().get_game_state().copy()
+        self._search_thread = threading.Thread(
+            target=self._search, args=(game_state,), daemon=True
+        )
+        self._search_thread.start()
 
-        Args:
-            origin (Position): Origin position
+    def is_thinking(self) -> bool:
+        """
+        Checks if the computer is still choosing its next move
 
         Returns:
-            list: List of available positions
+            bool: True if the search is running
         """
-        self.game_manager.get_action_controller().set_current_selected_position(origin)
-        available_positions: list = (
-            self.game_manager.get_action_controller()
-            .get_current_action_handler()
-            .get_available_moves()
-        )
-        return available_positions
+        return self._search_thread is not None and self._search_thread.is_alive()
+
+    def stop_search(self) -> None:
+        """
+        Stops the search and waits for it to return, so it stops taking time from the game loop and its strategy can be used by the computer of the next game
+        """
+        if self._search_thread is not None:
+            self._strategy.set_is_stopped(True)
+            self._search_thread.join()
+            self._strategy.set_is_stopped(False)
 
     def create_place_action(self) -> bool:
         """
@@ -71,84 +130,115 @@ class Computer(Player):
         Returns:
             bool: Returns true if placed successfully
         """
-        position: Position = self.get_random_available_position()
+        move: Move = self.get_planned_move()
+        position: Position = self._get_position(move.destination)
         place_action = PlaceAction(position, self.game_manager)
+        self._finish_first_action(move)
         return place_action.execute()
 
     def create_fly_action(self) -> bool:
         """
         Computer creating a fly action
         """
-        origin: Position = self.get_random_origin()
-        destination: Position = self.get_random_available_position(origin)
-        fly_action = FlyAction(origin, destination, self.game_manager)
+        move: Move = self.get_planned_move()
+        fly_action = FlyAction(
+            self._get_position(move.origin),
+            self._get_position(move.destination),
+            self.game_manager,
+        )
+        self._finish_first_action(move)
         return fly_action.execute()
 
     def create_remove_action(self) -> bool:
         """
         Computer creating a remove action
         """
-        position: Position = self.get_random_available_position()
-        remove_action = RemoveAction(position, self.game_manager)
+        move: Move = self.get_planned_move()
+        remove_action = RemoveAction(self._get_position(move.remove), self.game_manager)
+        self._planned_move = None
         return remove_action.execute()
 
     def create_move_action(self) -> bool:
         """
         Computer creating a move action
         """
-        # set highlighted piece randomly, then get available positions
-        origin: Position = self.get_random_origin()
-        destination: Position = self.get_random_available_position(origin)
-        move_action = MoveAction(origin, destination, self.game_manager)
+        move: Move = self.get_planned_move()
+        move_action = MoveAction(
+            self._get_position(move.origin),
+            self._get_position(move.destination),
+            self.game_manager,
+        )
+        self._finish_first_action(move)
         return move_action.execute()
 
-    def get_random_origin(self) -> Position:
+    def is_time_to_move(self) -> bool:
         """
-        Gets random position
-
-        Raises:
-            Exception: No available moves
+        If time to move, which is once the move has been chosen and the last move has finished animating.
+        The search is started if it has not been, so the computer thinks while the last move animates, unless the last move ended the game
 
         Returns:
-            Position: Position of random origin
+            bool: True if time to move
         """
-        is_green: bool = self.game_manager.get_is_player1_turn()
-        possible_origins: list[
-            Position
-        ] = self.game_manager.get_board().get_positions_from_colour(is_green)
-        random.shuffle(possible_origins)
+        # the game loop only sees the game is over after its updates, so the position may have no moves to search
+        if self.game_manager.get_board().get_game_state().is_game_over():
+            return False
+        self.start_search()
+        if self.is_thinking():
+            return False
+        self._finish_search()
+        return (
+            not self.game_manager.get_display()
+            .get_token_renderer()
+            .get_animation_handler()
+            .is_animating()
+        )
 
-        for origin in possible_origins:
-            available_positions: list = self.get_positions_from_origin(origin)
-            if len(available_positions) > 0:
-                return origin
+    def _search(self, game_state: GameState) -> None:
+        """
+        Chooses a move on the search thread, keeping any error to raise on the game loop's thread
 
-        raise Exception("No available moves. Game should already be over")
+        Args:
+            game_state (GameState): Copy of the game state to search
+        """
+        try:
+            self._searched_move = self._strategy.choose_move(game_state)
+        except Exception as error:
+            self._search_error = error
 
-    def get_move_time(self) -> float | None:
+    def _finish_search(self) -> None:
         """
-        Gets move time
+        Plans the move chosen by the search thread once it has finished
 
-        Returns:
-            float | None: move time or none if no move time
+        Raises:
+            Exception: The search failed
         """
-        return self._move_time
+        if self._search_thread is None:
+            return
+        self._search_thread = None
+        move, self._searched_move = self._searched_move, None
+        error, self._search_error = self._search_error, None
+        if error is not None:
+            raise error
+        self._planned_move = move
 
-    def set_move_time(self) -> None:
+    def _finish_first_action(self, move: Move) -> None:
         """
-        Sets move time
+        Forgets the planned move once it has been played, unless a removal still follows
+
+        Args:
+            move (Move): Planned move
         """
-        if self._move_time is None:
-            self._move_time: float = time.time() + random.random() * 2 + 1
+        if move.remove is None:
+            self._planned_move = None
 
-    def is_time_to_move(self) -> bool:
+    def _get_position(self, index: int) -> Position:
         """
-        If time to move
+        Gets the board position at an index
+
+        Args:
+            index (int): Index of position
 
         Returns:
-            bool: True if time to move
+            Position: Position at index
         """
-        if time.time() >= self._move_time:
-            self._move_time = None
-            return True
-        return False
+        return self.game_manager.get_board().get_position_by_index(index)
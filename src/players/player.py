@@ -13,18 +13,18 @@ __date__ = "17/06/2023"
 
 
 class Player(ABC):
-    def __init__(self, game_manager: GameManager, name: str) -> None:
+    def __init__(self, game_manager: GameManager, name: str, is_green: bool) -> None:
         """
         Initialising player class
 
         Args:
             game_manager (GameManager): Player to execute action using gamemanager
             name (str): Name of player
+            is_green (bool): True if the player plays the green pieces (player 1)
         """
         self.game_manager: GameManager = game_manager
         self.name: str = name
-        self.pieces = 9
-        self.pieces_on_board = 0
+        self.is_green: bool = is_green
 
     def get_name(self) -> str:
         """
@@ -35,6 +35,15 @@ class Player(ABC):
         """
         return self.name
 
+    def get_is_green(self) -> bool:
+        """
+        Gets boolean if player plays green
+
+        Returns:
+            bool: True if green (player 1)
+        """
+        return self.is_green
+
     def get_pieces_left(self) -> int:
         """
         Get pieces left to place
@@ -42,7 +51,11 @@ class Player(ABC):
         Returns:
             int: Pieces left to place
         """
-        return self.pieces
+        return (
+            self.game_manager.get_board()
+            .get_game_state()
+            .get_pieces_in_hand(self.is_green)
+        )
 
     def get_pieces_on_board(self) -> int:
         """
@@ -51,25 +64,9 @@ class Player(ABC):
         Returns:
             int: Pieces on board for player
         """
-        return self.pieces_on_board
-
-    def decrement_piece_count(self) -> None:
-        """
-        Decrements piece count: When player places a piece
-        """
-        self.pieces -= 1
-
-    def decrement_piece_on_board(self) -> None:
-        """
-        Decrements piece count on board
-        """
-        self.pieces_on_board -= 1
-
-    def increment_piece_on_board(self) -> None:
-        """
-        Increments piece count on board
-        """
-        self.pieces_on_board += 1
+        return (
+            self.game_manager.get_board().get_game_state().count_pieces(self.is_green)
+        )
 
     @abstractmethod
     def create_place_action() -> bool:
@@ -0,0 +1,99 @@
+"""
+Run this file to time the board model, action handlers, computer and renderer in fixed positions with no window or sound. The results are written as JSON,
+and compared against the results of an earlier run if given, failing if any benchmark is slower than the threshold allows.
+"""
+
+import os
+
+# draws to an offscreen window and plays no sound, set before pygame starts
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import sys
+from typing import List
+
+import CONSTANTS
+from benchmarks.benchmark import (
+    BenchmarkResult,
+    Comparison,
+    compare_results,
+    load_results,
+    results_to_dict,
+    time_benchmark,
+)
+from benchmarks.scenarios import create_benchmarks
+from game_manager import GameManager
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Time the game in fixed positions and compare against a baseline"
+    )
+    parser.add_argument(
+        "--output",
+        default="benchmarks.json",
+        help="file to write the results to as JSON",
+    )
+    parser.add_argument(
+        "--baseline", help="results of an earlier run to compare against"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=CONSTANTS.BENCHMARK_REGRESSION_THRESHOLD,
+        help="fraction slower than the baseline that counts as a regression",
+    )
+    parser.add_argument(
+        "--filter", default="", help="only run benchmarks whose name contains this"
+    )
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=CONSTANTS.BENCHMARK_ROUNDS,
+        help="rounds each benchmark is timed for",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=CONSTANTS.BENCHMARK_SEED,
+        help="seed of the random games the positions come from",
+    )
+    arguments = parser.parse_args()
+
+    game_manager = GameManager(is_running=False)
+    game_manager.get_display().get_sound_controller().toggle_mute()
+
+    results: List[BenchmarkResult] = []
+    for benchmark in create_benchmarks(game_manager, arguments.seed):
+        if arguments.filter in benchmark.name:
+            result: BenchmarkResult = time_benchmark(benchmark, arguments.rounds)
+            results.append(result)
+            print(
+                f"{result.name:<60} {result.best * 1e6:12.1f} us "
+                f"(median {result.median * 1e6:.1f} us, {result.calls} calls)"
+            )
+
+    with open(arguments.output, "w") as file:
+        json.dump(results_to_dict(results), file, indent=2)
+
+    if arguments.baseline:
+        comparisons: List[Comparison] = compare_results(
+            results, load_results(arguments.baseline), arguments.threshold
+        )
+        for comparison in comparisons:
+            print(
+                f"{comparison.name:<60} {comparison.ratio:6.2f}x"
+                + ("  REGRESSION" if comparison.is_regression else "")
+            )
+        regression_count: int = sum(
+            comparison.is_regression for comparison in comparisons
+        )
+        print(
+            f"{regression_count} of {len(comparisons)} benchmarks slower than "
+            f"{arguments.threshold:.0%} over the baseline"
+        )
+        sys.exit(1 if regression_count else 0)
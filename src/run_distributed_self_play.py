@@ -0,0 +1,215 @@
+"""
+Run this file to farm self-play games out to worker processes on any number of machines. Start the coordinator on one machine, then workers on each machine pointing at it,
+or give the coordinator --local-workers to run everything on this machine. Results are written in game order as one line of JSON per game.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import time
+from typing import List
+
+import CONSTANTS
+from ai.self_play import STRATEGY_NAMES, create_game_settings
+from ai.self_play_coordinator import (
+    BATCH_SIZE,
+    MAX_ATTEMPTS,
+    Address,
+    Message,
+    SelfPlayCoordinator,
+    create_game_task,
+    run_worker,
+)
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+
+def get_address(arguments: argparse.Namespace) -> Address:
+    """
+    Gets the coordinator address from the command line
+
+    Args:
+        arguments (argparse.Namespace): Parsed arguments
+
+    Returns:
+        Address: Unix socket path if given, otherwise host and port
+    """
+    if arguments.unix_socket:
+        return arguments.unix_socket
+    return arguments.host, arguments.port
+
+
+def start_workers(address: Address, count: int) -> List[multiprocessing.Process]:
+    """
+    Starts worker processes on this machine
+
+    Args:
+        address (Address): Address of the coordinator
+        count (int): Number of workers
+
+    Returns:
+        List[multiprocessing.Process]: Worker processes
+    """
+    workers: List[multiprocessing.Process] = [
+        multiprocessing.Process(target=run_worker, args=(address,))
+        for _ in range(count)
+    ]
+    for worker in workers:
+        worker.start()
+    return workers
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+
+    parser = argparse.ArgumentParser(
+        description="Play games between computer strategies on workers connected over sockets"
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="coordinator host")
+    parser.add_argument("--port", type=int, default=5555, help="coordinator port")
+    parser.add_argument(
+        "--unix-socket", help="path of a Unix socket to use instead of TCP"
+    )
+    subparsers = parser.add_subparsers(dest="role", required=True)
+
+    coordinator_parser = subparsers.add_parser(
+        "coordinator", help="hand out games and collect the results"
+    )
+    coordinator_parser.add_argument(
+        "--games", type=int, default=100, help="games to play"
+    )
+    coordinator_parser.add_argument(
+        "--green", choices=STRATEGY_NAMES, default="alpha_beta", help="green strategy"
+    )
+    coordinator_parser.add_argument(
+        "--blue", choices=STRATEGY_NAMES, default="random", help="blue strategy"
+    )
+    coordinator_parser.add_argument(
+        "--swap-colours",
+        action="store_true",
+        help="swap the strategies' colours every other game",
+    )
+    coordinator_parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=CONSTANTS.SELF_PLAY_TIME_BUDGET,
+        help="seconds the search strategies may think per move",
+    )
+    coordinator_parser.add_argument(
+        "--max-plies",
+        type=int,
+        default=CONSTANTS.SELF_PLAY_MAX_PLIES,
+        help="plies a game may last before it counts as a draw",
+    )
+    coordinator_parser.add_argument(
+        "--seed", type=int, default=0, help="seed of the first game, counting up"
+    )
+    coordinator_parser.add_argument(
+        "--record-moves",
+        action="store_true",
+        help="write the encoded moves of every game",
+    )
+    coordinator_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=BATCH_SIZE,
+        help="games handed to a worker at a time",
+    )
+    coordinator_parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=MAX_ATTEMPTS,
+        help="times a game is handed out before it counts as failed",
+    )
+    coordinator_parser.add_argument(
+        "--worker-timeout",
+        type=float,
+        help="seconds a worker may go without a result before its games are handed out again, 0 to wait for it to disconnect, "
+        "defaults to twice the longest a batch of games may take",
+    )
+    coordinator_parser.add_argument(
+        "--local-workers",
+        type=int,
+        default=0,
+        help="workers to start on this machine",
+    )
+    coordinator_parser.add_argument(
+        "--output",
+        default="self_play.jsonl",
+        help="file to write one JSON line per game to",
+    )
+
+    worker_parser = subparsers.add_parser(
+        "worker", help="play games handed out by a coordinator"
+    )
+    worker_parser.add_argument(
+        "--processes",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="worker processes to start on this machine",
+    )
+    arguments = parser.parse_args()
+
+    if arguments.role == "worker":
+        for worker in start_workers(get_address(arguments), arguments.processes):
+            worker.join()
+    else:
+        tasks: List[Message] = [
+            create_game_task(settings)
+            for settings in create_game_settings(
+                arguments.games,
+                arguments.green,
+                arguments.blue,
+                arguments.swap_colours,
+                arguments.time_budget,
+                arguments.max_plies,
+                arguments.seed,
+                arguments.record_moves,
+            )
+        ]
+        coordinator = SelfPlayCoordinator(
+            tasks,
+            get_address(arguments),
+            arguments.batch_size,
+            arguments.max_attempts,
+            arguments.worker_timeout,
+        )
+        address: Address = coordinator.start()
+        print(
+            f"coordinator listening on {address}, "
+            f"workers time out after {coordinator.get_worker_timeout()}s"
+        )
+        workers = start_workers(address, arguments.local_workers)
+        start_time: float = time.perf_counter()
+
+        with open(arguments.output, "w") as file:
+
+            def write_result(_: int, result: Message | None) -> None:
+                """
+                Writes the result of a game, failed games are skipped
+
+                Args:
+                    _ (int): Index of the game
+                    result (Message | None): Game record, None if the game failed
+                """
+                if result is not None:
+                    file.write(json.dumps(result, separators=(",", ":")) + "\n")
+                    file.flush()
+
+            coordinator.run(write_result)
+
+        coordinator.close()
+        for worker in workers:
+            # every game is in, so a worker still running is stuck and its games were handed out again
+            worker.join(1.0)
+            if worker.is_alive():
+                worker.kill()
+                worker.join()
+        print(
+            f"{arguments.games} games in {time.perf_counter() - start_time:.1f}s, "
+            f"{coordinator.get_steal_count()} steals, "
+            f"{coordinator.get_retry_count()} retries, "
+            f"{coordinator.get_failed_count()} failed"
+        )
@@ -0,0 +1,85 @@
+"""
+Run this file to count the leaf nodes of the game tree to a depth from the start or any position. The counts check a new move generator against the current one,
+--divide shows the counts under each move to find where two generators disagree, and the nodes per second is a benchmark to compare between releases.
+"""
+
+import argparse
+import json
+from typing import List, Tuple
+
+from engine.game_state import GameState
+from engine.move import Move, decode_move, encode_move
+from engine.move_generator import generate_moves
+from engine.perft import (
+    START_POSITION,
+    MoveGenerator,
+    PerftResult,
+    divide,
+    format_position,
+    generate_actions,
+    parse_position,
+    time_perft,
+)
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Count the leaf nodes of the game tree to a depth"
+    )
+    parser.add_argument("--depth", type=int, default=4, help="plies to count to")
+    parser.add_argument(
+        "--position",
+        default=START_POSITION,
+        help='position to count from, such as "G..B.................... g 8/8 -"',
+    )
+    parser.add_argument(
+        "--moves",
+        default="",
+        help="comma separated encoded moves to make from the position first",
+    )
+    parser.add_argument(
+        "--divide", action="store_true", help="show the leaf nodes under each move"
+    )
+    parser.add_argument(
+        "--compound",
+        action="store_true",
+        help="count a mill and its removal as one ply instead of two",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="write the result as one line of JSON"
+    )
+    arguments = parser.parse_args()
+
+    game_state: GameState = parse_position(arguments.position)
+    for encoded_move in filter(None, arguments.moves.split(",")):
+        game_state.make_move(decode_move(int(encoded_move)))
+    move_generator: MoveGenerator = (
+        generate_moves if arguments.compound else generate_actions
+    )
+
+    if arguments.divide:
+        counts: List[Tuple[Move, int]] = divide(
+            game_state, max(1, arguments.depth), move_generator
+        )
+        for move, count in counts:
+            print(f"{encode_move(move)} {move}: {count}")
+        print(f"{len(counts)} moves")
+
+    result: PerftResult = time_perft(game_state, arguments.depth, move_generator)
+    if arguments.json:
+        print(
+            json.dumps(
+                {
+                    "position": format_position(game_state),
+                    "mode": "compound" if arguments.compound else "actions",
+                    **result._asdict(),
+                }
+            )
+        )
+    else:
+        print(
+            f"perft({result.depth}) = {result.nodes} in {result.seconds:.3f}s, "
+            f"{result.nodes_per_second:,.0f} nodes per second"
+        )
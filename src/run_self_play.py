@@ -0,0 +1,119 @@
+"""
+Run this file to play many games between computer strategies with no window, sound or animation. Each result is written to the output file as one line of JSON as soon as its game finishes.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import time
+from typing import Dict, List
+
+import CONSTANTS
+from ai.self_play import (
+    STRATEGY_NAMES,
+    GameSettings,
+    create_game_settings,
+    play_game,
+    record_to_dict,
+)
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+
+    parser = argparse.ArgumentParser(
+        description="Play games between computer strategies without the game window"
+    )
+    parser.add_argument("--games", type=int, default=100, help="games to play")
+    parser.add_argument(
+        "--green", choices=STRATEGY_NAMES, default="alpha_beta", help="green strategy"
+    )
+    parser.add_argument(
+        "--blue", choices=STRATEGY_NAMES, default="random", help="blue strategy"
+    )
+    parser.add_argument(
+        "--swap-colours",
+        action="store_true",
+        help="swap the strategies' colours every other game",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=CONSTANTS.SELF_PLAY_TIME_BUDGET,
+        help="seconds the search strategies may think per move",
+    )
+    parser.add_argument(
+        "--max-plies",
+        type=int,
+        default=CONSTANTS.SELF_PLAY_MAX_PLIES,
+        help="plies a game may last before it counts as a draw",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="processes to play games in",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="seed of the first game, counting up"
+    )
+    parser.add_argument(
+        "--record-moves",
+        action="store_true",
+        help="write the encoded moves of every game",
+    )
+    parser.add_argument(
+        "--output",
+        default="self_play.jsonl",
+        help="file to write one JSON line per game to",
+    )
+    arguments = parser.parse_args()
+
+    games: List[GameSettings] = create_game_settings(
+        arguments.games,
+        arguments.green,
+        arguments.blue,
+        arguments.swap_colours,
+        arguments.time_budget,
+        arguments.max_plies,
+        arguments.seed,
+        arguments.record_moves,
+    )
+
+    # wins of each strategy, or of each colour if both play the same strategy, and draws
+    is_same_strategy: bool = arguments.green == arguments.blue
+    results: Dict[str, int] = (
+        {"green": 0, "blue": 0, "draw": 0}
+        if is_same_strategy
+        else {arguments.green: 0, arguments.blue: 0, "draw": 0}
+    )
+    total_plies: int = 0
+    start_time: float = time.perf_counter()
+
+    with open(arguments.output, "w") as file, multiprocessing.Pool(
+        max(1, arguments.processes)
+    ) as pool:
+        for record in pool.imap_unordered(play_game, games):
+            file.write(json.dumps(record_to_dict(record), separators=(",", ":")))
+            file.write("\n")
+            file.flush()
+
+            if record.winner is None:
+                results["draw"] += 1
+            elif is_same_strategy:
+                results["green" if record.winner else "blue"] += 1
+            else:
+                results[
+                    record.settings.green if record.winner else record.settings.blue
+                ] += 1
+            total_plies += record.plies
+
+    elapsed_time: float = time.perf_counter() - start_time
+    print(
+        ", ".join(f"{name}: {count}" for name, count in results.items())
+        + f" in {arguments.games} games, {total_plies / max(1, arguments.games):.1f} "
+        f"plies per game, {arguments.games / elapsed_time:.2f} games per second"
+    )
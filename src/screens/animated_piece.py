@@ -30,7 +30,7 @@ class AnimatedPiece(RenderableToken):
             end_radius (): End radius
             destination_piece_index (int): Destination piece index
             is_green (bool): True if green
-            duration (): Duration
+            duration (): Duration in seconds
         """
         # animation attributes
         self._start_position: list[int, int] = (start_x, start_y)
@@ -46,13 +46,16 @@ class AnimatedPiece(RenderableToken):
 
         self._duration = duration
 
-        self._frames_passed = 0
+        self._time_passed: float = 0
 
-    def tick(self) -> None:
+    def tick(self, seconds: float = 1 / CONSTANTS.UPDATE_RATE) -> None:
         """
         Updates the animation
+
+        Args:
+            seconds (float, optional): Seconds passed since the last update. Defaults to 1 / CONSTANTS.UPDATE_RATE.
         """
-        self._frames_passed += 1
+        self._time_passed += seconds
         progress = self.get_progress()
 
         location_difference_x = self._end_position[0] - self._start_position[0]
@@ -157,4 +160,6 @@ class AnimatedPiece(RenderableToken):
         Returns:
             int: Progress
         """
-        return min(self._frames_passed / (self._duration * CONSTANTS.FPS), 1)
+        if self._duration <= 0:
+            return 1
+        return min(self._time_passed / self._duration, 1)
@@ -16,12 +16,16 @@ class AnimationHandler:
         self._current_animations: list[AnimatedPiece] = []
         self._board: Board = board
 
-    def tick(self) -> None:
+    def tick(self, seconds: float = 1 / CONSTANTS.UPDATE_RATE) -> None:
         """
         Updates the animation
+
+        Args:
+            seconds (float, optional): Seconds passed since the last update. Defaults to 1 / CONSTANTS.UPDATE_RATE.
         """
-        for animation in self._current_animations:
-            is_completed: bool = animation.tick()
+        # copied as finished animations are removed while looping
+        for animation in list(self._current_animations):
+            is_completed: bool = animation.tick(seconds)
             if is_completed:
                 self.terminate_animation(animation)
 
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Tuple
+
+import pygame
+import pygame_menu
+from pygame import Surface
+from pygame_menu import BaseImage
+
+import CONSTANTS
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+
+class AssetCache:
+    def __init__(self, max_size: int = CONSTANTS.ASSET_CACHE_SIZE) -> None:
+        """
+        Initialises the asset cache. Images and fonts are loaded from disk once and kept by path, size and format, forgetting the least recently used past max_size
+
+        Args:
+            max_size (int, optional): Most assets kept. Defaults to CONSTANTS.ASSET_CACHE_SIZE.
+        """
+        self._max_size: int = max(1, max_size)
+        self._assets: OrderedDict[Hashable, Any] = OrderedDict()
+        self._hit_count: int = 0
+        self._miss_count: int = 0
+
+    def get_image(
+        self,
+        image_path: str,
+        size: Tuple[int, int] | None = None,
+        is_alpha: bool = True,
+    ) -> Surface:
+        """
+        Gets an image scaled to a size and converted to the pixel format of the screen. The surface is shared, so it must not be drawn on
+
+        Args:
+            image_path (str): Path to the image file (use absolute path from root directory)
+            size (Tuple[int, int] | None, optional): Width and height to smoothscale to. Defaults to None for the size of the file.
+            is_alpha (bool, optional): True to keep transparency, False for an opaque image that blits faster. Defaults to True.
+
+        Returns:
+            Surface: Image
+        """
+        return self._get_asset(
+            ("image", image_path, size, is_alpha),
+            lambda: self._load_image(image_path, size, is_alpha),
+        )
+
+    def get_font(self, font_path: str, size: int) -> pygame.font.Font:
+        """
+        Gets a font
+
+        Args:
+            font_path (str): Path to the TTF file (use absolute path from root directory)
+            size (int): Font size
+
+        Returns:
+            pygame.font.Font: Font
+        """
+        return self._get_asset(
+            ("font", font_path, size), lambda: pygame.font.Font(font_path, size)
+        )
+
+    def get_base_image(
+        self,
+        image_path: str,
+        drawing_mode: int = pygame_menu.baseimage.IMAGE_MODE_FILL,
+    ) -> BaseImage:
+        """
+        Gets a menu image. Menus scale and crop their images, so each call gets its own copy of the image loaded once
+
+        Args:
+            image_path (str): Path to the image file (use absolute path from root directory)
+            drawing_mode (int, optional): How the image fills the space it is drawn in. Defaults to pygame_menu.baseimage.IMAGE_MODE_FILL.
+
+        Returns:
+            BaseImage: Copy of the image
+        """
+        return self._get_asset(
+            ("base_image", image_path, drawing_mode),
+            lambda: pygame_menu.baseimage.BaseImage(
+                image_path=image_path, drawing_mode=drawing_mode
+            ),
+        ).copy()
+
+    def get_size(self) -> int:
+        """
+        Gets the number of assets kept
+
+        Returns:
+            int: Number of assets
+        """
+        return len(self._assets)
+
+    def get_hit_count(self) -> int:
+        """
+        Gets the number of assets found in the cache
+
+        Returns:
+            int: Number of hits
+        """
+        return self._hit_count
+
+    def get_miss_count(self) -> int:
+        """
+        Gets the number of assets loaded from disk
+
+        Returns:
+            int: Number of misses
+        """
+        return self._miss_count
+
+    def clear(self) -> None:
+        """
+        Forgets every asset, such as after the screen changes pixel format
+        """
+        self._assets.clear()
+
+    def _get_asset(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        """
+        Gets an asset, loading it on a miss and forgetting the least recently used asset if full
+
+        Args:
+            key (Hashable): Key of the asset
+            load (Callable[[], Any]): Function loading the asset
+
+        Returns:
+            Any: Asset
+        """
+        asset: Any = self._assets.get(key)
+        if asset is not None:
+            self._hit_count += 1
+            self._assets.move_to_end(key)
+            return asset
+
+        self._miss_count += 1
+        asset = load()
+        self._assets[key] = asset
+        if len(self._assets) > self._max_size:
+            self._assets.popitem(last=False)
+        return asset
+
+    def _load_image(
+        self, image_path: str, size: Tuple[int, int] | None, is_alpha: bool
+    ) -> Surface:
+        """
+        Loads an image from disk, scales it and converts it to the pixel format of the screen if there is one
+
+        Args:
+            image_path (str): Path to the image file
+            size (Tuple[int, int] | None): Width and height to smoothscale to, None for the size of the file
+            is_alpha (bool): True to keep transparency
+
+        Returns:
+            Surface: Image
+        """
+        image: Surface = pygame.image.load(image_path)
+        if size is not None:
+            image = pygame.transform.smoothscale(image, size)
+        if pygame.display.get_surface() is None:
+            return image
+        return image.convert_alpha() if is_alpha else image.convert()
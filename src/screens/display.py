@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Tuple
+from typing import TYPE_CHECKING, Any, List, Tuple
 
 import pygame
 from pygame import Rect, Surface
+from pygame.event import Event
 from pygame_widgets.button import Button
+from pygame_widgets.widget import WidgetHandler
 from screens.outline import Outline
 
 import CONSTANTS
 from actions.move_type import MoveType
+from screens.asset_cache import AssetCache
 from screens.sound_controller import SoundController
 from screens.token_renderer import TokenRenderer
 
@@ -32,8 +35,16 @@ class Display:
 
         pygame.init()
         self._game_manager: GameManager = game_manager
+        self._asset_cache: AssetCache = AssetCache()
         self._token_renderer: TokenRenderer = TokenRenderer(self, self._game_manager)
         self._screen: Surface = pygame.display.set_mode((1280, 720))
+        # surface being drawn on, the screen or the background layer
+        self._canvas: Surface = self._screen
+        self._background: Surface | None = None
+        self._background_key: Tuple[Any, ...] | None = None
+        self._dirty_rects: List[Rect] = []  # areas of the screen drawn on this frame
+        self._last_dirty_rects: List[Rect] = []  # areas drawn on last frame
+        self._is_full_update: bool = True
         self._draw_icons()
         self._sound_controller = SoundController(self)
 
@@ -46,6 +57,15 @@ class Display:
         """
         return self._token_renderer
 
+    def get_asset_cache(self) -> AssetCache:
+        """
+        Gets the cache of the images and fonts drawn
+
+        Returns:
+            AssetCache: Asset cache
+        """
+        return self._asset_cache
+
     def get_screen(self) -> Surface:
         """
         Returns screen attribute
@@ -68,21 +88,18 @@ class Display:
         """
         Draws the board image on the screen.
 
-        This method loads an image from the assets folder and scales it to fit a 400x400 rectangle.
+        This method gets the image from the assets folder scaled to fit a 400x400 rectangle, loading it only the first time.
         It then centers the image on the bottom two-thirds of the screen and blits it on the screen surface.
         """
 
-        # Load an image and get its rectangle
-        image: Surface = pygame.image.load("./assets/svg/nmm.svg")
-        image = pygame.transform.smoothscale(image, (400, 400))
+        # Get the image and its rectangle
+        image: Surface = self._asset_cache.get_image("./assets/svg/nmm.svg", (400, 400))
         rect: Rect = image.get_rect()
 
-        screen: Surface = self.get_screen()
-
-        screen_width, screen_height = screen.get_size()
+        screen_width, screen_height = self.get_screen().get_size()
         rect.center = (screen_width // 2, screen_height // 3 * 2)
 
-        screen.blit(image, rect)
+        self._mark_dirty(self._canvas.blit(image, rect))
 
     def _draw_icon(
         self,
@@ -178,8 +195,10 @@ class Display:
                 0, 0, PROFILE_HEIGHT + BORDER_WIDTH, PROFILE_HEIGHT + BORDER_WIDTH
             )
             profile_pic_rect.center = rect_center
-            pygame.draw.rect(
-                self._screen, (255, 255, 255), profile_pic_rect, 0, border_radius=10
+            self._mark_dirty(
+                pygame.draw.rect(
+                    self._canvas, (255, 255, 255), profile_pic_rect, 0, border_radius=10
+                )
             )
 
         image: Surface = self._create_image(profile_path, PROFILE_HEIGHT)
@@ -188,8 +207,7 @@ class Display:
         rect: Rect = image.get_rect()
         rect.center = rect_center
 
-        screen: Surface = self.get_screen()
-        screen.blit(image, rect)
+        self._mark_dirty(self._canvas.blit(image, rect))
 
     def _draw_profiles(self) -> None:
         """
@@ -213,7 +231,7 @@ class Display:
         screen_width, screen_height = self._screen.get_size()
         OFFSET_FROM_EDGE = 150
         PROFILE_HEIGHT = 100
-        font = pygame.font.Font("./assets/fonts/Acme-Regular.ttf", 16)
+        font = self._asset_cache.get_font("./assets/fonts/Acme-Regular.ttf", 16)
 
         self._draw_text(
             self._game_manager.get_player1().get_name(),
@@ -254,9 +272,11 @@ class Display:
         # Draw white square
         rect = pygame.Rect(0, 0, INDICATOR_WIDTH, INDICATOR_HEIGHT)
         rect.center = (INDICATOR_X, INDICATOR_Y)
-        pygame.draw.rect(self._screen, (238, 238, 249), rect, border_radius=10)
+        self._mark_dirty(
+            pygame.draw.rect(self._canvas, (238, 238, 249), rect, border_radius=10)
+        )
 
-        font = pygame.font.Font("./assets/fonts/Roboto-Regular.ttf", 16)
+        font = self._asset_cache.get_font("./assets/fonts/Roboto-Regular.ttf", 16)
         self._draw_text(
             f"{player_name} TO {move_type.value.upper()}",
             (0, 0, 0),
@@ -276,8 +296,10 @@ class Display:
 
     def draw_line(self, outline: MoveType, start_pos: tuple, end_pos: tuple):
         LINE_THICKNESS = 10
-        pygame.draw.line(
-            self._screen, outline.value, start_pos, end_pos, width=LINE_THICKNESS
+        self._mark_dirty(
+            pygame.draw.line(
+                self._canvas, outline.value, start_pos, end_pos, width=LINE_THICKNESS
+            )
         )
 
     def _draw_text(
@@ -309,7 +331,7 @@ class Display:
 
         # Set the center of the rectangular object.
         text_rect.center = (x, y)
-        self._screen.blit(text_surface, text_rect)
+        self._mark_dirty(self._canvas.blit(text_surface, text_rect))
 
     def draw_token(self, x: int, y: int, radius: int, is_green: bool) -> None:
         """
@@ -325,23 +347,31 @@ class Display:
             outline (str): The colour of the outline of the circle. Defaults to None.
         """
 
-        pygame.draw.circle(
-            self._screen,
-            CONSTANTS.WHITE_TOKEN_COLOUR if is_green else CONSTANTS.BLACK_TOKEN_COLOUR,
-            (x, y),
-            radius,
+        self._mark_dirty(
+            pygame.draw.circle(
+                self._canvas,
+                (
+                    CONSTANTS.WHITE_TOKEN_COLOUR
+                    if is_green
+                    else CONSTANTS.BLACK_TOKEN_COLOUR
+                ),
+                (x, y),
+                radius,
+            )
         )
 
     def draw_outline(self, x, y, radius, outline):
-        pygame.draw.circle(
-            self._screen, outline.value, (x, y), radius, width=int(radius / 2.75)
+        self._mark_dirty(
+            pygame.draw.circle(
+                self._canvas, outline.value, (x, y), radius, width=int(radius / 2.75)
+            )
         )
 
     def _create_image(self, image_path: str, size: int) -> Surface:
         """
         Creates an image surface from a file.
 
-        This function creates an image surface from a file given by the image_path argument. It also resizes the image to the given size using the pygame.transform.smoothscale method.
+        This function gets an image surface of the file given by the image_path argument, resized to the given size using the pygame.transform.smoothscale method. The file is only loaded and resized the first time, so the surface must not be drawn on.
 
         Args:
             image_path (str): The path to the image file.
@@ -351,13 +381,11 @@ class Display:
             Surface: A pygame.Surface object that represents the image.
         """
 
-        image: Surface = pygame.image.load(image_path)
-        image = pygame.transform.smoothscale(image, (size, size))
-        return image
+        return self._asset_cache.get_image(image_path, (size, size))
 
     def draw_screen(self) -> None:
         """
-        Drawing screen
+        Drawing the board, token counters, profiles and turn indicator
         """
 
         self._draw_board()
@@ -383,10 +411,140 @@ class Display:
 
     def clear_screen(self):
         """
-        Clears screen
+        Clears screen by drawing the background layer, which is only redrawn when what it shows has changed
+        """
+        background_key: Tuple[Any, ...] = self._get_background_key()
+        if self._background is None or background_key != self._background_key:
+            self._draw_background()
+            self._background_key = background_key
+            self._is_full_update = True
+
+        if self._is_full_update or not CONSTANTS.DIRTY_RECT_UPDATES:
+            self._screen.blit(self._background, (0, 0))
+        else:
+            # only what was drawn over last frame needs wiping
+            for rect in self._last_dirty_rects:
+                self._screen.blit(self._background, rect, rect)
+
+    def update_screen(self) -> None:
+        """
+        Shows what was drawn this frame in the window. In dirty rectangle mode only the areas drawn on this frame and last frame, and the widgets, are copied,
+        otherwise or after the whole screen changed the whole screen is flipped
+        """
+        if self._is_full_update or not CONSTANTS.DIRTY_RECT_UPDATES:
+            pygame.display.flip()
+        else:
+            pygame.display.update(
+                self._last_dirty_rects + self._dirty_rects + self.get_widget_rects()
+            )
+        self._last_dirty_rects = self._dirty_rects
+        self._dirty_rects = []
+        self._is_full_update = False
+
+    def set_full_update(self) -> None:
+        """
+        Redraws and flips the whole screen next frame, such as after a menu or the window was drawn over
+        """
+        self._is_full_update = True
+
+    def get_dirty_rects(self) -> List[Rect]:
+        """
+        Gets the areas of the screen drawn on this frame
+
+        Returns:
+            List[Rect]: Areas drawn on
         """
-        self.get_screen().fill(CONSTANTS.SCREEN_COLOUR)
-        self.draw_screen()
+        return self._dirty_rects
+
+    def get_widget_rects(self) -> List[Rect]:
+        """
+        Gets the areas of the visible widgets, which are drawn every frame
+
+        Returns:
+            List[Rect]: Areas of the widgets
+        """
+        return [
+            Rect(widget.getX(), widget.getY(), widget.getWidth(), widget.getHeight())
+            for widget in WidgetHandler.getWidgets()
+            if widget.isVisible()
+        ]
+
+    def is_hovering_widget(self) -> bool:
+        """
+        Checks if the mouse is over a visible widget, which may change as the mouse moves
+
+        Returns:
+            bool: True if hovering a widget
+        """
+        x, y = pygame.mouse.get_pos()
+        return any(
+            widget.isVisible() and widget.contains(x, y)
+            for widget in WidgetHandler.getWidgets()
+        )
+
+    def get_events(self, is_idle: bool = False) -> List[Event]:
+        """
+        Gets the events since the last frame. When idle, it sleeps until an event arrives, or CONSTANTS.IDLE_TIMEOUT passes, instead of returning at once
+
+        Args:
+            is_idle (bool, optional): True if the screen only changes in response to events. Defaults to False.
+
+        Returns:
+            List[Event]: Events, empty if none arrived
+        """
+        if not is_idle:
+            return pygame.event.get()
+
+        event: Event = pygame.event.wait(CONSTANTS.IDLE_TIMEOUT)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
+
+    def _mark_dirty(self, rect: Rect) -> Rect:
+        """
+        Remembers an area drawn on, if drawing on the screen rather than the background layer
+
+        Args:
+            rect (Rect): Area drawn on
+
+        Returns:
+            Rect: Area drawn on
+        """
+        if self._canvas is self._screen:
+            self._dirty_rects.append(rect)
+        return rect
+
+    def _get_background_key(self) -> Tuple[Any, ...]:
+        """
+        Gets everything the background layer shows, so it can be redrawn when any of it changes
+
+        Returns:
+            Tuple[Any, ...]: Token counts, turn, move type, player names and whether playing the computer
+        """
+        return (
+            self._game_manager.get_green_token_count(),
+            self._game_manager.get_blue_token_count(),
+            self._game_manager.get_is_player1_turn(),
+            self._game_manager.get_move_type(),
+            self._game_manager.get_mover_name(),
+            self._game_manager.get_player1().get_name(),
+            self._game_manager.get_player2().get_name(),
+            self._game_manager.get_is_vs_computer(),
+        )
+
+    def _draw_background(self) -> None:
+        """
+        Draws the board, profiles, token counters and turn indicator onto the background layer
+        """
+        if self._background is None:
+            self._background = Surface(self._screen.get_size()).convert()
+
+        self._canvas = self._background
+        try:
+            self._background.fill(CONSTANTS.SCREEN_COLOUR)
+            self.draw_screen()
+        finally:
+            self._canvas = self._screen
 
     def _toggle_mute(self):
         """
@@ -411,7 +569,7 @@ class Display:
         self.draw_token(TOKEN_OFFSET, TOKEN_HEIGHT, TOKEN_RADIUS, True)
         self.draw_token(screen_width - TOKEN_OFFSET, TOKEN_HEIGHT, TOKEN_RADIUS, False)
 
-        font = pygame.font.Font("./assets/fonts/Acme-Regular.ttf", 16)
+        font = self._asset_cache.get_font("./assets/fonts/Acme-Regular.ttf", 16)
         self._draw_text(
             f"{green_count} remaining",
             (255, 255, 255),
@@ -437,9 +595,11 @@ class Display:
         screen_width, screen_height = self.get_screen().get_size()
         rect = pygame.Rect(0, 0, 500, 250)
         rect.center = (screen_width // 2, screen_height // 2)
-        pygame.draw.rect(self._screen, CONSTANTS.WHITE, rect, border_radius=10)
+        self._mark_dirty(
+            pygame.draw.rect(self._canvas, CONSTANTS.WHITE, rect, border_radius=10)
+        )
 
-        font = pygame.font.Font("./assets/fonts/Roboto-Regular.ttf", 60)
+        font = self._asset_cache.get_font("./assets/fonts/Roboto-Regular.ttf", 60)
         self._draw_text(
             f"{winner} wins!",
             CONSTANTS.BLACK,
@@ -459,5 +619,6 @@ class Display:
 
         menu = Menu(self)
         is_vs_computer: bool = menu.create_menu()
+        self.set_full_update()
         self._game_manager.set_is_vs_computer(is_vs_computer)
         self._game_manager.initialise_game()
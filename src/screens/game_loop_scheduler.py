@@ -0,0 +1,104 @@
+import time
+
+from pygame.time import Clock
+
+import CONSTANTS
+
+__author__ = "Snekith, Patrick and Ashwin"
+__date__ = "17/06/2023"
+
+
+class GameLoopScheduler:
+    def __init__(
+        self,
+        fps: int = CONSTANTS.FPS,
+        update_rate: int = CONSTANTS.UPDATE_RATE,
+        max_updates: int = CONSTANTS.MAX_UPDATES_PER_FRAME,
+    ) -> None:
+        """
+        Initialises the game loop scheduler. The game is updated in fixed timesteps for the real time passed, however often frames are drawn,
+        and under load the frames in between are skipped rather than the game slowing down
+
+        Args:
+            fps (int, optional): Most frames drawn a second, 0 for no limit. Defaults to CONSTANTS.FPS.
+            update_rate (int, optional): Game updates a second. Defaults to CONSTANTS.UPDATE_RATE.
+            max_updates (int, optional): Most updates caught up on in one frame, time past that is dropped. Defaults to CONSTANTS.MAX_UPDATES_PER_FRAME.
+        """
+        self._clock = Clock()
+        self._fps: int = fps
+        self._timestep: float = 1 / update_rate
+        self._max_updates: int = max(1, max_updates)
+        self._last_time: float = time.perf_counter()
+        self._accumulated_time: float = 0
+        self._update_count: int = 0
+        self._skipped_time: float = 0
+
+    def get_updates(self) -> int:
+        """
+        Gets the number of updates to run this frame for the time passed since the last frame
+
+        Returns:
+            int: Number of updates, 0 if less than a timestep has passed
+        """
+        now: float = time.perf_counter()
+        self._accumulated_time += now - self._last_time
+        self._last_time = now
+
+        max_time: float = self._max_updates * self._timestep
+        if self._accumulated_time > max_time:
+            # too far behind to catch up, so drop the time rather than slow every later frame
+            self._skipped_time += self._accumulated_time - max_time
+            self._accumulated_time = max_time
+
+        updates = int(self._accumulated_time / self._timestep)
+        self._accumulated_time -= updates * self._timestep
+        self._update_count += updates
+        return updates
+
+    def skip_time(self) -> None:
+        """
+        Forgets the time passed since the last frame, such as time spent waiting for events, so it is not played back as updates
+        """
+        self._last_time = time.perf_counter()
+
+    def tick(self) -> None:
+        """
+        Waits until the next frame is due, limiting the frame rate
+        """
+        self._clock.tick(self._fps)
+
+    def get_timestep(self) -> float:
+        """
+        Gets the seconds of game time each update covers
+
+        Returns:
+            float: Timestep
+        """
+        return self._timestep
+
+    def get_update_count(self) -> int:
+        """
+        Gets the number of updates run
+
+        Returns:
+            int: Number of updates
+        """
+        return self._update_count
+
+    def get_skipped_time(self) -> float:
+        """
+        Gets the seconds dropped because frames took too long to catch up on
+
+        Returns:
+            float: Seconds dropped
+        """
+        return self._skipped_time
+
+    def get_fps(self) -> float:
+        """
+        Gets the frames drawn a second, averaged over the last few frames
+
+        Returns:
+            float: Frame rate
+        """
+        return self._clock.get_fps()
@@ -3,8 +3,11 @@ from typing import TYPE_CHECKING, Callable
 
 import pygame
 import pygame_menu
+from pygame.time import Clock
 from pygame_menu import BaseImage
 
+import CONSTANTS
+
 if TYPE_CHECKING:
     from .display import Display
 
@@ -30,6 +33,7 @@ class Menu:
         Creates a menu for the game.
 
         This function creates a menu object using pygame_menu module. It sets the theme, size and title of the menu using the given parameters.
+        Nothing in the menu moves on its own, so it only redraws when an event arrives, at most CONSTANTS.FPS times a second.
 
         Returns:
             bool: True if the vs computer menu item is clicked, False otherwise.
@@ -56,10 +60,12 @@ class Menu:
         )
 
         self._draw_menu_buttons()
+        clock: Clock = Clock()
         while self._menu_active:
-            self._menu.update(pygame.event.get())
+            self._menu.update(self._display.get_events(CONSTANTS.IDLE_RENDERING))
             self._menu.draw(self._display.get_screen())
             pygame.display.update()
+            clock.tick(CONSTANTS.FPS)
 
         return self._is_vs_computer
 
@@ -102,9 +108,8 @@ class Menu:
                 BaseImage: A BaseImage object that can be used as a background or a decoration for widgets.
         """
 
-        return pygame_menu.baseimage.BaseImage(
-            image_path=image_path,
-            drawing_mode=pygame_menu.baseimage.IMAGE_MODE_REPEAT_XY,
+        return self._display.get_asset_cache().get_base_image(
+            image_path, pygame_menu.baseimage.IMAGE_MODE_REPEAT_XY
         )
 
     def _draw_menu_buttons(self) -> None:
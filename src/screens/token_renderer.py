@@ -32,14 +32,12 @@ class TokenRenderer:
 
     def render_token_elements(self, mills: List[List[int]] | None) -> None:
         """
-        Render token elements
+        Render token elements, the animations are updated by the game loop
 
         Args:
             mills (List[List[int]] | None): List of mills
         """
 
-        self._animation_handler.tick()  # update animations
-
         current_selection: Position = (
             self._game_manager._action_controller.get_current_selected_position()
         )